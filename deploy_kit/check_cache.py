@@ -0,0 +1,148 @@
+"""
+check_cache
+-----------
+
+check_* 함수들의 점검 결과를 짧은 시간 동안 재사용하기 위한 TTL 캐시.
+
+같은 실행 안에서 동일한 리소스를 여러 번 점검할 때 gcloud / API 호출을 반복하지 않도록 하고,
+persist=True 로 저장한 결과는 ~/.cache/deploy_kit/checks.json 에도 기록해
+짧은 간격으로 `deploy-gcp check` 를 반복 실행할 때도 재사용한다.
+ensure_* 가 리소스를 변경하면 해당 항목을 invalidate 해야 한다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from .logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+# 점검 결과를 재사용할 시간(초)
+CHECK_CACHE_TTL_SECONDS = 60.0
+
+# 디스크 캐시 파일 ($XDG_CACHE_HOME 이 있으면 그 아래)
+CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "deploy_kit",
+    "checks.json",
+)
+
+# json 으로 직렬화한 key -> (저장 시각(epoch), 결과, 디스크에 기록할지 여부)
+_cache: dict[str, tuple[float, Any, bool]] = {}
+_loaded = False
+_bypass = False
+_lock = threading.Lock()
+
+
+def _encode_key(key: tuple[Hashable, ...]) -> str:
+    return json.dumps(list(key), ensure_ascii=False)
+
+
+def _load_locked() -> None:
+    """디스크 캐시를 한 번만 읽어 온다. (파일이 없거나 깨져 있으면 빈 캐시로 시작)"""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+    now = time.time()
+    for k, entry in data.items() if isinstance(data, dict) else ():
+        if isinstance(entry, list) and len(entry) == 2 and now - entry[0] < CHECK_CACHE_TTL_SECONDS:
+            _cache[k] = (entry[0], entry[1], True)
+
+
+def _save_locked() -> None:
+    """만료되지 않은 persist 항목만 디스크에 원자적으로 기록한다. (실패해도 점검은 계속한다)"""
+    now = time.time()
+    data = {
+        k: [ts, value]
+        for k, (ts, value, persist) in _cache.items()
+        if persist and now - ts < CHECK_CACHE_TTL_SECONDS
+    }
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(CACHE_FILE), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, CACHE_FILE)
+    except OSError as e:
+        logger.debug("점검 캐시를 저장하지 못했습니다: %s", e)
+
+
+def cached_check(
+    key: tuple[Hashable, ...],
+    probe: Callable[[], Any],
+    *,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+    persist: bool = False,
+) -> Any:
+    """
+    key 에 대한 점검 결과가 TTL 이내로 남아 있으면 그대로 반환하고,
+    없으면 probe() 를 실행해 결과를 저장한다. (예외는 캐시하지 않는다)
+
+    persist=True 인 결과는 디스크에도 기록하므로 JSON 으로 저장할 수 있는 값이어야 한다.
+    should_cache 가 False 를 돌려주는 결과(일시적인 조회 실패 등)는 저장하지 않는다.
+    """
+    k = _encode_key(key)
+    with _lock:
+        _load_locked()
+        hit = None if _bypass else _cache.get(k)
+    if hit is not None and time.time() - hit[0] < CHECK_CACHE_TTL_SECONDS:
+        return hit[1]
+
+    result = probe()
+    if should_cache is not None and not should_cache(result):
+        return result
+    with _lock:
+        _cache[k] = (time.time(), result, persist)
+        if persist:
+            _save_locked()
+    return result
+
+
+def invalidate(key: tuple[Hashable, ...]) -> None:
+    """ensure_* 로 리소스가 바뀌었을 때 해당 점검 결과를 버린다."""
+    k = _encode_key(key)
+    with _lock:
+        _load_locked()
+        entry = _cache.pop(k, None)
+        if entry is not None and entry[2]:
+            _save_locked()
+
+
+def invalidate_prefix(prefix: tuple[Hashable, ...]) -> None:
+    """key 가 prefix 로 시작하는 점검 결과를 모두 버린다. (섹션 단위 무효화용)"""
+    n = len(prefix)
+    with _lock:
+        _load_locked()
+        stale = [k for k in _cache if tuple(json.loads(k)[:n]) == tuple(prefix)]
+        for k in stale:
+            del _cache[k]
+        if stale:
+            _save_locked()
+
+
+def set_bypass(bypass: bool) -> None:
+    """True 면 저장된 결과를 읽지 않고 항상 새로 점검한다. (`check --no-cache`)"""
+    global _bypass
+    _bypass = bypass
+
+
+def clear() -> None:
+    """캐시 전체를 비운다. (주로 테스트용)"""
+    global _loaded
+    with _lock:
+        _loaded = True
+        _cache.clear()
+        _save_locked()
@@ -1,13 +1,18 @@
 import os
+import shutil
 import sys
 from typing import Optional
 
 import click
-from dotenv import dotenv_values
 
-from .config import load_env_files, DeployConfig
+from .config import (
+    ENV_FILES_DEFAULT_ORDER,
+    DeployConfig,
+    list_dir_files,
+    load_env_files,
+    read_env_file,
+)
 from .logging_utils import setup_logging, get_logger
-from .orchestrator import ALL_SECTIONS, apply_all, plan_all, check_all
 from .subprocess_utils import configure_cli_progress
 
 
@@ -48,7 +53,21 @@ def main(ctx: click.Context, chdir: str, verbose: int) -> None:
 
 
 def _load_config_from_ctx(ctx: click.Context) -> DeployConfig:
+    # 같은 컨텍스트에서 이미 로드했다면 env 파일을 다시 읽지 않고 재사용한다.
+    cached: Optional[DeployConfig] = ctx.obj.get("cfg")
+    if cached is not None:
+        return cached
+
     base_dir: str = ctx.obj["chdir"]
+    # env 파일이 하나도 없고 필수 값도 환경에 주입되지 않았다면(CI 가 아닌 잘못된 디렉토리),
+    # 파싱/검증/SDK import 까지 가지 않고 바로 실패한다.
+    if "GCP_PROJECT_ID" not in os.environ and not (
+        list_dir_files(base_dir).keys() & set(ENV_FILES_DEFAULT_ORDER)
+    ):
+        raise FileNotFoundError(
+            f"{os.path.abspath(base_dir)} 에 env 파일({', '.join(ENV_FILES_DEFAULT_ORDER)})이 없습니다. "
+            "deploy-gcp init 으로 템플릿을 생성하세요."
+        )
     load_env_files(base_dir)
     cfg = DeployConfig.from_env()
     # subprocess 진행표시(스피너/경과시간) 전역 설정 반영
@@ -59,28 +78,41 @@ def _load_config_from_ctx(ctx: click.Context) -> DeployConfig:
         interval=cfg.cli_progress_interval_seconds,
     )
     logger.debug("Config loaded: %s", cfg)
+    ctx.obj["cfg"] = cfg
     return cfg
 
 
+def _load_config_or_exit(ctx: click.Context) -> DeployConfig:
+    """설정을 로드하고, 실패하면 에러를 출력한 뒤 exit 1 로 종료한다. (plan/deploy/check 공통)"""
+    try:
+        return _load_config_from_ctx(ctx)
+    except Exception as e:  # noqa: BLE001
+        click.echo(f"[ERROR] 설정 로드 실패: {e}", err=True)
+        sys.exit(1)
+
+
 def _build_env_dump(base_dir: str) -> str:
     """
     .env.infra / .env.secrets / .env.services 의 내용을 그대로 덤프한다.
     (주석/빈 줄은 제외)
     """
-    lines: list[str] = []
+    # 디렉토리를 한 번만 읽고, 각 파일은 DirEntry 의 경로/stat 을 그대로 사용한다.
+    present = list_dir_files(base_dir)
+    blocks: list[str] = []
     for filename in (".env.infra", ".env.secrets", ".env.services"):
-        lines.append(f"## {filename}")
-        path_values = dotenv_values(dotenv_path=f"{base_dir}/{filename}")
+        entry = present.get(filename)
+        path_values = read_env_file(entry) if entry is not None else {}
         if not path_values:
-            lines.append("- (파일이 없거나 비어 있습니다)")
+            body = "- (파일이 없거나 비어 있습니다)"
         else:
-            for k, v in sorted(path_values.items()):
-                # None 은 dotenv 에서 값이 없는 키를 의미하므로 스킵
-                if v is None:
-                    continue
-                lines.append(f"- {k}={v}")
-        lines.append("")
-    return "\n".join(lines).rstrip()  # 마지막 공백 줄 제거
+            # 키만 정렬하고 값은 dict 에서 조회한다. (items() 튜플 리스트를 만들지 않음)
+            # None 은 dotenv 에서 값이 없는 키를 의미하므로 스킵
+            body = "\n".join(
+                f"- {k}={path_values[k]}" for k in sorted(path_values) if path_values[k] is not None
+            )
+        blocks.append(f"## {filename}\n{body}" if body else f"## {filename}")
+    # 파일 블록 사이는 빈 줄 하나, 마지막 공백은 제거
+    return "\n\n".join(blocks).rstrip()
 
 
 @main.command()
@@ -91,14 +123,26 @@ def _build_env_dump(base_dir: str) -> str:
     is_flag=True,
     help="infra/secrets/services 에서 설정한 모든 환경설정을 함께 출력합니다.",
 )
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="요약 대신 같은 내용을 JSON 으로 출력합니다. (CI 등에서 jq 로 읽을 때)",
+)
 @click.pass_context
-def plan(ctx: click.Context, show_all: bool) -> None:
+def plan(ctx: click.Context, show_all: bool, as_json: bool) -> None:
     """현재 설정(.env.infra/.env.secrets/.env.services)을 요약 및 섹션별 ENABLED/SKIPPED 상태로 출력"""
-    try:
-        cfg = _load_config_from_ctx(ctx)
-    except Exception as e:  # noqa: BLE001
-        click.echo(f"[ERROR] 설정 로드 실패: {e}", err=True)
+    if as_json and show_all:
+        click.echo("[ERROR] --json 과 -a/--all 은 함께 사용할 수 없습니다.", err=True)
         sys.exit(1)
+    cfg = _load_config_or_exit(ctx)
+
+    # orchestrator 는 google-cloud SDK 들을 함께 import 하므로 실제로 필요한 시점에 로드한다.
+    from .orchestrator import plan_all, plan_json
+
+    if as_json:
+        click.echo(plan_json(cfg))
+        return
 
     report = plan_all(cfg)
 
@@ -122,23 +166,21 @@ def plan(ctx: click.Context, show_all: bool) -> None:
 @click.pass_context
 def deploy(ctx: click.Context, only: str) -> None:
     """리소스를 실제로 생성/업데이트하여 배포"""
-    try:
-        cfg = _load_config_from_ctx(ctx)
-    except Exception as e:  # noqa: BLE001
-        click.echo(f"[ERROR] 설정 로드 실패: {e}", err=True)
-        sys.exit(1)
+    cfg = _load_config_or_exit(ctx)
+
+    from .orchestrator import ALL_SECTIONS_SET, ALL_SECTIONS_STR, apply_all
 
     only_list: Optional[list[str]] = None
     if only.strip():
         only_list = [p.strip() for p in only.split(",") if p.strip()]
 
-        # --only 섹션 이름 검증
-        invalid = sorted({s for s in only_list if s not in ALL_SECTIONS})
+        # --only 섹션 이름 검증 (입력 순서 유지, 중복 제거)
+        invalid = list(dict.fromkeys(s for s in only_list if s not in ALL_SECTIONS_SET))
         if invalid:
             click.echo(
                 "[ERROR] 잘못된 섹션 이름이 있습니다: "
                 + ", ".join(invalid)
-                + f"\n허용되는 섹션: {', '.join(ALL_SECTIONS)}",
+                + f"\n허용되는 섹션: {ALL_SECTIONS_STR}",
                 err=True,
             )
             sys.exit(1)
@@ -157,6 +199,34 @@ def deploy(ctx: click.Context, only: str) -> None:
         sys.exit(1)
 
 
+def _read_small_file(path: str) -> bytes:
+    """작은 파일을 TextIOWrapper 없이 fstat 크기만큼 한 번에 읽는다."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_small_file(path: str, data: bytes) -> None:
+    """작은 파일을 버퍼링 계층 없이 os.write 로 덮어쓴다."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 @main.command()
 @click.pass_context
 def init(ctx: click.Context) -> None:
@@ -164,22 +234,23 @@ def init(ctx: click.Context) -> None:
     현재 디렉토리에 env 템플릿(.env.infra.example, .env.secrets.example, .env.services.example)을 복사하고,
     .env.infra / .env.secrets / .env.services 가 git 에서 무시되도록 .gitignore 를 생성/갱신합니다.
     """
-    import os
     from importlib import resources
 
     base_dir: str = ctx.obj["chdir"]
+    # 템플릿/.gitignore 존재 여부는 디렉토리를 한 번 읽어서 판단한다.
+    present = list_dir_files(base_dir)
 
     # 1) env 템플릿 파일 복사
+    templates = resources.files("deploy_kit.examples")
     for name in ("env.infra.example", "env.secrets.example", "env.services.example"):
         target = os.path.join(base_dir, name)
-        if os.path.exists(target):
+        if name in present:
             click.echo(f"{name} 이(가) 이미 존재하여 건너뜀")
             continue
         try:
-            with resources.files("deploy_kit.examples").joinpath(name).open("r", encoding="utf-8") as src, open(
-                target, "w", encoding="utf-8"
-            ) as dst:
-                dst.write(src.read())
+            # 디코드/인코드 없이 바이트 그대로 복사 (가능하면 OS 의 고속 복사 경로 사용)
+            with resources.as_file(templates.joinpath(name)) as src_path:
+                shutil.copyfile(src_path, target)
             click.echo(f"{name} 템플릿을 생성했습니다.")
         except FileNotFoundError:
             click.echo(f"템플릿 {name} 을(를) 패키지에서 찾을 수 없습니다.", err=True)
@@ -189,18 +260,18 @@ def init(ctx: click.Context) -> None:
     patterns = [".env.infra", ".env.secrets", ".env.services"]
 
     existing_content = ""
-    if os.path.exists(gitignore_path):
+    if ".gitignore" in present:
         try:
-            with open(gitignore_path, "r", encoding="utf-8") as f:
-                existing_content = f.read()
+            existing_content = _read_small_file(gitignore_path).decode("utf-8")
         except OSError:
             # .gitignore 를 읽을 수 없으면 조용히 건너뛰되, init 자체는 성공 처리
             return
 
-    lines = existing_content.splitlines() if existing_content else []
-    missing = [p for p in patterns if p not in lines]
+    existing_lines = set(existing_content.splitlines())
+    missing = [p for p in patterns if p not in existing_lines]
 
-    if not existing_content or missing:
+    # 빈 .gitignore 라면 모든 패턴이 missing 이므로, missing 여부만으로 충분하다.
+    if missing:
         # 중복 없이 패턴을 추가하기 위해 기존 내용 뒤에 블록을 덧붙인다.
         block_lines: list[str] = []
         if existing_content and not existing_content.endswith("\n"):
@@ -209,15 +280,12 @@ def init(ctx: click.Context) -> None:
         block_lines.append("")
         block_lines.append("# deploy-gcp: ignore local env files")
         # 이미 있는 패턴은 제외하고, 없는 패턴만 추가
-        for p in patterns:
-            if p not in lines:
-                block_lines.append(p)
+        block_lines.extend(missing)
 
         new_content = existing_content + "\n".join(block_lines) + "\n"
 
         try:
-            with open(gitignore_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            _write_small_file(gitignore_path, new_content.encode("utf-8"))
             click.echo(
                 "[deploy-gcp] .gitignore 에 .env.infra/.env.secrets/.env.services 무시 규칙을 추가/유지했습니다."
             )
@@ -234,17 +302,24 @@ def init(ctx: click.Context) -> None:
     is_flag=True,
     help="모든 체크 항목의 상세 상태를 출력합니다. (기본은 이슈만 요약)",
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    help="최근(60초 이내) 점검 결과를 재사용하지 않고 모든 항목을 새로 점검합니다.",
+)
 @click.pass_context
-def check(ctx: click.Context, show_all: bool) -> None:
+def check(ctx: click.Context, show_all: bool, no_cache: bool) -> None:
     """
     최종 배포 전에 GCP 리소스/환경설정 상태를 점검한다.
     (실제 리소스 생성/변경은 하지 않는다)
     """
-    try:
-        cfg = _load_config_from_ctx(ctx)
-    except Exception as e:  # noqa: BLE001
-        click.echo(f"[ERROR] 설정 로드 실패: {e}", err=True)
-        sys.exit(1)
+    cfg = _load_config_or_exit(ctx)
+
+    from . import check_cache
+    from .orchestrator import check_all
+
+    check_cache.set_bypass(no_cache)
 
     base_dir: str = ctx.obj["chdir"]
 
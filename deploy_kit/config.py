@@ -1,26 +1,139 @@
 from __future__ import annotations
 
+import enum
+import functools
 import os
-from dataclasses import dataclass
-from typing import Optional, List
+import stat
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Mapping, Optional, Sequence
 
-from dotenv import load_dotenv, dotenv_values
 
-
-ENV_FILES_DEFAULT_ORDER = [".env", ".env.infra", ".env.services", ".env.secrets"]
+ENV_FILES_DEFAULT_ORDER: tuple[str, ...] = (".env", ".env.infra", ".env.services", ".env.secrets")
 
 # .env.services 에서 읽어온 "서비스용" 환경변수들을 보관하는 전역 변수
 _SERVICE_ENV: dict[str, str] = {}
 
 
+# 이 문자들이 보이면 보간/이스케이프/인라인 주석/CRLF 등 python-dotenv 의
+# 전체 파서가 필요한 문법일 수 있으므로 빠른 경로를 포기한다.
+_FAST_PARSE_BAIL_CHARS = ("$", "\\", "\r", "\x0b", "\x0c")
+_QUOTES = ("'", '"')
+
+
+def _fast_parse_env(data: bytes) -> Optional[dict[str, Optional[str]]]:
+    """
+    단순한 KEY=VALUE / KEY='VALUE' / KEY="VALUE" 줄만 있는 env 파일을 빠르게 파싱한다.
+
+    python-dotenv 와 결과가 같다고 확신할 수 없는 줄(보간, 이스케이프, 인라인 주석,
+    export, 값 없는 키, 여러 줄 값 등)이 하나라도 있으면 None 을 반환하고,
+    호출 측은 dotenv_values 로 폴백한다.
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    text = text.removeprefix("\ufeff")
+    if any(c in text for c in _FAST_PARSE_BAIL_CHARS):
+        return None
+
+    values: dict[str, Optional[str]] = {}
+    for raw_line in text.split("\n"):
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line[0] == "#":
+            # 주석 줄
+            continue
+        if "#" in line:
+            return None
+        key, sep, value = line.partition("=")
+        if not sep:
+            return None
+        key = key.strip()
+        if (
+            not key
+            or key[0] in _QUOTES
+            or key.startswith("export")
+            or any(c.isspace() for c in key)
+        ):
+            return None
+        value = value.strip()
+        if value and value[0] in _QUOTES:
+            q = value[0]
+            # 같은 줄에서 정확히 한 쌍의 따옴표로 감싸진 경우만 처리
+            if len(value) < 2 or value[-1] != q or q in value[1:-1]:
+                return None
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_dotenv_cached(path: str, mtime_ns: int, size: int) -> dict[str, Optional[str]]:
+    """
+    (path, mtime, size) 를 키로 dotenv 파싱 결과를 캐시한다.
+    파일 내용이 바뀌면 mtime/size 가 달라지므로 자연스럽게 다시 파싱된다.
+    """
+    try:
+        with open(path, "rb") as f:
+            parsed = _fast_parse_env(f.read())
+    except OSError:
+        parsed = None
+    if parsed is not None:
+        return parsed
+    # python-dotenv 는 전체 파서가 필요할 때만 import 한다.
+    from dotenv import dotenv_values
+
+    return dict(dotenv_values(path))
+
+
+def read_env_file(path: str | os.DirEntry) -> dict[str, Optional[str]]:
+    """
+    env 파일 하나를 파싱하여 dict 로 반환한다. (파일이 없으면 빈 dict)
+
+    같은 프로세스에서 같은 파일을 여러 번 읽더라도(plan -a 등)
+    파일이 바뀌지 않았다면 캐시된 결과의 복사본을 돌려준다.
+    list_dir_files 로 얻은 DirEntry 를 넘기면 이미 조인된 경로와 stat 캐시를 그대로 사용한다.
+    """
+    try:
+        if isinstance(path, os.DirEntry):
+            st = path.stat()
+            path = path.path
+        else:
+            st = os.stat(path)
+    except OSError:
+        return {}
+    # 디렉토리/FIFO 등 일반 파일이 아니면 파싱하지 않는다. (FIFO 는 open 에서 블록될 수 있음)
+    if not stat.S_ISREG(st.st_mode):
+        return {}
+    return dict(_parse_dotenv_cached(path, st.st_mtime_ns, st.st_size))
+
+
+def list_dir_files(base_dir: str) -> dict[str, os.DirEntry]:
+    """
+    base_dir 바로 아래의 일반 파일들을 {이름: DirEntry} 로 반환한다. (디렉토리가 없으면 빈 dict)
+
+    파일마다 os.path.exists 로 stat 을 반복하는 대신 디렉토리를 한 번만 읽는다.
+    """
+    try:
+        with os.scandir(base_dir) as it:
+            return {e.name: e for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
 def load_env_files(
     base_dir: str = ".",
-    files: Optional[List[str]] = None,
+    files: Optional[Sequence[str]] = None,
+    override: bool = True,
 ) -> None:
     """
     주어진 디렉토리에서 .env 계열 파일을 순서대로 로드한다.
     후순위 파일이 같은 키를 덮어쓴다.
 
+    override=False 이면 이미 os.environ 에 있는 키는 건드리지 않는다.
+    (CI 등에서 외부에서 주입한 값을 우선하고 싶을 때)
+
     .env.services 는 Cloud Run 서비스 내부에서 사용할 일반적인 앱 환경변수용 파일이고,
     인프라/토글 설정(GCP_PROJECT_ID, ENABLE_*, DEPLOY_* 등)은
     .env.infra / .env.secrets 에 두는 것을 권장한다.
@@ -28,45 +141,156 @@ def load_env_files(
     global _SERVICE_ENV
 
     order = files or ENV_FILES_DEFAULT_ORDER
+    present = list_dir_files(base_dir)
     for name in order:
-        path = os.path.join(base_dir, name)
-        if os.path.exists(path):
-            # .env.services 는 Cloud Run 서비스용 env 로도 따로 보관
-            if name == ".env.services":
-                raw = dotenv_values(path)
-                # 값이 None 인 항목은 제외
-                _SERVICE_ENV = {k: v for k, v in raw.items() if v is not None}
-            load_dotenv(path, override=True)
-
-
-def _get_bool(name: str, default: bool = False) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return raw.lower() in {"1", "true", "yes", "y"}
-
+        entry = present.get(name)
+        if entry is None:
+            continue
+        # 값이 None 인 항목(값 없는 키)은 제외
+        values = {k: v for k, v in read_env_file(entry).items() if v is not None}
+        # .env.services 는 Cloud Run 서비스용 env 로도 따로 보관
+        if name == ".env.services":
+            _SERVICE_ENV = dict(values)
+        if not override:
+            values = {k: v for k, v in values.items() if k not in os.environ}
+        os.environ.update(values)
+
+
+# bool 필드에서 참으로 취급하는 문자열 (소문자 기준)
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "y"})
+# 호출마다 속성 조회를 하지 않도록 membership 검사 메서드를 미리 바인딩
+_is_truthy = _TRUTHY.__contains__
+
+# 숫자 필드 변환 함수와 에러 메시지용 설명
+_NUMERIC_KINDS: dict[str, tuple[Callable[[str], Any], str]] = {
+    "int": (int, "정수"),
+    "float": (float, "숫자(float)"),
+}
+
+
+def _coerce(env: Mapping[str, str], name: str, kind: str, default: Any) -> Any:
+    """
+    env[name] 을 kind(str/bool/int/float)에 맞게 변환한다. 값이 없으면 default.
 
-def _get_int(name: str, default: int) -> int:
-    raw = os.getenv(name)
-    if raw is None or raw.strip() == "":
+    - str  : 값 그대로 (빈 문자열도 유지)
+    - bool : _TRUTHY 에 포함되면 True, 그 외(빈 문자열 포함)는 False
+    - int / float : 비어 있으면 default, 변환 실패 시 ValueError
+    """
+    raw = env.get(name)
+    if raw is None:
         return default
-    try:
-        return int(raw)
-    except ValueError as e:
-        raise ValueError(f"{name} 는 정수여야 합니다: {raw!r}") from e
-
-
-def _get_float(name: str, default: float) -> float:
-    raw = os.getenv(name)
-    if raw is None or raw.strip() == "":
+    if kind == "str":
+        return raw
+    if kind == "bool":
+        return _is_truthy(raw.lower())
+    if raw.strip() == "":
         return default
+    convert, label = _NUMERIC_KINDS[kind]
     try:
-        return float(raw)
+        return convert(raw)
     except ValueError as e:
-        raise ValueError(f"{name} 는 숫자(float)여야 합니다: {raw!r}") from e
-
-
-@dataclass
+        raise ValueError(f"{name} 는 {label}여야 합니다: {raw!r}") from e
+
+
+# DeployConfig.from_env 가 읽는 환경변수 목록: (필드명, 환경변수명, 종류, 기본값)
+# - req  : 필수 문자열 (비어 있으면 누락으로 간주)
+# - str  : 선택 문자열
+# - bool / int / float : _coerce 로 변환
+_FIELD_SPEC: tuple[tuple[str, str, str, Any], ...] = (
+    ("gcp_project_id", "GCP_PROJECT_ID", "req", None),
+    ("gcp_region", "GCP_REGION", "req", None),
+    ("deploy_sa_email", "DEPLOY_SERVICE_ACCOUNT_EMAIL", "req", None),
+    ("artifact_registry_repo", "ARTIFACT_REGISTRY_REPO", "req", None),
+    ("backend_service_name", "BACKEND_SERVICE_NAME", "req", None),
+    ("backend_build_mode", "BACKEND_BUILD_MODE", "str", "local_docker"),
+    ("prefer_gcloud", "PREFER_GCLOUD", "bool", False),
+    ("ar_api_rate_limit", "AR_API_RATE_LIMIT", "float", 10.0),
+    ("cli_stream_subprocess_output", "CLI_STREAM_SUBPROCESS_OUTPUT", "bool", True),
+    ("cli_show_progress", "CLI_SHOW_PROGRESS", "bool", True),
+    ("cli_progress_idle_seconds", "CLI_PROGRESS_IDLE_SECONDS", "float", 2.0),
+    ("cli_progress_style", "CLI_PROGRESS_STYLE", "str", "braille"),
+    ("cli_progress_interval_seconds", "CLI_PROGRESS_INTERVAL_SECONDS", "float", 0.12),
+    ("cloud_build_timeout_seconds", "CLOUD_BUILD_TIMEOUT_SECONDS", "int", 3600),
+    ("cloud_build_staging_bucket", "CLOUD_BUILD_STAGING_BUCKET", "str", None),
+    ("backend_build_subprocess_timeout_seconds", "BACKEND_BUILD_SUBPROCESS_TIMEOUT_SECONDS", "int", 7200),
+    ("gcloud_run_deploy_timeout_seconds", "GCLOUD_RUN_DEPLOY_TIMEOUT_SECONDS", "int", 1800),
+    ("backend_allow_unauthenticated", "BACKEND_ALLOW_UNAUTHENTICATED", "bool", True),
+    ("backend_image_name", "BACKEND_IMAGE_NAME", "str", None),
+    ("frontend_image_name", "FRONTEND_IMAGE_NAME", "str", None),
+    ("frontend_service_name", "FRONTEND_SERVICE_NAME", "str", None),
+    ("frontend_allow_unauthenticated", "FRONTEND_ALLOW_UNAUTHENTICATED", "bool", True),
+    ("deploy_frontend_cloud_run", "DEPLOY_FRONTEND_CLOUD_RUN", "bool", False),
+    ("frontend_api_prefix", "FRONTEND_API_PREFIX", "str", None),
+    ("frontend_api_target", "FRONTEND_API_TARGET", "str", None),
+    ("frontend_image_package", "FRONTEND_IMAGE_PACKAGE", "str", None),
+    ("backend_image_package", "BACKEND_IMAGE_PACKAGE", "str", None),
+    ("etl_image_package", "ETL_IMAGE_PACKAGE", "str", None),
+    ("backend_api_host", "BACKEND_API_HOST", "str", None),
+    ("enable_bigquery", "ENABLE_BIGQUERY", "bool", False),
+    ("enable_cloud_sql", "ENABLE_CLOUD_SQL", "bool", False),
+    ("enable_gcs", "ENABLE_GCS", "bool", False),
+    ("enable_firebase", "ENABLE_FIREBASE", "bool", False),
+    ("enable_secret_manager", "ENABLE_SECRET_MANAGER", "bool", True),
+    ("deploy_backend", "DEPLOY_BACKEND", "bool", True),
+    ("deploy_frontend", "DEPLOY_FRONTEND", "bool", True),
+    ("deploy_etl_job", "DEPLOY_ETL_JOB", "bool", False),
+    ("configure_secrets", "CONFIGURE_SECRETS", "bool", True),
+    ("bigquery_project_id", "BIGQUERY_PROJECT_ID", "str", None),
+    ("bigquery_dataset_id", "BIGQUERY_DATASET_ID", "str", None),
+    ("cloud_sql_instance_name", "CLOUD_SQL_INSTANCE_NAME", "str", None),
+    ("cloud_sql_db_name", "CLOUD_SQL_DB_NAME", "str", None),
+    ("cloud_sql_user", "CLOUD_SQL_USER", "str", None),
+    ("gcs_bucket_name", "GCS_BUCKET_NAME", "str", None),
+    ("gcs_prefix", "GCS_PREFIX", "str", None),
+    ("firebase_project_id", "FIREBASE_PROJECT_ID", "str", None),
+    ("firebase_hosting_site", "FIREBASE_HOSTING_SITE", "str", None),
+    ("firebase_api_prefix", "FIREBASE_API_PREFIX", "str", None),
+    ("secret_prefix", "SECRET_PREFIX", "str", ""),
+    ("backend_source_dir", "BACKEND_SOURCE_DIR", "str", "."),
+    ("frontend_source_dir", "FRONTEND_SOURCE_DIR", "str", None),
+    ("frontend_build_command", "FRONTEND_BUILD_COMMAND", "str", None),
+    ("frontend_build_dir", "FRONTEND_BUILD_DIR", "str", "dist"),
+)
+
+# from_env 캐시 key 를 만들 때 보는 환경변수 이름 (_FIELD_SPEC 순서)
+_ENV_NAMES: tuple[str, ...] = tuple(env_name for _, env_name, _, _ in _FIELD_SPEC)
+
+# CLI_PROGRESS_STYLE 로 허용되는 값 (소문자 기준)
+_VALID_PROGRESS_STYLES: frozenset[str] = frozenset({"braille", "ascii"})
+
+# 기능 토글(필드명)이 켜졌을 때 비어 있으면 안 되는 필드들.
+# 에러 메시지의 환경변수 이름은 필드명을 대문자로 바꾼 것과 같다.
+_REQUIRED_WHEN: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("deploy_frontend_cloud_run", ("frontend_service_name", "frontend_source_dir", "frontend_image_name")),
+    ("enable_bigquery", ("bigquery_dataset_id",)),
+    ("enable_cloud_sql", ("cloud_sql_instance_name", "cloud_sql_db_name", "cloud_sql_user")),
+    ("enable_gcs", ("gcs_bucket_name",)),
+    ("enable_firebase", ("firebase_project_id", "firebase_hosting_site")),
+)
+
+
+class Feature(enum.IntFlag):
+    """DeployConfig 의 기능 토글 비트. (cfg.features 로 여러 토글을 한 번에 검사)"""
+
+    ENABLE_BIGQUERY = enum.auto()
+    ENABLE_CLOUD_SQL = enum.auto()
+    ENABLE_GCS = enum.auto()
+    ENABLE_FIREBASE = enum.auto()
+    ENABLE_SECRET_MANAGER = enum.auto()
+    DEPLOY_BACKEND = enum.auto()
+    DEPLOY_FRONTEND = enum.auto()
+    DEPLOY_FRONTEND_CLOUD_RUN = enum.auto()
+    DEPLOY_ETL_JOB = enum.auto()
+    CONFIGURE_SECRETS = enum.auto()
+
+
+# Feature 비트 -> DeployConfig 필드명 (비트 이름을 소문자로 바꾼 것과 같다)
+_FEATURE_FIELDS: tuple[tuple[Feature, str], ...] = tuple(
+    (flag, flag.name.lower()) for flag in Feature
+)
+
+
+@dataclass(slots=True, frozen=True)
 class DeployConfig:
     # 필수 공통
     gcp_project_id: str
@@ -80,6 +304,12 @@ class DeployConfig:
     # 이미지 빌드 전략 (local_docker | cloud_build)
     backend_build_mode: str = "local_docker"
 
+    # Artifact Registry 조회/생성을 Python 클라이언트 대신 gcloud CLI 로 수행할지 여부
+    # (ADC 가 없고 gcloud 로그인만 되어 있는 환경용)
+    prefer_gcloud: bool = False
+    # Artifact Registry 요청(리포 조회/생성, docker push) 초당 최대 횟수 (클라이언트 측 제한)
+    ar_api_rate_limit: float = 10.0
+
     # CLI/subprocess UX
     # - true: gcloud/docker/npm 등의 출력(stream)을 그대로 보여준다.
     # - false: 조용히 실행하고(캡처), 실패 시 일부 로그만 요약하여 출력한다.
@@ -96,6 +326,9 @@ class DeployConfig:
     # 타임아웃 (초)
     # - cloud_build 모드일 때는 Cloud Build 자체 timeout 과, 로컬에서 기다리는 timeout 을 분리한다.
     cloud_build_timeout_seconds: int = 3600
+    # cloud_build 모드에서 소스 아카이브를 해시 기준으로 보관/재사용할 GCS 버킷 (선택)
+    # - 설정하면 소스가 바뀌지 않은 빌드는 업로드를 건너뛴다.
+    cloud_build_staging_bucket: Optional[str] = None
     backend_build_subprocess_timeout_seconds: int = 7200
     gcloud_run_deploy_timeout_seconds: int = 1800
 
@@ -168,119 +401,110 @@ class DeployConfig:
     # Cloud Run 서비스 내부 환경변수 (key/value 쌍)
     backend_service_env: dict[str, str] | None = None
 
+    # 아래 값들은 다른 필드에서 파생되므로 __post_init__ 에서 한 번만 계산한다.
+    # - Artifact Registry docker 호스트 (REGION-docker.pkg.dev)
+    ar_hostname: str = field(init=False, repr=False, compare=False)
+    # - Artifact Registry 이미지 경로 prefix (REGION-docker.pkg.dev/PROJECT/REPO)
+    registry_prefix: str = field(init=False, repr=False, compare=False)
+    # - gcloud 공통 플래그 (--project=..., --region=...)
+    project_flag: str = field(init=False, repr=False, compare=False)
+    region_flag: str = field(init=False, repr=False, compare=False)
+    # ENABLE_*/DEPLOY_* 토글을 하나로 합친 비트마스크 (Feature 참고)
+    features: Feature = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen dataclass 이므로 object.__setattr__ 로 파생 필드를 채운다.
+        ar_hostname = f"{self.gcp_region}-docker.pkg.dev"
+        object.__setattr__(self, "ar_hostname", ar_hostname)
+        object.__setattr__(
+            self,
+            "registry_prefix",
+            f"{ar_hostname}/{self.gcp_project_id}/{self.artifact_registry_repo}",
+        )
+        object.__setattr__(self, "project_flag", f"--project={self.gcp_project_id}")
+        object.__setattr__(self, "region_flag", f"--region={self.gcp_region}")
+        flags = Feature(0)
+        for flag, field_name in _FEATURE_FIELDS:
+            if getattr(self, field_name):
+                flags |= flag
+        object.__setattr__(self, "features", flags)
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "DeployConfig":
+        # os.environ 은 조회마다 인코딩 변환을 거치므로 한 번만 스냅샷을 떠서 사용한다.
+        # (env 를 직접 넘기면 os.environ 대신 그 매핑을 사용한다. 테스트 등에서 활용)
+        if env is None:
+            env = dict(os.environ)
+
+        # DeployConfig 가 읽는 키들의 값과 .env.services 내용이 같으면 파싱/검증 결과를 재사용한다.
+        # (인스턴스는 frozen 이라 공유해도 안전하다. 검증 실패(ValueError)는 캐시되지 않는다)
+        values = tuple(env.get(name) for name in _ENV_NAMES)
+        return _deploy_config_from_values(values, tuple(_SERVICE_ENV.items()))
+
     @classmethod
-    def from_env(cls) -> "DeployConfig":
+    def _from_mapping(cls, env: Mapping[str, str], service_env: dict[str, str]) -> "DeployConfig":
+        """from_env 의 실제 파싱/검증."""
         # 필수값
         missing: List[str] = []
 
-        def req(name: str) -> str:
-            val = os.getenv(name)
-            if not val:
-                missing.append(name)
-            return val or ""
-
-        cfg = cls(
-            gcp_project_id=req("GCP_PROJECT_ID"),
-            gcp_region=req("GCP_REGION"),
-            deploy_sa_email=req("DEPLOY_SERVICE_ACCOUNT_EMAIL"),
-            artifact_registry_repo=req("ARTIFACT_REGISTRY_REPO"),
-            backend_service_name=req("BACKEND_SERVICE_NAME"),
-            backend_build_mode=os.getenv("BACKEND_BUILD_MODE", "local_docker"),
-            cli_stream_subprocess_output=_get_bool(
-                "CLI_STREAM_SUBPROCESS_OUTPUT", True
-            ),
-            cli_show_progress=_get_bool("CLI_SHOW_PROGRESS", True),
-            cli_progress_idle_seconds=_get_float("CLI_PROGRESS_IDLE_SECONDS", 2.0),
-            cli_progress_style=os.getenv("CLI_PROGRESS_STYLE", "braille"),
-            cli_progress_interval_seconds=_get_float("CLI_PROGRESS_INTERVAL_SECONDS", 0.12),
-            cloud_build_timeout_seconds=_get_int(
-                "CLOUD_BUILD_TIMEOUT_SECONDS", 3600
-            ),
-            backend_build_subprocess_timeout_seconds=_get_int(
-                "BACKEND_BUILD_SUBPROCESS_TIMEOUT_SECONDS", 7200
-            ),
-            gcloud_run_deploy_timeout_seconds=_get_int(
-                "GCLOUD_RUN_DEPLOY_TIMEOUT_SECONDS", 1800
-            ),
-            backend_allow_unauthenticated=_get_bool(
-                "BACKEND_ALLOW_UNAUTHENTICATED", True
-            ),
-            backend_image_name=os.getenv("BACKEND_IMAGE_NAME"),
-            frontend_image_name=os.getenv("FRONTEND_IMAGE_NAME"),
-            frontend_service_name=os.getenv("FRONTEND_SERVICE_NAME"),
-            frontend_allow_unauthenticated=_get_bool(
-                "FRONTEND_ALLOW_UNAUTHENTICATED", True
-            ),
-            deploy_frontend_cloud_run=_get_bool(
-                "DEPLOY_FRONTEND_CLOUD_RUN", False
-            ),
-            frontend_api_prefix=os.getenv("FRONTEND_API_PREFIX"),
-            frontend_api_target=os.getenv("FRONTEND_API_TARGET"),
-            frontend_image_package=os.getenv("FRONTEND_IMAGE_PACKAGE"),
-            backend_image_package=os.getenv("BACKEND_IMAGE_PACKAGE"),
-            etl_image_package=os.getenv("ETL_IMAGE_PACKAGE"),
-            backend_api_host=os.getenv("BACKEND_API_HOST"),
-            enable_bigquery=_get_bool("ENABLE_BIGQUERY", False),
-            enable_cloud_sql=_get_bool("ENABLE_CLOUD_SQL", False),
-            enable_gcs=_get_bool("ENABLE_GCS", False),
-            enable_firebase=_get_bool("ENABLE_FIREBASE", False),
-            enable_secret_manager=_get_bool("ENABLE_SECRET_MANAGER", True),
-            deploy_backend=_get_bool("DEPLOY_BACKEND", True),
-            deploy_frontend=_get_bool("DEPLOY_FRONTEND", True),
-            deploy_etl_job=_get_bool("DEPLOY_ETL_JOB", False),
-            configure_secrets=_get_bool("CONFIGURE_SECRETS", True),
-            bigquery_project_id=os.getenv("BIGQUERY_PROJECT_ID"),
-            bigquery_dataset_id=os.getenv("BIGQUERY_DATASET_ID"),
-            cloud_sql_instance_name=os.getenv("CLOUD_SQL_INSTANCE_NAME"),
-            cloud_sql_db_name=os.getenv("CLOUD_SQL_DB_NAME"),
-            cloud_sql_user=os.getenv("CLOUD_SQL_USER"),
-            gcs_bucket_name=os.getenv("GCS_BUCKET_NAME"),
-            gcs_prefix=os.getenv("GCS_PREFIX"),
-            firebase_project_id=os.getenv("FIREBASE_PROJECT_ID"),
-            firebase_hosting_site=os.getenv("FIREBASE_HOSTING_SITE"),
-            firebase_api_prefix=os.getenv("FIREBASE_API_PREFIX"),
-            secret_prefix=os.getenv("SECRET_PREFIX", ""),
-            backend_source_dir=os.getenv("BACKEND_SOURCE_DIR", "."),
-            frontend_source_dir=os.getenv("FRONTEND_SOURCE_DIR"),
-            frontend_build_command=os.getenv("FRONTEND_BUILD_COMMAND"),
-            frontend_build_dir=os.getenv("FRONTEND_BUILD_DIR", "dist"),
-            # .env.services 에서 읽어온 값들만 Cloud Run 서비스 env 로 전달
-            backend_service_env=dict(_SERVICE_ENV),
-        )
-
+        kwargs: dict[str, Any] = {}
+        for field_name, env_name, kind, default in _FIELD_SPEC:
+            if kind == "req":
+                val = env.get(env_name)
+                if not val:
+                    missing.append(env_name)
+                kwargs[field_name] = val or ""
+            else:
+                kwargs[field_name] = _coerce(env, env_name, kind, default)
+
+        # 필수값이 없으면 인스턴스를 만들기 전에 바로 실패
         if missing:
             raise ValueError(
                 "필수 환경변수가 누락되었습니다: " + ", ".join(sorted(set(missing)))
             )
 
+        # 진행표시 스타일은 정규화된 값으로 저장해 사용하는 쪽에서 다시 strip/lower 하지 않게 한다.
+        kwargs["cli_progress_style"] = (kwargs["cli_progress_style"] or "").strip().lower()
+
+        # frozen dataclass 이므로 다른 값에서 파생되는 기본값은 생성 전에 채운다.
+        # - BIGQUERY_PROJECT_ID 가 없으면 GCP_PROJECT_ID 사용
+        # - FRONTEND_API_PREFIX 만 있고 타깃이 없으면 BACKEND_API_HOST 사용
+        if kwargs["enable_bigquery"] and not kwargs["bigquery_project_id"]:
+            kwargs["bigquery_project_id"] = kwargs["gcp_project_id"]
+        if (
+            kwargs["deploy_frontend_cloud_run"]
+            and (kwargs["frontend_api_prefix"] or "").strip()
+            and not (kwargs["frontend_api_target"] or "").strip()
+            and (kwargs["backend_api_host"] or "").strip()
+        ):
+            kwargs["frontend_api_target"] = kwargs["backend_api_host"]
+
+        # .env.services 에서 읽어온 값들만 Cloud Run 서비스 env 로 전달
+        cfg = cls(**kwargs, backend_service_env=service_env)
+
         # 기능 토글별 추가 검증
         errors: List[str] = []
 
-        # Frontend Cloud Run 배포 관련 검증
-        if cfg.deploy_frontend_cloud_run:
-            if not cfg.frontend_service_name:
-                errors.append(
-                    "DEPLOY_FRONTEND_CLOUD_RUN=true 이면 FRONTEND_SERVICE_NAME 환경변수가 필요합니다."
-                )
-            if not cfg.frontend_source_dir:
-                errors.append(
-                    "DEPLOY_FRONTEND_CLOUD_RUN=true 이면 FRONTEND_SOURCE_DIR 환경변수가 필요합니다."
-                )
-            if not cfg.frontend_image_name:
-                errors.append(
-                    "DEPLOY_FRONTEND_CLOUD_RUN=true 이면 FRONTEND_IMAGE_NAME 환경변수가 필요합니다."
-                )
-
-            api_prefix = (cfg.frontend_api_prefix or "").strip()
-            if api_prefix:
-                # 타깃이 없으면 BACKEND_API_HOST 를 기본으로 사용
-                if not (cfg.frontend_api_target or "").strip():
-                    if (cfg.backend_api_host or "").strip():
-                        cfg.frontend_api_target = cfg.backend_api_host
-                    else:
-                        errors.append(
-                            "FRONTEND_API_PREFIX 가 설정된 경우 FRONTEND_API_TARGET 또는 BACKEND_API_HOST 중 하나가 필요합니다."
-                        )
+        # 토글이 켜졌을 때 반드시 있어야 하는 값들 (_REQUIRED_WHEN 표 기반)
+        for flag, fields in _REQUIRED_WHEN:
+            if not getattr(cfg, flag):
+                continue
+            for field_name in fields:
+                if not getattr(cfg, field_name):
+                    errors.append(
+                        f"{flag.upper()}=true 이면 {field_name.upper()} 환경변수가 필요합니다."
+                    )
+
+        # Frontend Cloud Run: API 프록시 타깃 검증
+        # (타깃 기본값(BACKEND_API_HOST)은 생성 전에 이미 채워져 있다.)
+        if (
+            cfg.deploy_frontend_cloud_run
+            and (cfg.frontend_api_prefix or "").strip()
+            and not (cfg.frontend_api_target or "").strip()
+        ):
+            errors.append(
+                "FRONTEND_API_PREFIX 가 설정된 경우 FRONTEND_API_TARGET 또는 BACKEND_API_HOST 중 하나가 필요합니다."
+            )
 
         # 타임아웃 값 검증
         if cfg.cloud_build_timeout_seconds <= 0:
@@ -293,54 +517,15 @@ class DeployConfig:
             errors.append(
                 "GCLOUD_RUN_DEPLOY_TIMEOUT_SECONDS 는 1 이상의 정수여야 합니다."
             )
+        if cfg.ar_api_rate_limit <= 0:
+            errors.append("AR_API_RATE_LIMIT 는 0보다 큰 숫자여야 합니다.")
         if cfg.cli_progress_idle_seconds < 0:
             errors.append("CLI_PROGRESS_IDLE_SECONDS 는 0 이상의 숫자여야 합니다.")
         if cfg.cli_progress_interval_seconds <= 0:
             errors.append("CLI_PROGRESS_INTERVAL_SECONDS 는 0보다 큰 숫자여야 합니다.")
-        if (cfg.cli_progress_style or "").strip().lower() not in {"braille", "ascii"}:
+        if cfg.cli_progress_style not in _VALID_PROGRESS_STYLES:
             errors.append("CLI_PROGRESS_STYLE 는 braille 또는 ascii 중 하나여야 합니다.")
 
-        # BigQuery 기본값/검증
-        if cfg.enable_bigquery:
-            if not cfg.bigquery_project_id:
-                cfg.bigquery_project_id = cfg.gcp_project_id
-            if not cfg.bigquery_dataset_id:
-                errors.append(
-                    "ENABLE_BIGQUERY=true 이면 BIGQUERY_DATASET_ID 환경변수가 필요합니다."
-                )
-
-        # Cloud SQL
-        if cfg.enable_cloud_sql:
-            if not cfg.cloud_sql_instance_name:
-                errors.append(
-                    "ENABLE_CLOUD_SQL=true 이면 CLOUD_SQL_INSTANCE_NAME 환경변수가 필요합니다."
-                )
-            if not cfg.cloud_sql_db_name:
-                errors.append(
-                    "ENABLE_CLOUD_SQL=true 이면 CLOUD_SQL_DB_NAME 환경변수가 필요합니다."
-                )
-            if not cfg.cloud_sql_user:
-                errors.append(
-                    "ENABLE_CLOUD_SQL=true 이면 CLOUD_SQL_USER 환경변수가 필요합니다."
-                )
-
-        # GCS
-        if cfg.enable_gcs and not cfg.gcs_bucket_name:
-            errors.append(
-                "ENABLE_GCS=true 이면 GCS_BUCKET_NAME 환경변수가 필요합니다."
-            )
-
-        # Firebase Hosting
-        if cfg.enable_firebase:
-            if not cfg.firebase_project_id:
-                errors.append(
-                    "ENABLE_FIREBASE=true 이면 FIREBASE_PROJECT_ID 환경변수가 필요합니다."
-                )
-            if not cfg.firebase_hosting_site:
-                errors.append(
-                    "ENABLE_FIREBASE=true 이면 FIREBASE_HOSTING_SITE 환경변수가 필요합니다."
-                )
-
         if errors:
             raise ValueError(
                 "환경변수 설정이 잘못되었습니다:\n- " + "\n- ".join(errors)
@@ -349,3 +534,12 @@ class DeployConfig:
         return cfg
 
 
+@functools.lru_cache(maxsize=8)
+def _deploy_config_from_values(
+    values: tuple[Optional[str], ...], service_env: tuple[tuple[str, str], ...]
+) -> DeployConfig:
+    """(_ENV_NAMES 순서의 값, .env.services 항목) -> DeployConfig."""
+    env = {name: value for name, value in zip(_ENV_NAMES, values) if value is not None}
+    return DeployConfig._from_mapping(env, dict(service_env))
+
+
@@ -7,19 +7,30 @@ Firebase Hosting 배포를 담당하는 모듈.
 
 from __future__ import annotations
 
-import json
+import functools
 import os
-from shutil import which as _which
-from textwrap import shorten
 from typing import Any
 
-from .config import DeployConfig
+from .config import DeployConfig, Feature
 from .logging_utils import get_logger
 from .subprocess_utils import run_command
 
 
 logger = get_logger(__name__)
 
+# 기본 firebase.json 에서 매번 같은 값인 부분 (호출마다 새로 만들지 않도록 모듈 상수로 둔다)
+_FIREBASE_IGNORE: tuple[str, ...] = ("firebase.json", "**/.*", "**/node_modules/**")
+# SPA 라우팅용 fallback: 나머지 모든 경로는 /index.html 로 전달
+_FIREBASE_SPA_FALLBACK: dict[str, str] = {"source": "**", "destination": "/index.html"}
+
+
+@functools.lru_cache(maxsize=1)
+def _firebase_path() -> str | None:
+    """firebase CLI 의 절대 경로. (PATH 탐색은 프로세스당 한 번만 수행)"""
+    from shutil import which
+
+    return which("firebase")
+
 
 def _ensure_firebase_json(cfg: DeployConfig, build_dir: str) -> None:
     """
@@ -35,14 +46,14 @@ def _ensure_firebase_json(cfg: DeployConfig, build_dir: str) -> None:
           (gcp_region / backend_service_name 사용)
         - SPA 라우팅을 위한 fallback (\"**\" → /index.html)
     """
+    # firebase 섹션이 실제로 실행될 때만 필요하므로 지연 import
+    import json
+
     config_path = os.path.join(os.getcwd(), "firebase.json")
-    if os.path.exists(config_path):
-        logger.debug("기존 firebase.json 이 존재하므로 새로 생성하지 않습니다: %s", config_path)
-        return
 
     hosting: dict[str, Any] = {
         "public": build_dir,
-        "ignore": ["firebase.json", "**/.*", "**/node_modules/**"],
+        "ignore": list(_FIREBASE_IGNORE),
     }
 
     if cfg.firebase_hosting_site:
@@ -69,20 +80,31 @@ def _ensure_firebase_json(cfg: DeployConfig, build_dir: str) -> None:
     # SPA 라우팅용 fallback 설정: 나머지 모든 경로는 /index.html 로 전달
     # index.html 이 실제로 존재하지 않아도 Hosting 전체가 깨지지는 않으며,
     # SPA 가 아닌 프로젝트는 firebase.json 을 직접 제공하여 이 구성을 덮어쓸 수 있다.
-    rewrites.append(
-        {
-            "source": "**",
-            "destination": "/index.html",
-        }
-    )
+    rewrites.append(dict(_FIREBASE_SPA_FALLBACK))
 
     hosting["rewrites"] = rewrites
 
     config: dict[str, Any] = {"hosting": hosting}
 
+    # 존재 확인(stat)과 생성을 O_EXCL 로 한 번에 처리한다. (이미 있으면 절대 덮어쓰지 않음)
+    try:
+        fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        logger.debug("기존 firebase.json 이 존재하므로 새로 생성하지 않습니다: %s", config_path)
+        return
+    except OSError as e:  # noqa: BLE001
+        logger.warning("firebase.json 생성에 실패했습니다(계속 진행): %s", e)
+        return
+
+    # 작은 파일이므로 미리 bytes 로 직렬화해 한 번의 write 로 기록한다.
+    payload = json.dumps(config, ensure_ascii=True, indent=2).encode("ascii")
     try:
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         logger.info("firebase.json 이 없어 기본 구성을 생성했습니다: %s", config_path)
     except OSError as e:  # noqa: BLE001
         logger.warning("firebase.json 생성에 실패했습니다(계속 진행): %s", e)
@@ -96,7 +118,7 @@ def deploy_frontend(cfg: DeployConfig, build_dir: str | None = None) -> None:
     프론트엔드 빌드 산출물 디렉토리이다.
     명시되지 않은 경우 cfg.frontend_build_dir (기본 dist)를 사용한다.
     """
-    if not (cfg.enable_firebase and cfg.deploy_frontend):
+    if (Feature.ENABLE_FIREBASE | Feature.DEPLOY_FRONTEND) not in cfg.features:
         logger.debug(
             "ENABLE_FIREBASE=false 이거나 DEPLOY_FRONTEND=false 이므로 Firebase 배포를 건너뜁니다."
         )
@@ -110,10 +132,11 @@ def deploy_frontend(cfg: DeployConfig, build_dir: str | None = None) -> None:
 
     # build_dir 가 명시되지 않으면 설정 값(frontend_build_dir)을 사용
     if build_dir is None:
-        build_dir = getattr(cfg, "frontend_build_dir", "dist")
+        build_dir = cfg.frontend_build_dir
 
     # firebase CLI 존재 여부를 사전에 확인
-    if _which("firebase") is None:
+    firebase_bin = _firebase_path()
+    if firebase_bin is None:
         raise RuntimeError(
             "firebase 명령을 찾을 수 없습니다. firebase-tools 가 전역 혹은 현재 환경에 "
             "설치되어 있는지 확인하세요."
@@ -136,8 +159,9 @@ def deploy_frontend(cfg: DeployConfig, build_dir: str | None = None) -> None:
         build_dir,
     )
 
+    # 찾아 둔 절대 경로를 그대로 사용해 실행 시 PATH 재탐색을 피한다.
     cmd = [
-        "firebase",
+        firebase_bin,
         "deploy",
         "--only",
         f"hosting:{cfg.firebase_hosting_site}",
@@ -146,8 +170,9 @@ def deploy_frontend(cfg: DeployConfig, build_dir: str | None = None) -> None:
         "--non-interactive",
     ]
 
+    # stdout/stderr 는 run_command 가 이미 (캡처 모드) debug 로그로 남기거나 (스트리밍 모드) 터미널로 흘린다.
     try:
-        result = run_command(
+        run_command(
             cmd,
             timeout=cfg.backend_build_subprocess_timeout_seconds,
             stream_output=cfg.cli_stream_subprocess_output,
@@ -155,16 +180,6 @@ def deploy_frontend(cfg: DeployConfig, build_dir: str | None = None) -> None:
             if cfg.cli_stream_subprocess_output
             else "Firebase Hosting 배포 중",
         )
-        if result.stdout:
-            logger.debug(
-                "firebase deploy stdout: %s",
-                shorten(result.stdout.strip(), width=2000),
-            )
-        if getattr(result, "stderr", ""):
-            logger.debug(
-                "firebase deploy stderr: %s",
-                shorten(getattr(result, "stderr", "").strip(), width=2000),
-            )
     except RuntimeError as e:
         raise RuntimeError(f"Firebase Hosting 배포에 실패했습니다. {e}") from e
 
@@ -8,15 +8,77 @@ Artifact Registry 리포지토리 존재 여부 확인 및
 
 from __future__ import annotations
 
-from textwrap import shorten
+import hashlib
+import logging
+import os
+import posixpath
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator
 
+from . import check_cache
 from .config import DeployConfig
 from .logging_utils import get_logger
-from .subprocess_utils import run_command
+from .subprocess_utils import RunResult, _fast_truncate, run_command
 
 
 logger = get_logger(__name__)
 
+# 여러 서비스 이미지를 동시에 빌드할 때 로컬 docker build 는 한 번에 하나만 실행한다.
+# (빌드는 로컬 CPU/디스크를 두고 경합하므로 직렬화하고, 네트워크 위주의 push 만 겹치게 한다)
+_DOCKER_BUILD_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷.
+    초당 rate_per_sec 개의 토큰이 채워지며, 최대 burst 개까지 쌓인다.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: float | None = None) -> None:
+        self.rate_per_sec = float(rate_per_sec)
+        self.capacity = float(burst if burst is not None else max(rate_per_sec, 1.0))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> None:
+        """토큰 n 개를 얻을 때까지 기다린다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait = (n - self._tokens) / self.rate_per_sec
+            time.sleep(wait)
+
+
+# AR_API_RATE_LIMIT 값별 공유 버킷 (모든 Artifact Registry 요청이 같은 한도를 나눠 쓴다)
+_rate_limiters: dict[float, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _ar_rate_limiter(cfg: DeployConfig) -> TokenBucket:
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(cfg.ar_api_rate_limit)
+        if bucket is None:
+            bucket = TokenBucket(cfg.ar_api_rate_limit)
+            _rate_limiters[cfg.ar_api_rate_limit] = bucket
+        return bucket
+
+
+# 이 프로세스에서 이미 존재를 확인(또는 생성)한 (project, region, repo)
+_ensured_repositories: set[tuple[str, str, str]] = set()
+
+# 이 프로세스에서 이미 gcloud auth configure-docker 를 실행한 레지스트리 호스트
+_configured_registries: set[str] = set()
+_configured_registries_lock = threading.Lock()
+
 
 def _run(
     cmd: list[str],
@@ -24,78 +86,528 @@ def _run(
     timeout: float | None = 900.0,
     stream_output: bool = False,
     spinner_message: str | None = None,
-) -> None:
+    env: dict[str, str] | None = None,
+) -> RunResult:
     """
     공통 subprocess 실행 헬퍼.
 
     - stdout/stderr 를 캡처하여 실패 시 일부를 에러 메시지에 포함
     - timeout 초과 시 RuntimeError 로 래핑
     """
-    # shorten import는 기존 로그 스타일 유지용(하위 호환)이며,
-    # 실제 실행/에러 메시지 포맷팅은 run_command가 담당한다.
-    _ = shorten  # noqa: F841
-    run_command(
+    return run_command(
         cmd,
+        env=env,
         timeout=timeout,
         stream_output=stream_output,
         spinner_message=spinner_message,
     )
 
 
+def _repository_path(cfg: DeployConfig) -> tuple[str, str]:
+    """(parent, name) 형태의 Artifact Registry 리소스 경로를 반환한다."""
+    parent = f"projects/{cfg.gcp_project_id}/locations/{cfg.gcp_region}"
+    return parent, f"{parent}/repositories/{cfg.artifact_registry_repo}"
+
+
+def _ar_client():
+    """
+    ArtifactRegistryClient 를 생성한다.
+    ADC 가 없으면 google.auth.exceptions.DefaultCredentialsError 가 발생한다.
+    """
+    # grpc 스택 import 비용이 커서 실제로 필요할 때만 불러온다.
+    from google.cloud import artifactregistry_v1
+
+    return artifactregistry_v1.ArtifactRegistryClient()
+
+
 def ensure_repository(cfg: DeployConfig) -> None:
     """
     Artifact Registry 리포가 존재하는지 확인하고,
     없으면 생성한다.
+
+    기본적으로 Python 클라이언트를 사용하며,
+    PREFER_GCLOUD=true 이거나 ADC 가 없으면 gcloud CLI 로 대체한다.
+    같은 리포는 프로세스당 한 번만 확인한다.
     """
+    fingerprint = (cfg.gcp_project_id, cfg.gcp_region, cfg.artifact_registry_repo)
+    if fingerprint in _ensured_repositories:
+        logger.info("Artifact Registry 리포는 이번 실행에서 이미 확인했습니다: %s", cfg.artifact_registry_repo)
+        return
+    _ensure_repository(cfg)
+    _ensured_repositories.add(fingerprint)
+
+
+def _ensure_repository(cfg: DeployConfig) -> None:
+    """ensure_repository 의 실제 확인/생성."""
     logger.info("Artifact Registry 리포 확인: %s", cfg.artifact_registry_repo)
+    if cfg.prefer_gcloud:
+        _ensure_repository_gcloud(cfg)
+        return
+
+    from google.api_core.exceptions import AlreadyExists, PermissionDenied
+    from google.auth.exceptions import DefaultCredentialsError
+    from google.cloud import artifactregistry_v1
+
+    try:
+        client = _ar_client()
+    except DefaultCredentialsError as e:
+        logger.warning("ADC 를 찾을 수 없어 gcloud 로 리포지토리를 확인합니다: %s", e)
+        _ensure_repository_gcloud(cfg)
+        return
+
+    # describe 후 create 대신 바로 create 를 시도하고, 이미 있으면 그대로 사용한다.
+    repo = cfg.artifact_registry_repo
+    parent, name = _repository_path(cfg)
+    try:
+        _ar_rate_limiter(cfg).acquire()
+        operation = client.create_repository(
+            parent=parent,
+            repository_id=repo,
+            repository=artifactregistry_v1.Repository(format_=artifactregistry_v1.Repository.Format.DOCKER),
+        )
+        operation.result(timeout=cfg.gcloud_run_deploy_timeout_seconds)
+    except AlreadyExists:
+        logger.info("기존 Artifact Registry 리포를 사용합니다: %s", repo)
+        return
+    except PermissionDenied:
+        # 생성 권한이 없는 계정이면 조회만 해 본다. (리포가 없으면 NotFound 가 그대로 전달된다)
+        _ar_rate_limiter(cfg).acquire()
+        client.get_repository(name=name)
+        logger.info("기존 Artifact Registry 리포를 사용합니다: %s", repo)
+        return
+
+    check_cache.invalidate(("artifact_registry", cfg.gcp_project_id, cfg.gcp_region, repo))
+    logger.info("Artifact Registry 리포를 생성했습니다: %s", repo)
+
+
+def _ensure_repository_gcloud(cfg: DeployConfig) -> None:
+    """ensure_repository 의 gcloud CLI 구현. (create 를 먼저 시도하고 이미 있으면 무시)"""
     repo = cfg.artifact_registry_repo
     location = cfg.gcp_region
     project = cfg.gcp_project_id
 
-    # describe 시도
-    describe_cmd = [
+    create_cmd = [
         "gcloud",
         "artifacts",
         "repositories",
-        "describe",
+        "create",
         repo,
+        "--repository-format=DOCKER",
         f"--location={location}",
         f"--project={project}",
     ]
-    import subprocess
-
     try:
+        _ar_rate_limiter(cfg).acquire()
+        # 이미 있으면 ALREADY_EXISTS 로 실패하는 것이 정상이므로 gcloud 의 ERROR 출력을 터미널에 흘리지 않는다.
         _run(
-            describe_cmd,
+            create_cmd,
             timeout=cfg.gcloud_run_deploy_timeout_seconds,
-            stream_output=cfg.cli_stream_subprocess_output,
+            stream_output=False,
+            spinner_message="Artifact Registry 리포 확인/생성 중",
+        )
+    except RuntimeError as e:
+        msg = str(e)
+        if "ALREADY_EXISTS" in msg or "already exists" in msg.lower():
+            logger.info("기존 Artifact Registry 리포를 사용합니다: %s", repo)
+            return
+        if "PERMISSION_DENIED" not in msg and "permission denied" not in msg.lower():
+            raise
+        # 생성 권한이 없는 계정이면 조회만 해 본다. (리포가 없으면 describe 실패가 그대로 전달된다)
+        _ar_rate_limiter(cfg).acquire()
+        _run(
+            [
+                "gcloud",
+                "artifacts",
+                "repositories",
+                "describe",
+                repo,
+                f"--location={location}",
+                f"--project={project}",
+                "--quiet",
+            ],
+            timeout=cfg.gcloud_run_deploy_timeout_seconds,
+            stream_output=False,
             spinner_message="Artifact Registry 리포 확인 중",
         )
         logger.info("기존 Artifact Registry 리포를 사용합니다: %s", repo)
         return
-    except RuntimeError as e:
-        # describe 실패 시에만 create 시도 (다른 오류일 수도 있으므로 로그 남김)
-        logger.warning("리포지토리 조회 실패, 생성 시도: %s", e)
 
-    create_cmd = [
-        "gcloud",
-        "artifacts",
-        "repositories",
-        "create",
-        repo,
-        "--repository-format=DOCKER",
-        f"--location={location}",
-        f"--project={project}",
-    ]
-    _run(
-        create_cmd,
-        timeout=cfg.gcloud_run_deploy_timeout_seconds,
-        stream_output=cfg.cli_stream_subprocess_output,
-        spinner_message="Artifact Registry 리포 생성 중",
-    )
+    check_cache.invalidate(("artifact_registry", project, location, repo))
     logger.info("Artifact Registry 리포를 생성했습니다: %s", repo)
 
 
+def _ensure_docker_auth(cfg: DeployConfig) -> None:
+    """
+    Artifact Registry 호스트(<region>-docker.pkg.dev)에 대한 docker 자격 증명 헬퍼를 등록한다.
+    같은 호스트는 프로세스당 한 번만 실행한다.
+    """
+    host = cfg.ar_hostname
+    with _configured_registries_lock:
+        if host in _configured_registries:
+            return
+        _run(
+            ["gcloud", "auth", "configure-docker", host, "--quiet"],
+            timeout=cfg.gcloud_run_deploy_timeout_seconds,
+            stream_output=False,
+            spinner_message="docker 인증 설정 중",
+        )
+        _configured_registries.add(host)
+
+
+class UnsupportedIgnorePatternError(ValueError):
+    """ignore 파일에 해석할 수 없는 패턴이 있어 업로드/빌드될 파일 목록을 확정할 수 없을 때."""
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    # 패턴의 경로 구성요소 수 (.dockerignore 의 상위 디렉터리 매칭에 사용)
+    depth: int
+    # 끝이 '/' 인 패턴 (.gcloudignore 에서 디렉터리에만 매칭)
+    dir_only: bool = False
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Docker(moby patternmatcher) 규칙으로 glob 을 정규식 본문으로 바꾼다.
+    '*' / '?' 는 '/' 를 넘지 않고, '**' 는 0 개 이상의 디렉터리와 매칭된다.
+    """
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "*":
+            if i + 1 < n and pattern[i + 1] == "*":
+                i += 2
+                # '**/' 는 '**' 와 같게 취급한다.
+                if i < n and pattern[i] == "/":
+                    i += 1
+                out.append(".*" if i >= n else "(?:.*/)?")
+                continue
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        elif ch == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1 : i + 2] in ("!", "^") else i + 1)
+            if end < 0:
+                raise UnsupportedIgnorePatternError(f"닫히지 않은 문자 클래스: {pattern!r}")
+            body = pattern[i + 1 : end]
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            out.append("[" + body + "]")
+            i = end
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+def _docker_ignore_rules(context_dir: str) -> list[_IgnoreRule]:
+    """
+    .dockerignore 를 Docker 와 같은 규칙으로 읽는다.
+    (패턴은 컨텍스트 루트 기준, '!' 는 예외, 뒤에 나온 패턴이 우선)
+    """
+    try:
+        with open(os.path.join(context_dir, ".dockerignore"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    rules: list[_IgnoreRule] = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:].strip()
+        pattern = posixpath.normpath(line.replace(os.sep, "/")).lstrip("/")
+        if not pattern or pattern == ".":
+            continue
+        try:
+            regex = re.compile("^" + _glob_to_regex(pattern) + "$")
+        except re.error as e:
+            raise UnsupportedIgnorePatternError(f".dockerignore 패턴을 해석할 수 없습니다: {line!r} ({e})") from e
+        rules.append(_IgnoreRule(regex=regex, negate=negate, depth=pattern.count("/") + 1))
+    return rules
+
+
+def _docker_excluded(rel_path: str, rules: list[_IgnoreRule]) -> bool:
+    """
+    Docker 가 rel_path 를 빌드 컨텍스트에서 제외하는지 여부.
+    경로 자체나 (패턴과 깊이가 같은) 상위 디렉터리가 매칭되면 해당 패턴을 적용하고, 마지막 매칭이 우선한다.
+    """
+    parts = rel_path.split("/")
+    excluded = False
+    for rule in rules:
+        matched = rule.regex.match(rel_path) is not None
+        if not matched and rule.depth < len(parts):
+            matched = rule.regex.match("/".join(parts[: rule.depth])) is not None
+        if matched:
+            excluded = not rule.negate
+    return excluded
+
+
+# .dockerignore 로 제외해도 Docker 가 항상 읽는 파일 (빌드 결과에 영향을 준다)
+_DOCKER_ALWAYS_SENT = frozenset({"Dockerfile", ".dockerignore"})
+
+
+def _iter_docker_context_files(context_dir: str) -> Iterator[tuple[str, str]]:
+    """docker build 가 컨텍스트로 보내는 (상대 경로, 실제 경로) 를 경로 순으로 돌려준다."""
+    rules = _docker_ignore_rules(context_dir)
+    # 예외 패턴이 있으면 제외된 디렉터리 안에서도 다시 포함되는 파일이 있을 수 있으므로 내려가 본다.
+    prune = not any(rule.negate for rule in rules)
+    for root, dirnames, filenames in os.walk(context_dir):
+        rel_root = os.path.relpath(root, context_dir).replace(os.sep, "/")
+        rel_root = "" if rel_root == "." else rel_root + "/"
+        dirnames.sort()
+        if prune:
+            dirnames[:] = [d for d in dirnames if not _docker_excluded(rel_root + d, rules)]
+        for filename in sorted(filenames):
+            rel_path = rel_root + filename
+            if rel_path in _DOCKER_ALWAYS_SENT or not _docker_excluded(rel_path, rules):
+                yield rel_path, os.path.join(root, filename)
+
+
+def _gcloud_ignore_rules(context_dir: str) -> list[_IgnoreRule]:
+    """
+    gcloud builds submit 과 같은 규칙으로 .gcloudignore 를 읽는다.
+    파일이 없으면 gcloud 의 기본 규칙(.gcloudignore, .git, .gitignore 와 .gitignore 의 내용)을 쓴다.
+    """
+    try:
+        with open(os.path.join(context_dir, ".gcloudignore"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        lines = [".gcloudignore", ".git", ".gitignore"]
+        if os.path.isfile(os.path.join(context_dir, ".gitignore")):
+            lines.append("#!include:.gitignore")
+    return _parse_gcloud_ignore_lines(context_dir, lines, frozenset({".gcloudignore"}))
+
+
+def _parse_gcloud_ignore_lines(context_dir: str, lines: list[str], seen: frozenset[str]) -> list[_IgnoreRule]:
+    """
+    .gitignore 문법의 줄들을 규칙으로 바꾼다.
+    ('/' 가 들어간 패턴만 루트 기준, 끝의 '/' 는 디렉터리 전용, '!' 는 예외, '#!include:' 는 다른 파일 포함)
+    """
+    rules: list[_IgnoreRule] = []
+    for line in lines:
+        if line.startswith("#!include:"):
+            name = line[len("#!include:") :].strip()
+            if name in seen:
+                raise UnsupportedIgnorePatternError(f".gcloudignore include 가 순환합니다: {name}")
+            try:
+                with open(os.path.join(context_dir, name), encoding="utf-8") as f:
+                    included = f.read().splitlines()
+            except OSError as e:
+                raise UnsupportedIgnorePatternError(f".gcloudignore 가 포함하는 파일을 읽을 수 없습니다: {name} ({e})") from e
+            rules.extend(_parse_gcloud_ignore_lines(context_dir, included, seen | {name}))
+            continue
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        if line.endswith("\\"):
+            # 이스케이프된 끝 공백은 지원하지 않는다.
+            raise UnsupportedIgnorePatternError(f".gcloudignore 패턴을 해석할 수 없습니다: {line!r}")
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        pattern = line.rstrip("/")
+        if not pattern:
+            continue
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        try:
+            regex = re.compile(("^" if anchored else "^(?:.*/)?") + _glob_to_regex(pattern) + "$")
+        except re.error as e:
+            raise UnsupportedIgnorePatternError(f".gcloudignore 패턴을 해석할 수 없습니다: {line!r} ({e})") from e
+        rules.append(
+            _IgnoreRule(regex=regex, negate=negate, depth=pattern.count("/") + 1, dir_only=dir_only)
+        )
+    return rules
+
+
+def _gcloud_excluded(rel_path: str, is_dir: bool, rules: list[_IgnoreRule]) -> bool:
+    """gcloud 가 rel_path 를 업로드에서 제외하는지 여부. (마지막 매칭이 우선)"""
+    excluded = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.regex.match(rel_path) is not None:
+            excluded = not rule.negate
+    return excluded
+
+
+def _iter_gcloud_upload_files(context_dir: str) -> Iterator[tuple[str, str]]:
+    """
+    gcloud builds submit 이 업로드하는 (상대 경로, 실제 경로) 를 경로 순으로 돌려준다.
+    .gitignore 처럼 제외된 디렉터리 안의 파일은 '!' 로도 다시 포함되지 않는다.
+    """
+    rules = _gcloud_ignore_rules(context_dir)
+    for root, dirnames, filenames in os.walk(context_dir):
+        rel_root = os.path.relpath(root, context_dir).replace(os.sep, "/")
+        rel_root = "" if rel_root == "." else rel_root + "/"
+        dirnames[:] = sorted(d for d in dirnames if not _gcloud_excluded(rel_root + d, True, rules))
+        for filename in sorted(filenames):
+            rel_path = rel_root + filename
+            if not _gcloud_excluded(rel_path, False, rules):
+                yield rel_path, os.path.join(root, filename)
+
+
+def _write_source_archive(context_dir: str, archive_path: str) -> str:
+    """
+    context_dir 를 재현 가능한 tar.gz 로 묶고 그 SHA256 을 반환한다.
+
+    파일 순서/mtime/소유자 정보를 고정하므로 내용이 같으면 해시도 같다.
+    .gcloudignore 를 해석할 수 없으면 UnsupportedIgnorePatternError 를 발생시킨다.
+    """
+    import gzip
+    import tarfile
+
+    def _normalize(info: tarfile.TarInfo) -> tarfile.TarInfo:
+        info.mtime = 0
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        return info
+
+    with open(archive_path, "wb") as raw, gzip.GzipFile(
+        filename="", mode="wb", fileobj=raw, mtime=0
+    ) as gz, tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for rel_path, full_path in _iter_gcloud_upload_files(context_dir):
+            tar.add(full_path, arcname=rel_path, recursive=False, filter=_normalize)
+
+    digest = hashlib.sha256()
+    with open(archive_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stage_source(cfg: DeployConfig, context_dir: str) -> str:
+    """
+    소스 아카이브를 CLOUD_BUILD_STAGING_BUCKET 의 src/<sha256>.tgz 로 올리고 gs:// 경로를 반환한다.
+    같은 해시의 객체가 이미 있으면 업로드를 건너뛴다.
+    .gcloudignore 를 gcloud 와 똑같이 해석할 수 없으면 context_dir 를 그대로 돌려준다. (gcloud 가 직접 업로드)
+    """
+    import tempfile
+
+    from .gcp_gcs import storage_client
+
+    fd, archive_path = tempfile.mkstemp(suffix=".tgz", prefix="deploy-src-")
+    os.close(fd)
+    try:
+        try:
+            source_hash = _write_source_archive(context_dir, archive_path)
+        except UnsupportedIgnorePatternError as e:
+            logger.warning("소스 아카이브를 만들 수 없어 gcloud 업로드로 진행합니다: %s", e)
+            return context_dir
+        object_name = f"src/{source_hash}.tgz"
+        blob = storage_client(cfg.gcp_project_id).bucket(cfg.cloud_build_staging_bucket).blob(object_name)
+        if blob.exists():
+            logger.info("소스 변경이 없어 기존 스테이징 아카이브를 재사용합니다: %s", object_name)
+        else:
+            logger.info("소스 아카이브 업로드: gs://%s/%s", cfg.cloud_build_staging_bucket, object_name)
+            blob.upload_from_filename(archive_path, content_type="application/gzip")
+    finally:
+        os.unlink(archive_path)
+    return f"gs://{cfg.cloud_build_staging_bucket}/{object_name}"
+
+
+def _context_digest(context_dir: str) -> str:
+    """
+    docker 빌드 컨텍스트(.dockerignore 규칙 적용)의 경로/실행 권한/내용으로 SHA256 을 계산한다.
+    mtime 은 포함하지 않으므로 내용이 같으면 digest 도 같다.
+    .dockerignore 를 해석할 수 없으면 UnsupportedIgnorePatternError 를 발생시킨다.
+    """
+    digest = hashlib.sha256()
+    for rel_path, full_path in _iter_docker_context_files(context_dir):
+        executable = os.access(full_path, os.X_OK)
+        digest.update(f"{rel_path}\0{int(executable)}\0".encode("utf-8"))
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _package_path(cfg: DeployConfig, package: str) -> str:
+    """Artifact Registry 패키지(이미지) 리소스 경로. (패키지 이름의 '/' 는 인코딩한다)"""
+    from urllib.parse import quote
+
+    return f"{_repository_path(cfg)[1]}/packages/{quote(package, safe='')}"
+
+
+def _set_tag(client, cfg: DeployConfig, package_path: str, tag_id: str, version: str) -> None:
+    """package_path 의 tag_id 가 version 을 가리키도록 갱신한다. (없으면 생성)"""
+    from google.api_core.exceptions import NotFound
+    from google.cloud import artifactregistry_v1
+    from google.protobuf import field_mask_pb2
+
+    tag = artifactregistry_v1.Tag(name=f"{package_path}/tags/{tag_id}", version=version)
+    try:
+        _ar_rate_limiter(cfg).acquire()
+        client.update_tag(tag=tag, update_mask=field_mask_pb2.FieldMask(paths=["version"]))
+    except NotFound:
+        _ar_rate_limiter(cfg).acquire()
+        client.create_tag(parent=package_path, tag_id=tag_id, tag=tag)
+
+
+def _promote_digest_tag(cfg: DeployConfig, package: str, digest_tag: str) -> bool:
+    """
+    같은 소스로 빌드한 이미지(:<digest_tag>)가 이미 있으면 :latest 를 그 버전으로 옮기고 True.
+    없거나 확인할 수 없으면 False (호출자는 평소처럼 빌드한다).
+    """
+    from google.api_core.exceptions import GoogleAPICallError, NotFound
+    from google.auth.exceptions import DefaultCredentialsError
+
+    try:
+        client = _ar_client()
+        package_path = _package_path(cfg, package)
+        _ar_rate_limiter(cfg).acquire()
+        existing = client.get_tag(name=f"{package_path}/tags/{digest_tag}")
+        _set_tag(client, cfg, package_path, "latest", existing.version)
+        return True
+    except NotFound:
+        return False
+    except (GoogleAPICallError, DefaultCredentialsError) as e:
+        logger.warning("소스 digest 태그 확인 실패, 이미지를 새로 빌드합니다: %s", e)
+        return False
+
+
+# docker push / Cloud Build 로그의 "latest: digest: sha256:... size: ..." 줄
+_PUSHED_DIGEST_RE = re.compile(r"digest: (sha256:[0-9a-f]{64})")
+
+
+def _pushed_digest(result: RunResult) -> str | None:
+    """푸시 명령 출력에서 실제로 올라간 manifest digest 를 찾는다. (없으면 None)"""
+    matches = _PUSHED_DIGEST_RE.findall(f"{result.stdout}\n{result.stderr}")
+    return matches[-1] if matches else None
+
+
+def _record_digest_tag(cfg: DeployConfig, package: str, digest_tag: str, pushed_digest: str | None) -> None:
+    """
+    이번에 푸시한 이미지(pushed_digest)에 :<digest_tag> 를 붙인다. (실패해도 배포는 계속)
+
+    :latest 를 다시 조회하지 않는다. 그 사이 다른 배포가 :latest 를 옮겼다면
+    이 소스의 digest 태그가 다른 이미지에 붙어 이후 배포가 엉뚱한 이미지를 재사용하게 된다.
+    """
+    from google.api_core.exceptions import GoogleAPICallError
+    from google.auth.exceptions import DefaultCredentialsError
+
+    if pushed_digest is None:
+        logger.warning("푸시한 이미지의 digest 를 확인할 수 없어 소스 digest 태그(%s)를 남기지 않습니다.", digest_tag)
+        return
+    try:
+        client = _ar_client()
+        package_path = _package_path(cfg, package)
+        _set_tag(client, cfg, package_path, digest_tag, f"{package_path}/versions/{pushed_digest}")
+    except (GoogleAPICallError, DefaultCredentialsError) as e:
+        logger.warning("소스 digest 태그(%s) 기록 실패: %s", digest_tag, e)
+
+
 def build_and_push_image(cfg: DeployConfig, service: str, image_name: str, context_dir: str = ".") -> str:
     """
     로컬에서 도커 이미지를 빌드하고 Artifact Registry 에 푸시한 뒤,
@@ -111,13 +623,12 @@ def build_and_push_image(cfg: DeployConfig, service: str, image_name: str, conte
         package = cfg.backend_image_package
     elif service == "etl" and cfg.etl_image_package:
         package = cfg.etl_image_package
-    elif service == "frontend" and getattr(cfg, "frontend_image_package", None):
-        # DeployConfig 에 frontend_image_package 가 없던 구버전과의 호환을 위해 getattr 사용
-        package = str(getattr(cfg, "frontend_image_package"))
+    elif service == "frontend" and cfg.frontend_image_package:
+        package = cfg.frontend_image_package
     else:
         package = service
 
-    image_url = f"{cfg.gcp_region}-docker.pkg.dev/{cfg.gcp_project_id}/{cfg.artifact_registry_repo}/{package}:latest"
+    image_url = f"{cfg.registry_prefix}/{package}:latest"
 
     mode = (cfg.backend_build_mode or "local_docker").lower()
     logger.info(
@@ -128,17 +639,50 @@ def build_and_push_image(cfg: DeployConfig, service: str, image_name: str, conte
         image_name,
     )
 
+    # 소스가 바뀌지 않았으면(같은 digest 태그의 이미지가 있으면) 빌드/푸시를 건너뛴다.
+    digest_tag: str | None = None
+    if mode in ("local_docker", "cloud_build") and not cfg.prefer_gcloud:
+        try:
+            digest_tag = f"sha-{_context_digest(context_dir)[:12]}"
+        except UnsupportedIgnorePatternError as e:
+            # 컨텍스트를 확정할 수 없으면 오래된 이미지를 재사용하지 않도록 항상 빌드한다.
+            logger.warning("소스 digest 를 계산할 수 없어 빌드 생략 없이 진행합니다: %s", e)
+        if digest_tag is not None and _promote_digest_tag(cfg, package, digest_tag):
+            logger.info(
+                "소스 변경이 없어 빌드를 건너뜁니다: %s (service=%s, %s -> latest)",
+                image_name,
+                service,
+                digest_tag,
+            )
+            return image_url
+
     if mode == "local_docker":
         # 로컬 Docker 사용
-        build_cmd = ["docker", "build", "-t", image_url, context_dir]
+        # - BuildKit + inline cache: 레지스트리에 있는 직전 이미지(:latest)의 레이어를 캐시로 재사용한다.
+        #   (첫 배포처럼 이미지가 없으면 cache-from 은 경고만 남기고 무시된다)
+        build_cmd = [
+            "docker",
+            "build",
+            f"--cache-from={image_url}",
+            "--build-arg",
+            "BUILDKIT_INLINE_CACHE=1",
+            "-t",
+            image_url,
+            context_dir,
+        ]
         push_cmd = ["docker", "push", image_url]
-        _run(
-            build_cmd,
-            timeout=cfg.backend_build_subprocess_timeout_seconds,
-            stream_output=cfg.cli_stream_subprocess_output,
-            spinner_message="Docker 이미지 빌드 중",
-        )
-        _run(
+        # --cache-from 조회와 push 모두 레지스트리 인증이 필요하다.
+        _ensure_docker_auth(cfg)
+        with _DOCKER_BUILD_LOCK:
+            _run(
+                build_cmd,
+                timeout=cfg.backend_build_subprocess_timeout_seconds,
+                stream_output=cfg.cli_stream_subprocess_output,
+                spinner_message="Docker 이미지 빌드 중",
+                env={**os.environ, "DOCKER_BUILDKIT": "1"},
+            )
+        _ar_rate_limiter(cfg).acquire()
+        push_result = _run(
             push_cmd,
             timeout=cfg.backend_build_subprocess_timeout_seconds,
             stream_output=cfg.cli_stream_subprocess_output,
@@ -147,16 +691,18 @@ def build_and_push_image(cfg: DeployConfig, service: str, image_name: str, conte
     elif mode == "cloud_build":
         # Cloud Build 사용 (gcloud builds submit)
         cloud_timeout = max(int(cfg.cloud_build_timeout_seconds), 1)
+        # 스테이징 버킷이 있으면 해시로 식별되는 GCS 아카이브를 소스로 넘겨 재업로드를 피한다.
+        source = _stage_source(cfg, context_dir) if cfg.cloud_build_staging_bucket else context_dir
         build_cmd = [
             "gcloud",
             "builds",
             "submit",
-            context_dir,
+            source,
             f"--tag={image_url}",
             f"--timeout={cloud_timeout}s",
-            f"--project={cfg.gcp_project_id}",
+            cfg.project_flag,
         ]
-        _run(
+        push_result = _run(
             build_cmd,
             timeout=cfg.backend_build_subprocess_timeout_seconds,
             stream_output=cfg.cli_stream_subprocess_output,
@@ -165,7 +711,9 @@ def build_and_push_image(cfg: DeployConfig, service: str, image_name: str, conte
     else:
         raise ValueError(f"알 수 없는 BACKEND_BUILD_MODE 값입니다: {cfg.backend_build_mode!r} (local_docker | cloud_build 중 하나)")
 
-    logger.info("이미지 빌드/푸시 완료: %s -> %s", image_name, image_url)
+    if digest_tag is not None:
+        _record_digest_tag(cfg, package, digest_tag, _pushed_digest(push_result))
+    logger.info("이미지 빌드/푸시 완료: %s (service=%s) -> %s", image_name, service, image_url)
     return image_url
 
 
@@ -173,6 +721,34 @@ def check_repository(cfg: DeployConfig) -> str:
     """
     Artifact Registry 리포지토리 존재 여부를 확인만 하고, 생성하지 않는다.
     """
+    key = ("artifact_registry", cfg.gcp_project_id, cfg.gcp_region, cfg.artifact_registry_repo)
+    return check_cache.cached_check(key, lambda: _probe_repository(cfg))
+
+
+def _probe_repository(cfg: DeployConfig) -> str:
+    """check_repository 의 실제 조회. (Python 클라이언트, 필요 시 gcloud)"""
+    if cfg.prefer_gcloud:
+        return _probe_repository_gcloud(cfg)
+
+    from google.api_core.exceptions import NotFound
+    from google.auth.exceptions import DefaultCredentialsError
+
+    repo = cfg.artifact_registry_repo
+    try:
+        client = _ar_client()
+    except DefaultCredentialsError:
+        return _probe_repository_gcloud(cfg)
+
+    try:
+        _ar_rate_limiter(cfg).acquire()
+        client.get_repository(name=_repository_path(cfg)[1])
+        return f"Artifact Registry: 리포지토리 존재함 ({repo})"
+    except NotFound:
+        return f"Artifact Registry: 리포지토리 없음 (생성이 필요함) ({repo})"
+
+
+def _probe_repository_gcloud(cfg: DeployConfig) -> str:
+    """check_repository 의 gcloud describe 구현."""
     repo = cfg.artifact_registry_repo
     location = cfg.gcp_region
     project = cfg.gcp_project_id
@@ -189,16 +765,17 @@ def check_repository(cfg: DeployConfig) -> str:
     ]
 
     try:
+        _ar_rate_limiter(cfg).acquire()
         result = run_command(
             describe_cmd,
             timeout=cfg.gcloud_run_deploy_timeout_seconds,
             stream_output=False,
             spinner_message=None,
         )
-        if result.stdout:
+        if result.stdout and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Artifact Registry describe stdout: %s",
-                shorten(result.stdout.strip(), width=2000),
+                _fast_truncate(result.stdout.strip(), 2000),
             )
         return f"Artifact Registry: 리포지토리 존재함 ({repo})"
     except RuntimeError as e:
@@ -7,15 +7,32 @@ BigQuery 데이터셋 및 권한 설정을 담당하는 모듈.
 
 from __future__ import annotations
 
+import threading
+
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 
+from . import check_cache
 from .config import DeployConfig
 from .logging_utils import get_logger
 
 
 logger = get_logger(__name__)
 
+# 프로젝트별 bigquery.Client 캐시 (인증/커넥션 초기화 비용을 한 번만 치르기 위함)
+_bq_clients: dict[str, bigquery.Client] = {}
+_bq_clients_lock = threading.Lock()
+
+
+def _bq_client(project_id: str) -> bigquery.Client:
+    """project_id 별로 하나의 bigquery.Client 를 만들어 재사용한다."""
+    with _bq_clients_lock:
+        client = _bq_clients.get(project_id)
+        if client is None:
+            client = bigquery.Client(project=project_id)
+            _bq_clients[project_id] = client
+        return client
+
 
 def ensure_bigquery_resources(cfg: DeployConfig) -> None:
     """
@@ -41,7 +58,7 @@ def ensure_bigquery_resources(cfg: DeployConfig) -> None:
         dataset_id,
     )
 
-    client = bigquery.Client(project=project_id)
+    client = _bq_client(project_id)
 
     try:
         client.get_dataset(full_dataset_id)
@@ -50,6 +67,7 @@ def ensure_bigquery_resources(cfg: DeployConfig) -> None:
         dataset = bigquery.Dataset(full_dataset_id)
         dataset.location = cfg.gcp_region
         client.create_dataset(dataset, exists_ok=True)
+        check_cache.invalidate(("bq", full_dataset_id))
         logger.info("BigQuery 데이터셋을 생성했습니다: %s", full_dataset_id)
 
 
@@ -67,12 +85,14 @@ def check_bigquery_resources(cfg: DeployConfig) -> str:
     dataset_id = cfg.bigquery_dataset_id
     full_dataset_id = f"{project_id}.{dataset_id}"
 
-    client = bigquery.Client(project=project_id)
+    def _probe() -> str:
+        client = _bq_client(project_id)
+        try:
+            client.get_dataset(full_dataset_id)
+            return f"BigQuery: 데이터셋 존재함 ({full_dataset_id})"
+        except NotFound:
+            return f"BigQuery: 데이터셋 없음 (생성이 필요함) ({full_dataset_id})"
 
-    try:
-        client.get_dataset(full_dataset_id)
-        return f"BigQuery: 데이터셋 존재함 ({full_dataset_id})"
-    except NotFound:
-        return f"BigQuery: 데이터셋 없음 (생성이 필요함) ({full_dataset_id})"
+    return check_cache.cached_check(("bq", full_dataset_id), _probe)
 
 
@@ -7,6 +7,10 @@ Cloud Run 서비스 및 Cloud Run Job 배포 책임을 가지는 모듈.
 
 from __future__ import annotations
 
+import json
+import os
+import tempfile
+
 from .config import DeployConfig
 from .logging_utils import get_logger
 from .subprocess_utils import run_command
@@ -15,22 +19,18 @@ from .subprocess_utils import run_command
 logger = get_logger(__name__)
 
 
-def _build_backend_env(cfg: DeployConfig) -> dict:
-    """
-    DeployConfig.backend_service_env 에 담긴 값들에서
-    인프라용 키들을 제외하고, Cloud Run 서비스에 전달할 env dict 를 만든다.
-    """
-    if not cfg.backend_service_env:
-        return {}
-
-    # 인프라/토글용으로 사용하는 환경변수 키 목록
-    infra_keys = {
+# 인프라/토글용으로 사용하는 환경변수 키 목록 (Cloud Run 서비스 env 에서 제외)
+_INFRA_KEYS: frozenset[str] = frozenset(
+    {
         "GCP_PROJECT_ID",
         "GCP_REGION",
         "DEPLOY_SERVICE_ACCOUNT_EMAIL",
         "ARTIFACT_REGISTRY_REPO",
         "BACKEND_SERVICE_NAME",
         "BACKEND_BUILD_MODE",
+        "PREFER_GCLOUD",
+        "AR_API_RATE_LIMIT",
+        "CLOUD_BUILD_STAGING_BUCKET",
         "BACKEND_ALLOW_UNAUTHENTICATED",
         "BACKEND_IMAGE_NAME",
         "FRONTEND_IMAGE_NAME",
@@ -64,23 +64,51 @@ def _build_backend_env(cfg: DeployConfig) -> dict:
         "FIREBASE_HOSTING_SITE",
         "SECRET_PREFIX",
     }
+)
 
-    env: dict[str, str] = {}
-    for k, v in cfg.backend_service_env.items():
-        if k in infra_keys:
-            continue
-        # Secret Manager 에서 관리할 민감한 값들은 .env.secrets 쪽으로 보내는 것을 권장.
-        env[k] = v
-    return env
 
+def _build_backend_env(cfg: DeployConfig) -> dict:
+    """
+    DeployConfig.backend_service_env 에 담긴 값들에서
+    인프라용 키들을 제외하고, Cloud Run 서비스에 전달할 env dict 를 만든다.
+    """
+    if not cfg.backend_service_env:
+        return {}
+
+    # Secret Manager 에서 관리할 민감한 값들은 .env.secrets 쪽으로 보내는 것을 권장.
+    return {k: v for k, v in cfg.backend_service_env.items() if k not in _INFRA_KEYS}
 
-def _run_gcloud(cfg: DeployConfig, cmd: list[str], *, spinner_message: str) -> None:
-    run_command(
-        cmd,
-        timeout=cfg.gcloud_run_deploy_timeout_seconds,
-        stream_output=cfg.cli_stream_subprocess_output,
-        spinner_message=None if cfg.cli_stream_subprocess_output else spinner_message,
-    )
+
+def _run_gcloud(
+    cfg: DeployConfig,
+    cmd: list[str],
+    *,
+    spinner_message: str,
+    env_vars: dict[str, str] | None = None,
+) -> None:
+    """
+    gcloud run 명령 실행 래퍼.
+
+    env_vars 가 있으면 임시 파일에 써서 --env-vars-file 로 전달한다.
+    (--set-env-vars 의 쉼표/등호 이스케이프 문제와 명령행 길이 제한을 피하기 위함.
+    JSON 은 YAML 의 부분집합이므로 gcloud 가 그대로 읽는다)
+    """
+    env_file: str | None = None
+    if env_vars:
+        fd, env_file = tempfile.mkstemp(suffix=".yaml", prefix="deploy-env-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(env_vars, f, ensure_ascii=False)
+        cmd = [*cmd, f"--env-vars-file={env_file}"]
+    try:
+        run_command(
+            cmd,
+            timeout=cfg.gcloud_run_deploy_timeout_seconds,
+            stream_output=cfg.cli_stream_subprocess_output,
+            spinner_message=None if cfg.cli_stream_subprocess_output else spinner_message,
+        )
+    finally:
+        if env_file is not None:
+            os.unlink(env_file)
 
 
 def deploy_backend_service(cfg: DeployConfig, image_url: str) -> None:
@@ -91,27 +119,19 @@ def deploy_backend_service(cfg: DeployConfig, image_url: str) -> None:
     # 인프라에서 정한 Cloud Run 서비스 이름
     service_name = cfg.backend_service_name
 
-    env_arg = ""
-    if service_env:
-        pairs = [f"{k}={v}" for k, v in service_env.items()]
-        env_arg = ",".join(pairs)
-
     cmd = [
         "gcloud",
         "run",
         "deploy",
         service_name,
         f"--image={image_url}",
-        f"--region={cfg.gcp_region}",
-        f"--project={cfg.gcp_project_id}",
+        cfg.region_flag,
+        cfg.project_flag,
         f"--service-account={cfg.deploy_sa_email}",
         "--platform=managed",
         "--quiet",
     ]
 
-    if env_arg:
-        cmd.append(f"--set-env-vars={env_arg}")
-
     if cfg.backend_allow_unauthenticated:
         cmd.append("--allow-unauthenticated")
     else:
@@ -125,7 +145,7 @@ def deploy_backend_service(cfg: DeployConfig, image_url: str) -> None:
         cfg.backend_allow_unauthenticated,
     )
 
-    _run_gcloud(cfg, cmd, spinner_message="Cloud Run 서비스 배포 중")
+    _run_gcloud(cfg, cmd, spinner_message="Cloud Run 서비스 배포 중", env_vars=service_env)
 
 
 def deploy_etl_job(cfg: DeployConfig, image_url: str) -> None:
@@ -137,11 +157,6 @@ def deploy_etl_job(cfg: DeployConfig, image_url: str) -> None:
     job_name = f"{cfg.backend_service_name}-etl"
     service_env = _build_backend_env(cfg)
 
-    env_arg = ""
-    if service_env:
-        pairs = [f"{k}={v}" for k, v in service_env.items()]
-        env_arg = ",".join(pairs)
-
     cmd = [
         "gcloud",
         "run",
@@ -149,16 +164,13 @@ def deploy_etl_job(cfg: DeployConfig, image_url: str) -> None:
         "deploy",
         job_name,
         f"--image={image_url}",
-        f"--region={cfg.gcp_region}",
-        f"--project={cfg.gcp_project_id}",
+        cfg.region_flag,
+        cfg.project_flag,
         f"--service-account={cfg.deploy_sa_email}",
         "--platform=managed",
         "--quiet",
     ]
 
-    if env_arg:
-        cmd.append(f"--set-env-vars={env_arg}")
-
     logger.info(
         "Cloud Run Job 배포: job=%s, image=%s, env_keys=%s",
         job_name,
@@ -166,7 +178,7 @@ def deploy_etl_job(cfg: DeployConfig, image_url: str) -> None:
         sorted(service_env.keys()),
     )
 
-    _run_gcloud(cfg, cmd, spinner_message="Cloud Run Job 배포 중")
+    _run_gcloud(cfg, cmd, spinner_message="Cloud Run Job 배포 중", env_vars=service_env)
 
 
 def _build_frontend_env(cfg: DeployConfig) -> dict[str, str]:
@@ -201,27 +213,19 @@ def deploy_frontend_service(cfg: DeployConfig, image_url: str) -> None:
     service_name = cfg.frontend_service_name
     service_env = _build_frontend_env(cfg)
 
-    env_arg = ""
-    if service_env:
-        pairs = [f"{k}={v}" for k, v in service_env.items()]
-        env_arg = ",".join(pairs)
-
     cmd = [
         "gcloud",
         "run",
         "deploy",
         service_name,
         f"--image={image_url}",
-        f"--region={cfg.gcp_region}",
-        f"--project={cfg.gcp_project_id}",
+        cfg.region_flag,
+        cfg.project_flag,
         f"--service-account={cfg.deploy_sa_email}",
         "--platform=managed",
         "--quiet",
     ]
 
-    if env_arg:
-        cmd.append(f"--set-env-vars={env_arg}")
-
     if cfg.frontend_allow_unauthenticated:
         cmd.append("--allow-unauthenticated")
     else:
@@ -235,4 +239,4 @@ def deploy_frontend_service(cfg: DeployConfig, image_url: str) -> None:
         cfg.frontend_allow_unauthenticated,
     )
 
-    _run_gcloud(cfg, cmd, spinner_message="Cloud Run 프론트 서비스 배포 중")
+    _run_gcloud(cfg, cmd, spinner_message="Cloud Run 프론트 서비스 배포 중", env_vars=service_env)
@@ -7,14 +7,68 @@ GCS 버킷 및 prefix 구성을 담당하는 모듈.
 
 from __future__ import annotations
 
+import threading
+
 from google.cloud import storage
 
+from . import check_cache
 from .config import DeployConfig
 from .logging_utils import get_logger
 
 
 logger = get_logger(__name__)
 
+# 프로젝트별 storage.Client 캐시 (인증/커넥션 초기화 비용을 한 번만 치르기 위함)
+_storage_clients: dict[str, storage.Client] = {}
+_storage_clients_lock = threading.Lock()
+
+
+def storage_client(project_id: str) -> storage.Client:
+    """project_id 별로 하나의 storage.Client 를 만들어 재사용한다. (다른 모듈도 이 클라이언트를 공유한다)"""
+    with _storage_clients_lock:
+        client = _storage_clients.get(project_id)
+        if client is None:
+            client = storage.Client(project=project_id)
+            _storage_clients[project_id] = client
+        return client
+
+
+# 버킷 존재 확인용 JSON API 엔드포인트 / 인증 세션 (TCP/TLS 연결을 프로브 간에 재사용)
+_BUCKET_URL = "https://storage.googleapis.com/storage/v1/b/{}"
+_READ_ONLY_SCOPES = ("https://www.googleapis.com/auth/devstorage.read_only",)
+_session = None
+_session_lock = threading.Lock()
+
+
+def _authorized_session():
+    """ADC 기반 AuthorizedSession 을 한 번만 만들어 재사용한다."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import google.auth
+            from google.auth.transport.requests import AuthorizedSession
+
+            credentials, _ = google.auth.default(scopes=_READ_ONLY_SCOPES)
+            _session = AuthorizedSession(credentials)
+        return _session
+
+
+def _bucket_exists(bucket_name: str) -> bool:
+    """
+    storage.buckets.get 을 fields=name 으로 호출해 버킷 존재 여부만 확인한다.
+    404 는 False, 그 밖의 오류 응답은 예외로 전달한다.
+    """
+    resp = _authorized_session().request(
+        "GET",
+        _BUCKET_URL.format(bucket_name),
+        params={"fields": "name"},
+        timeout=30,
+    )
+    if resp.status_code == 404:
+        return False
+    resp.raise_for_status()
+    return True
+
 
 def ensure_gcs_bucket(cfg: DeployConfig) -> None:
     """
@@ -32,15 +86,15 @@ def ensure_gcs_bucket(cfg: DeployConfig) -> None:
     bucket_name = cfg.gcs_bucket_name
     logger.info("GCS 버킷 확인: %s (prefix=%s)", bucket_name, cfg.gcs_prefix)
 
-    client = storage.Client(project=cfg.gcp_project_id)
-    bucket = client.bucket(bucket_name)
-
-    if bucket.exists():
+    if _bucket_exists(bucket_name):
         logger.info("기존 GCS 버킷을 사용합니다: %s", bucket_name)
         return
 
+    client = storage_client(cfg.gcp_project_id)
+    bucket = client.bucket(bucket_name)
     bucket.location = cfg.gcp_region
     client.create_bucket(bucket)
+    check_cache.invalidate(("gcs", cfg.gcp_project_id, bucket_name))
     logger.info("GCS 버킷을 생성했습니다: %s (location=%s)", bucket_name, cfg.gcp_region)
 
 
@@ -54,12 +108,13 @@ def check_gcs_bucket(cfg: DeployConfig) -> str:
     if not cfg.gcs_bucket_name:
         return "GCS: GCS_BUCKET_NAME 이 설정되지 않았습니다."
 
-    client = storage.Client(project=cfg.gcp_project_id)
-    bucket = client.bucket(cfg.gcs_bucket_name)
-    exists = bucket.exists()
+    bucket_name = cfg.gcs_bucket_name
+
+    def _probe() -> str:
+        if _bucket_exists(bucket_name):
+            return f"GCS: 버킷 존재함 ({bucket_name})"
+        return f"GCS: 버킷 없음 (생성이 필요함) ({bucket_name})"
 
-    if exists:
-        return f"GCS: 버킷 존재함 ({cfg.gcs_bucket_name})"
-    return f"GCS: 버킷 없음 (생성이 필요함) ({cfg.gcs_bucket_name})"
+    return check_cache.cached_check(("gcs", cfg.gcp_project_id, bucket_name), _probe)
 
 
@@ -7,7 +7,14 @@ GCP 프로젝트 존재 여부와 필수 API enable 을 담당하는 모듈.
 
 from __future__ import annotations
 
-from .config import DeployConfig
+import functools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Optional
+
+from .config import DeployConfig, Feature
 from .logging_utils import get_logger
 from .subprocess_utils import run_command
 
@@ -15,76 +22,352 @@ from .subprocess_utils import run_command
 logger = get_logger(__name__)
 
 
-REQUIRED_APIS_BASE = [
-    "run.googleapis.com",
-    "artifactregistry.googleapis.com",
-    "secretmanager.googleapis.com",
-]
+REQUIRED_APIS_BASE: frozenset[str] = frozenset(
+    {
+        "run.googleapis.com",
+        "artifactregistry.googleapis.com",
+        "secretmanager.googleapis.com",
+    }
+)
+
+REQUIRED_APIS_CLOUD_BUILD: frozenset[str] = frozenset({"cloudbuild.googleapis.com"})
+REQUIRED_APIS_BQ: frozenset[str] = frozenset({"bigquery.googleapis.com"})
+REQUIRED_APIS_SQL: frozenset[str] = frozenset({"sqladmin.googleapis.com"})
+REQUIRED_APIS_GCS: frozenset[str] = frozenset({"storage.googleapis.com"})
+REQUIRED_APIS_FIREBASE: frozenset[str] = frozenset({"firebase.googleapis.com", "firebaserules.googleapis.com"})
+
+# 기능 토글 -> 추가로 필요한 API
+_API_MATRIX: tuple[tuple[Feature, frozenset[str]], ...] = (
+    (Feature.ENABLE_BIGQUERY, REQUIRED_APIS_BQ),
+    (Feature.ENABLE_CLOUD_SQL, REQUIRED_APIS_SQL),
+    (Feature.ENABLE_GCS, REQUIRED_APIS_GCS),
+    (Feature.ENABLE_FIREBASE, REQUIRED_APIS_FIREBASE),
+)
+
+# project_id -> 이 프로세스에서 이미 활성화를 확인/요청한 API 집합.
+# ensure_project_and_apis 를 여러 번 호출해도 이 집합에 포함된 API 는 다시 조회하지 않는다.
+_ensured_apis: dict[str, frozenset[str]] = {}
+
+# --async 로 요청한 뒤 아직 완료를 확인하지 않은 enable 작업: 작업 이름 -> 해당 작업이 켜는 API
+_pending_api_ops: dict[str, frozenset[str]] = {}
+_pending_api_ops_lock = threading.Lock()
+# apply_all 의 섹션들이 동시에 기다릴 때, 다른 섹션이 이미 가져간 작업이 끝나기 전에
+# 지나가 버리지 않도록 대기 자체를 한 번에 하나씩 한다.
+_api_ops_wait_lock = threading.Lock()
+
+# gcloud services enable --async 출력에서 작업 이름을 찾는다. (예: operations/acat.p2-123-abc)
+_OPERATION_NAME_RE = re.compile(r"operations/[\w.\-]+")
+
+# 대기 중인 enable 작업 하나를 기다리는 기본 시간(초)
+API_OPERATION_WAIT_TIMEOUT_SECONDS = 300.0
+# SDK 경로에서 enable 작업 상태를 다시 조회하기까지의 간격(초)
+_OPERATION_POLL_INTERVAL_SECONDS = 2.0
 
-REQUIRED_APIS_CLOUD_BUILD = ["cloudbuild.googleapis.com"]
-REQUIRED_APIS_BQ = ["bigquery.googleapis.com"]
-REQUIRED_APIS_SQL = ["sqladmin.googleapis.com"]
-REQUIRED_APIS_GCS = ["storage.googleapis.com"]
-REQUIRED_APIS_FIREBASE = ["firebase.googleapis.com", "firebaserules.googleapis.com"]
+# (api, version) -> discovery 클라이언트. ADC 는 한 번만 찾고, 없으면 None 을 저장해 gcloud 로 대체한다.
+_api_clients: dict[tuple[str, str], Any] = {}
+_api_credentials: Any = None
+_adc_missing = False
+_api_clients_lock = threading.Lock()
 
 
-def _run_gcloud(cfg: DeployConfig, cmd: list[str], *, spinner_message: str) -> None:
+def _api_client(cfg: DeployConfig, api: str, version: str) -> Any:
     """
-    gcloud services enable 래퍼.
+    googleapiclient discovery 클라이언트를 (api, version) 별로 한 번만 만들어 재사용한다.
+
+    PREFER_GCLOUD=true 이거나 ADC 가 없으면 None 을 반환하며, 호출 측은 gcloud CLI 로 대체한다.
+    (httplib2 커넥션은 스레드 간에 공유하면 안 되므로, 한 클라이언트는 한 번에 한 스레드에서만 쓴다)
     """
-    # services enable은 출력이 적을 수 있어 stream=false일 때 스피너가 유용하다.
-    run_command(
-        cmd,
-        timeout=cfg.gcloud_run_deploy_timeout_seconds,
-        stream_output=cfg.cli_stream_subprocess_output,
-        spinner_message=None if cfg.cli_stream_subprocess_output else spinner_message,
-    )
+    global _api_credentials, _adc_missing
+    if cfg.prefer_gcloud:
+        return None
+    key = (api, version)
+    with _api_clients_lock:
+        if _adc_missing:
+            return None
+        if key not in _api_clients:
+            import google.auth
+            from google.auth.exceptions import DefaultCredentialsError
+            from googleapiclient import discovery
+
+            if _api_credentials is None:
+                try:
+                    _api_credentials, _ = google.auth.default(
+                        scopes=("https://www.googleapis.com/auth/cloud-platform",)
+                    )
+                except DefaultCredentialsError as e:
+                    logger.warning("ADC 를 찾을 수 없어 gcloud CLI 를 사용합니다: %s", e)
+                    _adc_missing = True
+                    return None
+            _api_clients[key] = discovery.build(
+                api, version, credentials=_api_credentials, cache_discovery=False
+            )
+        return _api_clients[key]
+
 
+def _http_status(error: Exception) -> Optional[int]:
+    """googleapiclient HttpError 의 HTTP 상태 코드."""
+    resp = getattr(error, "resp", None)
+    return getattr(resp, "status", None)
 
-def ensure_project_and_apis(cfg: DeployConfig) -> None:
+
+def _required_apis(cfg: DeployConfig) -> tuple[str, ...]:
+    """설정에 따라 활성화되어 있어야 하는 API 목록 (정렬됨, 캐시된 tuple 을 그대로 공유한다)."""
+    cloud_build = (cfg.backend_build_mode or "").lower() == "cloud_build"
+    return _required_apis_for(cloud_build, cfg.features)
+
+
+@functools.lru_cache(maxsize=16)
+def _required_apis_for(cloud_build: bool, features: Feature) -> tuple[str, ...]:
+    """_required_apis 의 계산 부분. API 목록은 이 두 값으로만 정해지므로 결과를 재사용한다."""
+    apis = set(REQUIRED_APIS_BASE)
+    if cloud_build:
+        apis |= REQUIRED_APIS_CLOUD_BUILD
+    for flag, extra in _API_MATRIX:
+        if flag in features:
+            apis |= extra
+    return tuple(sorted(apis))
+
+
+def ensure_project_and_apis(cfg: DeployConfig, apis: Optional[Iterable[str]] = None) -> None:
     """
     프로젝트가 존재한다고 가정하고,
     필요한 API 들이 enable 되어 있는지 확인/enable 한다.
+
+    apis 를 주면 설정 전체(_required_apis) 대신 그 API 들만 다룬다.
+    빠진 API 는 몇 개든 한 번의 batch enable 요청으로 보낸다.
     """
     logger.info("프로젝트 및 API 설정 확인: %s", cfg.gcp_project_id)
 
-    apis = list(REQUIRED_APIS_BASE)
-    if (cfg.backend_build_mode or "").lower() == "cloud_build":
-        apis += REQUIRED_APIS_CLOUD_BUILD
-    if cfg.enable_bigquery:
-        apis += REQUIRED_APIS_BQ
-    if cfg.enable_cloud_sql:
-        apis += REQUIRED_APIS_SQL
-    if cfg.enable_gcs:
-        apis += REQUIRED_APIS_GCS
-    if cfg.enable_firebase:
-        apis += REQUIRED_APIS_FIREBASE
-
-    unique_apis = sorted(set(apis))
-    logger.info("다음 API 들이 활성화되어 있어야 합니다: %s", unique_apis)
+    unique_apis = _required_apis(cfg) if apis is None else tuple(sorted(set(apis)))
+    ensured = _ensured_apis.get(cfg.gcp_project_id, frozenset())
+    if ensured.issuperset(unique_apis):
+        logger.info("필수 API 는 이번 실행에서 이미 확인했습니다. 건너뜁니다.")
+        return
+    logger.info("다음 API 들이 활성화되어 있어야 합니다: %s", list(unique_apis))
 
     if not unique_apis:
         return
 
+    # 이미 활성화된 API 는 빼고, 남은 것만 enable 한다. (대부분의 재배포에서는 enable 호출 자체가 생략된다)
+    try:
+        enabled_apis = _list_enabled_apis(cfg)
+    except RuntimeError as e:
+        logger.warning("활성화된 API 목록 조회 실패, 필요한 API 전체에 enable 을 요청합니다: %s", e)
+        enabled_apis = set()
+    missing_apis = [api for api in unique_apis if api not in enabled_apis]
+    if not missing_apis:
+        logger.info("필요한 API 가 모두 활성화되어 있습니다.")
+        _ensured_apis[cfg.gcp_project_id] = ensured | frozenset(unique_apis)
+        return
+
+    client = _api_client(cfg, "serviceusage", "v1")
+    if client is None:
+        operations = _enable_apis_gcloud(cfg, missing_apis)
+    else:
+        from googleapiclient.errors import HttpError
+
+        try:
+            operation = (
+                client.services()
+                .batchEnable(
+                    parent=f"projects/{cfg.gcp_project_id}",
+                    body={"serviceIds": missing_apis},
+                )
+                .execute()
+            )
+        except HttpError as e:
+            raise RuntimeError(f"필수 API 활성화 요청이 실패했습니다: {e}") from e
+        if "error" in operation:
+            raise RuntimeError(f"필수 API 활성화 요청이 실패했습니다: {operation['error']}")
+        operations = [] if operation.get("done") else [operation["name"]]
+
+    # 완료를 기다리지 않고 작업만 걸어 둔다. 실제 대기는 해당 API 가 필요한 섹션 직전에
+    # wait_for_pending_api_ops 로 한다.
+    if operations:
+        logger.info("API 활성화 작업을 비동기로 요청했습니다: %s", operations)
+        with _pending_api_ops_lock:
+            for op in operations:
+                _pending_api_ops[op] = frozenset(missing_apis)
+    _ensured_apis[cfg.gcp_project_id] = ensured | frozenset(unique_apis)
+
+
+def _enable_apis_gcloud(cfg: DeployConfig, apis: list[str]) -> list[str]:
+    """gcloud services enable --async 로 활성화를 요청하고, 출력에서 작업 이름을 돌려준다."""
     cmd = [
         "gcloud",
         "services",
         "enable",
-        *unique_apis,
-        f"--project={cfg.gcp_project_id}",
+        *apis,
+        cfg.project_flag,
+        "--async",
         "--quiet",
     ]
-    _run_gcloud(cfg, cmd, spinner_message="필수 API 활성화 중")
+    proc = run_command(
+        cmd,
+        timeout=cfg.gcloud_run_deploy_timeout_seconds,
+        stream_output=False,
+        spinner_message="필수 API 활성화 요청 중",
+    )
+    return sorted(set(_OPERATION_NAME_RE.findall(f"{proc.stdout or ''}\n{proc.stderr or ''}")))
 
 
-def check_project_and_apis(cfg: DeployConfig) -> list[str]:
+def wait_for_pending_api_ops(
+    cfg: DeployConfig,
+    apis: Optional[Iterable[str]] = None,
+    *,
+    timeout: float = API_OPERATION_WAIT_TIMEOUT_SECONDS,
+) -> None:
     """
-    프로젝트와 필수 API 가 이미 활성화되어 있는지 확인한다.
-    실제 enable 은 수행하지 않는다.
+    ensure_project_and_apis 가 --async 로 요청한 API 활성화 작업이 끝날 때까지 기다린다.
+
+    apis 를 주면 그 중 하나라도 켜는 작업만 기다리고, 생략하면 대기 중인 작업 전체를 기다린다.
+    기다릴 작업이 없으면 gcloud 를 호출하지 않는다.
     """
-    results: list[str] = []
+    wanted = None if apis is None else frozenset(apis)
+    with _api_ops_wait_lock:
+        _wait_for_pending_api_ops_locked(cfg, wanted, timeout)
 
-    # 프로젝트 존재 여부
+
+def _wait_for_pending_api_ops_locked(cfg: DeployConfig, wanted: Optional[frozenset[str]], timeout: float) -> None:
+    """wait_for_pending_api_ops 의 본체. (_api_ops_wait_lock 을 잡은 상태에서 호출)"""
+    with _pending_api_ops_lock:
+        operations = [
+            op for op, op_apis in _pending_api_ops.items() if wanted is None or op_apis & wanted
+        ]
+        for op in operations:
+            del _pending_api_ops[op]
+    if not operations:
+        return
+
+    logger.info("API 활성화 작업 완료 대기: %s", operations)
+    client = _api_client(cfg, "serviceusage", "v1")
+    if client is None:
+        errors = _wait_operations_gcloud(cfg, operations, timeout)
+    else:
+        errors = _wait_operations_sdk(client, operations, timeout)
+    if errors:
+        raise RuntimeError("API 활성화 작업이 완료되지 않았습니다:\n" + "\n".join(errors))
+
+
+def _wait_operations_gcloud(cfg: DeployConfig, operations: list[str], timeout: float) -> list[str]:
+    """gcloud services operations wait 를 작업별로 동시에 실행하고, 실패한 작업의 메시지를 모은다."""
+
+    def _wait(op: str) -> None:
+        run_command(
+            ["gcloud", "services", "operations", "wait", op, cfg.project_flag, "--quiet"],
+            timeout=timeout,
+            stream_output=False,
+        )
+
+    errors: list[str] = []
+    with ThreadPoolExecutor(max_workers=len(operations), thread_name_prefix="api-op-wait") as pool:
+        futures = {op: pool.submit(_wait, op) for op in operations}
+        for op, future in futures.items():
+            try:
+                future.result()
+            except RuntimeError as e:
+                errors.append(f"{op}: {e}")
+    return errors
+
+
+def _wait_operations_sdk(client: Any, operations: list[str], timeout: float) -> list[str]:
+    """operations.get 으로 작업들을 함께 폴링하고, 실패/시간 초과된 작업의 메시지를 모은다."""
+    from googleapiclient.errors import HttpError
+
+    errors: list[str] = []
+    remaining = list(operations)
+    deadline = time.monotonic() + timeout
+    while remaining:
+        for op in list(remaining):
+            try:
+                status = client.operations().get(name=op).execute()
+            except HttpError as e:
+                errors.append(f"{op}: {e}")
+                remaining.remove(op)
+                continue
+            if status.get("done"):
+                remaining.remove(op)
+                if "error" in status:
+                    errors.append(f"{op}: {status['error']}")
+        if not remaining:
+            break
+        if time.monotonic() >= deadline:
+            errors.extend(f"{op}: {timeout:.0f}초 안에 완료되지 않았습니다." for op in remaining)
+            break
+        time.sleep(_OPERATION_POLL_INTERVAL_SECONDS)
+    return errors
+
+
+def _list_enabled_apis(cfg: DeployConfig) -> set[str]:
+    """
+    프로젝트에서 활성화된 API 이름 전체를 조회한다. (Service Usage API, 없으면 gcloud 한 번)
+    실패 시 RuntimeError 를 발생시킨다.
+    """
+    client = _api_client(cfg, "serviceusage", "v1")
+    if client is None:
+        cmd = [
+            "gcloud",
+            "services",
+            "list",
+            "--enabled",
+            cfg.project_flag,
+            "--format=value(config.name)",
+            "--quiet",
+        ]
+        proc = run_command(cmd, timeout=cfg.gcloud_run_deploy_timeout_seconds, stream_output=False)
+        return set((proc.stdout or "").split())
+
+    from googleapiclient.errors import HttpError
+
+    enabled: set[str] = set()
+    services = client.services()
+    request = services.list(
+        parent=f"projects/{cfg.gcp_project_id}",
+        filter="state:ENABLED",
+        pageSize=200,
+        fields="services/config/name,nextPageToken",
+    )
+    while request is not None:
+        try:
+            response = request.execute()
+        except HttpError as e:
+            raise RuntimeError(f"활성화된 API 목록 조회에 실패했습니다: {e}") from e
+        enabled.update(svc["config"]["name"] for svc in response.get("services", []))
+        request = services.list_next(request, response)
+    return enabled
+
+
+def _describe_project(cfg: DeployConfig) -> Optional[str]:
+    """
+    프로젝트 존재 여부를 확인한다.
+    정상이면 None, 문제가 있으면 check 결과 문자열을 반환한다.
+    """
+    client = _api_client(cfg, "cloudresourcemanager", "v3")
+    if client is None:
+        return _describe_project_gcloud(cfg)
+
+    from googleapiclient.errors import HttpError
+
+    try:
+        client.projects().get(name=f"projects/{cfg.gcp_project_id}").execute()
+    except HttpError as e:
+        if _http_status(e) == 404:
+            return f"Project: 없음 (생성이 필요함) ({cfg.gcp_project_id})"
+        return "Project: 조회 실패 (projects.get)"
+    return None
+
+
+def _gcloud_error_line(output: str) -> str:
+    """gcloud 출력에서 마지막 `ERROR: (gcloud....)` 줄을 돌려준다. 없으면 빈 문자열."""
+    start = output.rfind("ERROR: (gcloud.")
+    if start < 0:
+        return ""
+    end = output.find("\n", start)
+    return output[start:] if end < 0 else output[start:end]
+
+
+def _describe_project_gcloud(cfg: DeployConfig) -> Optional[str]:
+    """gcloud projects describe 로 _describe_project 와 같은 확인을 한다."""
     describe_cmd = [
         "gcloud",
         "projects",
@@ -92,64 +375,53 @@ def check_project_and_apis(cfg: DeployConfig) -> list[str]:
         cfg.gcp_project_id,
         "--quiet",
     ]
-    logger.info("프로젝트 존재 여부 확인: %s", cfg.gcp_project_id)
     try:
         run_command(describe_cmd, timeout=cfg.gcloud_run_deploy_timeout_seconds, stream_output=False)
-        results.append(f"Project: 존재함 ({cfg.gcp_project_id})")
     except RuntimeError as e:
         stderr = str(e)
         if "찾을 수 없습니다" in stderr:
-            results.append("Project: gcloud 명령을 찾을 수 없어 확인 불가")
-            return results
-        if "NOT_FOUND" in stderr or "not found" in stderr.lower():
-            results.append(f"Project: 없음 (생성이 필요함) ({cfg.gcp_project_id})")
-        else:
-            results.append(
-                "Project: 조회 실패 (gcloud projects describe)"
-            )
+            return "Project: gcloud 명령을 찾을 수 없어 확인 불가"
+        # gcloud 의 에러 요약 줄만 본다. (다른 로그 줄의 "not found" 에 걸리지 않도록)
+        error_line = _gcloud_error_line(stderr)
+        if "NOT_FOUND" in error_line or "not found" in error_line.lower():
+            return f"Project: 없음 (생성이 필요함) ({cfg.gcp_project_id})"
+        return "Project: 조회 실패 (gcloud projects describe)"
+    return None
+
+
+def check_project_and_apis(cfg: DeployConfig) -> list[str]:
+    """
+    프로젝트와 필수 API 가 이미 활성화되어 있는지 확인한다.
+    실제 enable 은 수행하지 않는다.
+    """
+    results: list[str] = []
+
+    # 프로젝트 존재 여부
+    logger.info("프로젝트 존재 여부 확인: %s", cfg.gcp_project_id)
+    problem = _describe_project(cfg)
+    if problem is not None:
+        results.append(problem)
         return results
+    results.append(f"Project: 존재함 ({cfg.gcp_project_id})")
 
     # API 상태 확인
-    apis = list(REQUIRED_APIS_BASE)
-    if (cfg.backend_build_mode or "").lower() == "cloud_build":
-        apis += REQUIRED_APIS_CLOUD_BUILD
-    if cfg.enable_bigquery:
-        apis += REQUIRED_APIS_BQ
-    if cfg.enable_cloud_sql:
-        apis += REQUIRED_APIS_SQL
-    if cfg.enable_gcs:
-        apis += REQUIRED_APIS_GCS
-    if cfg.enable_firebase:
-        apis += REQUIRED_APIS_FIREBASE
-
-    unique_apis = sorted(set(apis))
+    unique_apis = _required_apis(cfg)
     if not unique_apis:
         results.append("APIs: 추가로 필요한 API 없음")
         return results
 
+    # 활성화된 API 목록을 한 번에 받아와 필요한 API 와 대조한다.
+    try:
+        enabled_apis = _list_enabled_apis(cfg)
+    except RuntimeError as e:
+        if "찾을 수 없습니다" in str(e):
+            results.extend(f"API: gcloud 명령을 찾을 수 없어 {api} 상태 확인 불가" for api in unique_apis)
+        else:
+            results.extend(f"API: 상태 확인 실패 ({api})" for api in unique_apis)
+        return results
+
     for api in unique_apis:
-        cmd = [
-            "gcloud",
-            "services",
-            "list",
-            "--enabled",
-            f"--project={cfg.gcp_project_id}",
-            f"--filter=name:{api}",
-            "--format=value(config.name)",
-            "--quiet",
-        ]
-        try:
-            proc = run_command(cmd, timeout=cfg.gcloud_run_deploy_timeout_seconds, stream_output=False)
-            enabled = bool(proc.stdout.strip())
-        except RuntimeError as e:
-            msg = str(e)
-            if "찾을 수 없습니다" in msg:
-                results.append(f"API: gcloud 명령을 찾을 수 없어 {api} 상태 확인 불가")
-            else:
-                results.append(f"API: 상태 확인 실패 ({api})")
-            continue
-
-        if enabled:
+        if api in enabled_apis:
             results.append(f"API: 활성화됨 ({api})")
         else:
             results.append(f"API: 비활성화 (enable 필요) ({api})")
@@ -8,8 +8,11 @@ Cloud Run 서비스/Job에서 사용할 수 있도록 매핑하는 모듈.
 
 from __future__ import annotations
 
+import functools
 import os
-from typing import Dict, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from google.api_core.exceptions import NotFound
 from google.cloud import secretmanager
@@ -20,28 +23,39 @@ from .logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# .env.secrets 의 한 줄 `KEY=VALUE` (앞뒤 공백 무시, '#' 로 시작하는 줄과 '=' 가 없는 줄은 건너뜀)
+_KV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# Secret 별 RPC(get/create/add_version)를 동시에 보낼 최대 스레드 수
+_SECRET_MAX_WORKERS = 8
+
 
 def load_local_secrets_file(base_dir: str = ".", filename: str = ".env.secrets") -> Dict[str, str]:
     """
     .env.secrets 파일을 파싱하여 dict 로 반환.
+    같은 파일(경로/mtime/크기가 같음)은 다시 읽지 않고 이전 파싱 결과를 재사용한다.
     """
     path = os.path.join(base_dir, filename)
-    secrets: Dict[str, str] = {}
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         logger.info(".env.secrets 파일이 없어 Secret 로드를 건너뜁니다: %s", path)
-        return secrets
+        return {}
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            secrets[key.strip()] = value.strip()
+    # 호출 측에서 수정해도 캐시가 오염되지 않도록 복사본을 돌려준다.
+    return dict(_parse_secrets_file(path, st.st_mtime_ns, st.st_size))
 
-    return secrets
+
+@functools.lru_cache(maxsize=8)
+def _parse_secrets_file(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    .env.secrets 를 읽어 (key, value) 목록으로 반환한다.
+    mtime_ns/size 는 캐시 키로만 쓰인다. (파일이 바뀌면 다시 읽는다)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = f.read()
+    # 같은 키가 여러 번 나오면 마지막 값을 쓴다.
+    return tuple(dict(_KV_LINE_RE.findall(data)).items())
 
 
 def ensure_secrets(cfg: DeployConfig, base_dir: str = ".") -> List[str]:
@@ -62,15 +76,17 @@ def ensure_secrets(cfg: DeployConfig, base_dir: str = ".") -> List[str]:
     project_id = cfg.gcp_project_id
     parent = f"projects/{project_id}"
 
-    created_or_updated: List[str] = []
-    for key, value in local_secrets.items():
+    def _upsert(key: str, value: str) -> str:
         secret_id = f"{cfg.secret_prefix}{key}" if cfg.secret_prefix else key
         secret_name = f"{parent}/secrets/{secret_id}"
 
-        # Secret 존재 여부 확인 후 없으면 생성
+        payload = {"data": value.encode("utf-8")}
+
+        # 대부분의 재배포에서는 Secret 이 이미 있으므로, 조회 없이 바로 새 버전을 추가하고
+        # NotFound 일 때만 Secret 을 만든 뒤 다시 추가한다.
         try:
-            client.get_secret(name=secret_name)
-            logger.info("기존 Secret 에 새 버전을 추가합니다: %s", secret_name)
+            client.add_secret_version(parent=secret_name, payload=payload)
+            logger.info("기존 Secret 에 새 버전을 추가했습니다: %s", secret_name)
         except NotFound:
             logger.info("Secret 이 없어 새로 생성합니다: %s", secret_name)
             client.create_secret(
@@ -80,13 +96,14 @@ def ensure_secrets(cfg: DeployConfig, base_dir: str = ".") -> List[str]:
                     "replication": {"automatic": {}},
                 },
             )
+            client.add_secret_version(parent=secret_name, payload=payload)
+        return secret_name
 
-        # 새 버전 추가
-        client.add_secret_version(
-            parent=secret_name,
-            payload={"data": value.encode("utf-8")},
-        )
-        created_or_updated.append(secret_name)
+    # Secret 들은 서로 독립적이므로 하나의 (thread-safe) 클라이언트로 동시에 처리한다.
+    with ThreadPoolExecutor(
+        max_workers=min(_SECRET_MAX_WORKERS, len(local_secrets)), thread_name_prefix="secrets"
+    ) as pool:
+        created_or_updated: List[str] = list(pool.map(lambda kv: _upsert(*kv), local_secrets.items()))
 
     return created_or_updated
 
@@ -107,17 +124,19 @@ def check_secrets(cfg: DeployConfig, base_dir: str = ".") -> List[str]:
     project_id = cfg.gcp_project_id
     parent = f"projects/{project_id}"
 
-    results: List[str] = []
-    for key in sorted(local_secrets.keys()):
+    def _probe(key: str) -> str:
         secret_id = f"{cfg.secret_prefix}{key}" if cfg.secret_prefix else key
         secret_name = f"{parent}/secrets/{secret_id}"
 
         try:
             client.get_secret(name=secret_name)
-            results.append(f"Secrets: 존재함 ({secret_name})")
+            return f"Secrets: 존재함 ({secret_name})"
         except NotFound:
-            results.append(f"Secrets: 없음 (생성이 필요함) ({secret_name})")
-
-    return results
+            return f"Secrets: 없음 (생성이 필요함) ({secret_name})"
 
+    with ThreadPoolExecutor(
+        max_workers=min(_SECRET_MAX_WORKERS, len(local_secrets)), thread_name_prefix="secrets"
+    ) as pool:
+        results: List[str] = list(pool.map(_probe, sorted(local_secrets.keys())))
 
+    return results
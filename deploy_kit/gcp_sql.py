@@ -8,7 +8,9 @@ Cloud SQL 인스턴스/DB/유저 및 Cloud Run 연결 설정을 담당하는 모
 from __future__ import annotations
 
 from .config import DeployConfig
+from .gcp_project import _api_client, _http_status
 from .logging_utils import get_logger
+from .subprocess_utils import run_command
 
 
 logger = get_logger(__name__)
@@ -35,7 +37,8 @@ def ensure_cloud_sql(cfg: DeployConfig) -> None:
 def check_cloud_sql(cfg: DeployConfig) -> list[str]:
     """
     Cloud SQL 인스턴스/DB 존재 여부를 간단히 확인한다.
-    (gcloud sql 을 사용하며, 실제 생성은 하지 않는다)
+    (Cloud SQL Admin API 를 사용하며, PREFER_GCLOUD=true 이거나 ADC 가 없으면 gcloud sql 로 대체한다.
+    실제 생성은 하지 않는다)
     """
     results: list[str] = []
 
@@ -47,7 +50,45 @@ def check_cloud_sql(cfg: DeployConfig) -> list[str]:
         results.append("Cloud SQL: CLOUD_SQL_INSTANCE_NAME 이 설정되지 않았습니다.")
         return results
 
-    import subprocess
+    client = _api_client(cfg, "sqladmin", "v1beta4")
+    if client is None:
+        return results + _check_cloud_sql_gcloud(cfg)
+
+    from googleapiclient.errors import HttpError
+
+    instance = cfg.cloud_sql_instance_name
+    try:
+        client.instances().get(project=cfg.gcp_project_id, instance=instance, fields="name").execute()
+        results.append(f"Cloud SQL: 인스턴스 존재함 ({instance})")
+    except HttpError as e:
+        if _http_status(e) == 404:
+            results.append(f"Cloud SQL: 인스턴스 없음 (생성이 필요함) ({instance})")
+        else:
+            results.append(f"Cloud SQL: 인스턴스 상태 확인 불가 ({instance})")
+        return results
+
+    # DB 이름이 설정된 경우 DB 존재 여부도 확인
+    if cfg.cloud_sql_db_name:
+        try:
+            client.databases().get(
+                project=cfg.gcp_project_id,
+                instance=instance,
+                database=cfg.cloud_sql_db_name,
+                fields="name",
+            ).execute()
+            results.append(f"Cloud SQL: 데이터베이스 존재함 ({cfg.cloud_sql_db_name})")
+        except HttpError as e:
+            if _http_status(e) == 404:
+                results.append(f"Cloud SQL: 데이터베이스 없음 (생성이 필요함) ({cfg.cloud_sql_db_name})")
+            else:
+                results.append(f"Cloud SQL: 데이터베이스 상태 확인 불가 ({cfg.cloud_sql_db_name})")
+
+    return results
+
+
+def _check_cloud_sql_gcloud(cfg: DeployConfig) -> list[str]:
+    """gcloud sql ... describe 로 check_cloud_sql 과 같은 확인을 한다."""
+    results: list[str] = []
 
     instance_cmd = [
         "gcloud",
@@ -55,27 +96,23 @@ def check_cloud_sql(cfg: DeployConfig) -> list[str]:
         "instances",
         "describe",
         cfg.cloud_sql_instance_name,
-        f"--project={cfg.gcp_project_id}",
+        cfg.project_flag,
         "--quiet",
     ]
 
+    # run_command 가 gcloud 경로를 (캐시된 which 로) 미리 확인하므로, 없으면 실행 없이 바로 실패한다.
     try:
-        subprocess.run(
-            instance_cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        run_command(instance_cmd, timeout=cfg.gcloud_run_deploy_timeout_seconds, stream_output=False)
         results.append(
             f"Cloud SQL: 인스턴스 존재함 ({cfg.cloud_sql_instance_name})"
         )
-    except FileNotFoundError:
-        results.append("Cloud SQL: gcloud 명령을 찾을 수 없어 상태 확인 불가")
-        return results
-    except subprocess.CalledProcessError:
-        results.append(
-            f"Cloud SQL: 인스턴스 없음 (생성이 필요함) ({cfg.cloud_sql_instance_name})"
-        )
+    except RuntimeError as e:
+        if "찾을 수 없습니다" in str(e):
+            results.append("Cloud SQL: gcloud 명령을 찾을 수 없어 상태 확인 불가")
+        else:
+            results.append(
+                f"Cloud SQL: 인스턴스 없음 (생성이 필요함) ({cfg.cloud_sql_instance_name})"
+            )
         return results
 
     # DB 이름이 설정된 경우 DB 존재 여부도 확인
@@ -87,24 +124,17 @@ def check_cloud_sql(cfg: DeployConfig) -> list[str]:
             "describe",
             cfg.cloud_sql_db_name,
             f"--instance={cfg.cloud_sql_instance_name}",
-            f"--project={cfg.gcp_project_id}",
+            cfg.project_flag,
             "--quiet",
         ]
         try:
-            subprocess.run(
-                db_cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            run_command(db_cmd, timeout=cfg.gcloud_run_deploy_timeout_seconds, stream_output=False)
             results.append(
                 f"Cloud SQL: 데이터베이스 존재함 ({cfg.cloud_sql_db_name})"
             )
-        except subprocess.CalledProcessError:
+        except RuntimeError:
             results.append(
                 f"Cloud SQL: 데이터베이스 없음 (생성이 필요함) ({cfg.cloud_sql_db_name})"
             )
 
     return results
-
-
@@ -1,3 +1,4 @@
+import functools
 import logging
 import sys
 
@@ -14,6 +15,7 @@ def setup_logging(verbosity: int = 0) -> None:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
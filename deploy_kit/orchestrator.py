@@ -1,29 +1,45 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Any, Callable, Iterable, List, Optional
+from operator import attrgetter
+import hashlib
+import importlib
+import json
 import os
 import shlex
 
 from .config import DeployConfig
 from .logging_utils import get_logger
-from .subprocess_utils import run_command
+from .subprocess_utils import progress_scope, run_command
 from . import (
+    check_cache,
     gcp_auth,
     gcp_project,
     gcp_artifact_registry,
     gcp_cloud_run,
-    gcp_bq,
     gcp_sql,
-    gcp_gcs,
-    gcp_secrets,
     firebase_hosting,
 )
 
 
 logger = get_logger(__name__)
 
+# google-cloud 클라이언트 라이브러리를 import 하는 모듈 (import 에만 수백 ms 가 걸린다).
+# 실제로 해당 섹션을 배포/점검할 때 함수 안에서 import 하고,
+# 그 전에 orchestrator.gcp_bq 처럼 속성으로 접근하면 그때 로드한다.
+_LAZY_MODULES: frozenset[str] = frozenset({"gcp_bq", "gcp_gcs", "gcp_secrets"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f".{name}", __package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # CLI 등에서 사용할 수 있도록 섹션 이름을 상수로 노출
-ALL_SECTIONS: List[str] = [
+ALL_SECTIONS: tuple[str, ...] = (
     "backend",
     "etl",
     "bq",
@@ -33,29 +49,73 @@ ALL_SECTIONS: List[str] = [
     "frontend",
     "frontend_cloud_run",
     "firebase",
-]
+)
+# 섹션 이름 검증(--only 등)용 membership 집합
+ALL_SECTIONS_SET: frozenset[str] = frozenset(ALL_SECTIONS)
+# 에러 메시지 등에 쓰는 "허용되는 섹션" 문자열
+ALL_SECTIONS_STR: str = ", ".join(ALL_SECTIONS)
+# 섹션 -> ALL_SECTIONS 에서의 순서 (요약 정렬용)
+_SECTION_ORDER: dict[str, int] = {name: i for i, name in enumerate(ALL_SECTIONS)}
+
+# check_all 에서 원격 점검을 동시에 실행할 최대 스레드 수
+_CHECK_MAX_WORKERS = 6
+
+# apply_all 에서 섹션을 동시에 실행할 최대 스레드 수
+_APPLY_MAX_WORKERS = 6
+
+# 섹션 -> 먼저 한 번만 실행해 두는 공통 선행 작업 (project: 필수 API, ar: Artifact Registry 리포 + 이미지 빌드 시작)
+_SECTION_PREREQS: dict[str, tuple[str, ...]] = {
+    "backend": ("project", "ar"),
+    "etl": ("project", "ar"),
+    "frontend_cloud_run": ("project", "ar"),
+    "bq": ("project",),
+    "sql": ("project",),
+    "gcs": ("project",),
+    "secrets": ("project",),
+    "firebase": ("project",),
+}
+
+# 섹션 -> 활성화되어 있어야 하는 API. project 선행 작업에서 실행할 섹션들의 합집합을 한 번에 enable 한다.
+_SECTION_APIS: dict[str, frozenset[str]] = {
+    "backend": gcp_project.REQUIRED_APIS_BASE,
+    "etl": gcp_project.REQUIRED_APIS_BASE,
+    "frontend_cloud_run": gcp_project.REQUIRED_APIS_BASE,
+    "bq": gcp_project.REQUIRED_APIS_BQ,
+    "sql": gcp_project.REQUIRED_APIS_SQL,
+    "gcs": gcp_project.REQUIRED_APIS_GCS,
+    "secrets": frozenset({"secretmanager.googleapis.com"}),
+    "firebase": gcp_project.REQUIRED_APIS_FIREBASE | {"firebasehosting.googleapis.com"},
+}
+
+# 섹션 -> 이 섹션보다 먼저 끝나야 하는 섹션
+# (firebase 는 frontend 빌드 결과물을 배포하고, frontend_cloud_run 이미지는 같은 디렉터리를
+#  컨텍스트로 쓰므로 FRONTEND_BUILD_COMMAND 가 끝난 뒤에 빌드해야 한다)
+_SECTION_AFTER: dict[str, tuple[str, ...]] = {
+    "firebase": ("frontend",),
+    "frontend_cloud_run": ("frontend",),
+}
+
+# 컨테이너 이미지를 빌드/푸시하는 섹션 (apply_all 에서 동시에 빌드한다)
+_IMAGE_SECTIONS: tuple[str, ...] = ("backend", "etl", "frontend_cloud_run")
+
+
+# 섹션 -> 실행 여부를 정하는 설정 조건
+_SECTION_PRED: dict[str, Callable[[DeployConfig], bool]] = {
+    "backend": attrgetter("deploy_backend"),
+    "frontend": attrgetter("deploy_frontend"),
+    "frontend_cloud_run": attrgetter("deploy_frontend_cloud_run"),
+    "etl": attrgetter("deploy_etl_job"),
+    "bq": attrgetter("enable_bigquery"),
+    "sql": attrgetter("enable_cloud_sql"),
+    "gcs": attrgetter("enable_gcs"),
+    "firebase": lambda c: c.enable_firebase and c.deploy_frontend,
+    "secrets": lambda c: c.enable_secret_manager and c.configure_secrets,
+}
 
 
 def _section_enabled(name: str, cfg: DeployConfig) -> bool:
-    if name == "backend":
-        return cfg.deploy_backend
-    if name == "frontend":
-        return cfg.deploy_frontend
-    if name == "frontend_cloud_run":
-        return cfg.deploy_frontend_cloud_run
-    if name == "etl":
-        return cfg.deploy_etl_job
-    if name == "bq":
-        return cfg.enable_bigquery
-    if name == "sql":
-        return cfg.enable_cloud_sql
-    if name == "gcs":
-        return cfg.enable_gcs
-    if name == "firebase":
-        return cfg.enable_firebase and cfg.deploy_frontend
-    if name == "secrets":
-        return cfg.enable_secret_manager and cfg.configure_secrets
-    return False
+    pred = _SECTION_PRED.get(name)
+    return bool(pred(cfg)) if pred is not None else False
 
 
 def _filter_sections(cfg: DeployConfig, only_sections: Optional[Iterable[str]]) -> List[str]:
@@ -63,54 +123,308 @@ def _filter_sections(cfg: DeployConfig, only_sections: Optional[Iterable[str]])
     토글/only_sections 에 따라 실제 실행 대상 섹션 목록을 결정한다.
     """
     if only_sections:
-        requested = {s for s in only_sections}
+        requested = frozenset(only_sections)
         return [s for s in ALL_SECTIONS if s in requested and _section_enabled(s, cfg)]
     return [s for s in ALL_SECTIONS if _section_enabled(s, cfg)]
 
 
+def _bullets(items: Iterable[str]) -> str:
+    """요약용 `- item` 목록. 비어 있으면 `- (none)`."""
+    return "\n".join(f"- {item}" for item in items) or "- (none)"
+
+
+# plan 의 "Config summary" 에 보여 주는 설정 (출력 순서대로)
+_PLAN_CONFIG_KEYS: tuple[str, ...] = (
+    "backend_source_dir",
+    "frontend_source_dir",
+    "enable_bigquery",
+    "enable_cloud_sql",
+    "enable_gcs",
+    "enable_firebase",
+    "enable_secret_manager",
+    "deploy_backend",
+    "deploy_frontend",
+    "deploy_frontend_cloud_run",
+    "deploy_etl_job",
+    "configure_secrets",
+)
+
+
+def plan_data(cfg: DeployConfig) -> dict[str, Any]:
+    """
+    plan 의 내용을 데이터로 돌려준다. (plan_all / plan_json 이 이것을 그대로 렌더링한다)
+    실제 GCP 호출은 하지 않는다.
+    """
+    return {
+        "project": cfg.gcp_project_id,
+        "region": cfg.gcp_region,
+        "config": {key: getattr(cfg, key) for key in _PLAN_CONFIG_KEYS},
+        "sections": [{"name": name, "enabled": _section_enabled(name, cfg)} for name in ALL_SECTIONS],
+    }
+
+
+def plan_json(cfg: DeployConfig) -> str:
+    """plan_data 를 JSON 문자열로. (CI 등에서 jq 로 읽기 위한 용도)"""
+    return json.dumps(plan_data(cfg), ensure_ascii=False, indent=2)
+
+
 def plan_all(cfg: DeployConfig) -> str:
     """
     현재 설정된 옵션 및 어떤 섹션이 활성화/비활성화 되는지
     요약 텍스트를 리턴한다. 실제 GCP 호출은 하지 않는다.
     """
-    lines: List[str] = []
-    lines.append("# Deploy plan")
-    lines.append(f"- project: {cfg.gcp_project_id}")
-    lines.append(f"- region: {cfg.gcp_region}")
-    lines.append("")
-
-    # 주요 설정 요약
-    lines.append("## Config summary")
-    lines.append(f"- backend_source_dir: {cfg.backend_source_dir}")
-    lines.append(
-        f"- frontend_source_dir: {cfg.frontend_source_dir or '(not set)'}",
+    data = plan_data(cfg)
+    config = "\n".join(
+        f"- {key}: {(value or '(not set)') if key == 'frontend_source_dir' else value}"
+        for key, value in data["config"].items()
     )
-    lines.append(f"- enable_bigquery: {cfg.enable_bigquery}")
-    lines.append(f"- enable_cloud_sql: {cfg.enable_cloud_sql}")
-    lines.append(f"- enable_gcs: {cfg.enable_gcs}")
-    lines.append(f"- enable_firebase: {cfg.enable_firebase}")
-    lines.append(f"- enable_secret_manager: {cfg.enable_secret_manager}")
-    lines.append(f"- deploy_backend: {cfg.deploy_backend}")
-    lines.append(f"- deploy_frontend: {cfg.deploy_frontend}")
-    lines.append(f"- deploy_frontend_cloud_run: {cfg.deploy_frontend_cloud_run}")
-    lines.append(f"- deploy_etl_job: {cfg.deploy_etl_job}")
-    lines.append(f"- configure_secrets: {cfg.configure_secrets}")
-    lines.append("")
+    sections = "\n".join(
+        f"- {s['name']}: {'ENABLED' if s['enabled'] else 'SKIPPED'}" for s in data["sections"]
+    )
+    return f"""# Deploy plan
+- project: {data['project']}
+- region: {data['region']}
+
+## Config summary
+{config}
 
-    lines.append("## Sections")
+## Sections
+{sections}"""
 
-    for name in ALL_SECTIONS:
-        enabled = _section_enabled(name, cfg)
-        status = "ENABLED" if enabled else "SKIPPED"
-        lines.append(f"- {name}: {status}")
 
-    return "\n".join(lines)
+def _section_apis(cfg: DeployConfig, sections: Iterable[str]) -> set[str]:
+    """실행할 섹션들이 필요로 하는 API 의 합집합."""
+    apis: set[str] = set()
+    for name in sections:
+        apis |= _SECTION_APIS.get(name, frozenset())
+        if name in _IMAGE_SECTIONS and (cfg.backend_build_mode or "").lower() == "cloud_build":
+            apis |= gcp_project.REQUIRED_APIS_CLOUD_BUILD
+    return apis
+
+
+def _image_build_kwargs(cfg: DeployConfig, name: str) -> Optional[dict[str, Any]]:
+    """
+    섹션이 빌드할 이미지의 build_and_push_image 인자를 반환한다.
+    빌드할 이미지가 없거나 설정이 부족하면 None.
+    """
+    if name in ("backend", "etl"):
+        if not cfg.backend_image_name:
+            return None
+        return {
+            "service": name,
+            "image_name": cfg.backend_image_name,
+            "context_dir": cfg.backend_source_dir,
+        }
+    if name == "frontend_cloud_run":
+        if not cfg.frontend_source_dir or not cfg.frontend_image_name:
+            return None
+        return {
+            "service": "frontend",
+            "image_name": cfg.frontend_image_name,
+            "context_dir": cfg.frontend_source_dir,
+        }
+    return None
+
+
+def _submit_image_builds(
+    pool: ThreadPoolExecutor,
+    builds: dict[str, Future],
+    cfg: DeployConfig,
+    sections: List[str],
+) -> None:
+    """
+    아직 시작하지 않은 이미지 빌드/푸시를 모두 스레드 풀에 제출한다.
+
+    Artifact Registry 리포가 준비된 직후 호출되며,
+    각 섹션은 자기 차례에 builds[name].result() 로 이미지 URL 을 받는다.
+    _SECTION_AFTER 로 먼저 끝나야 하는 섹션이 함께 실행되면 미리 빌드하지 않고,
+    섹션이 자기 차례에 직접 빌드한다. (선행 섹션이 빌드 컨텍스트를 바꾸는 중일 수 있다)
+    """
+    for name in _IMAGE_SECTIONS:
+        if name not in sections or name in builds:
+            continue
+        if any(dep in sections for dep in _SECTION_AFTER.get(name, ())):
+            continue
+        kwargs = _image_build_kwargs(cfg, name)
+        if kwargs is None:
+            continue
+        builds[name] = pool.submit(gcp_artifact_registry.build_and_push_image, cfg, **kwargs)
+
+
+def _image_url(
+    builds: dict[str, Future],
+    cfg: DeployConfig,
+    name: str,
+    **kwargs: Any,
+) -> str:
+    """미리 제출된 빌드가 있으면 그 결과를, 없으면 직접 빌드한 결과를 반환한다."""
+    future = builds.get(name)
+    if future is None:
+        return gcp_artifact_registry.build_and_push_image(cfg, **kwargs)
+    return future.result()
+
+
+def _run_prereqs(
+    cfg: DeployConfig,
+    sections: List[str],
+    build_pool: ThreadPoolExecutor,
+    builds: dict[str, Future],
+) -> dict[str, BaseException]:
+    """
+    섹션들이 공유하는 선행 작업(_SECTION_PREREQS)을 필요한 만큼 한 번씩, 순서대로 실행한다.
+    실패한 선행 작업의 {이름: 예외} 를 반환한다. (project 가 실패하면 ar 은 실행하지 않는다)
+    """
+    needed = {p for name in sections for p in _SECTION_PREREQS.get(name, ())}
+    errors: dict[str, BaseException] = {}
+    for prereq in ("project", "ar"):
+        if prereq not in needed:
+            continue
+        if errors:
+            errors[prereq] = RuntimeError(f"선행 작업 실패로 {prereq} 준비를 건너뜁니다.")
+            continue
+        try:
+            if prereq == "project":
+                gcp_project.ensure_project_and_apis(cfg, apis=_section_apis(cfg, sections))
+            else:
+                gcp_project.wait_for_pending_api_ops(cfg, ("artifactregistry.googleapis.com",))
+                gcp_artifact_registry.ensure_repository(cfg)
+                # 이미지 빌드/푸시는 섹션 간에 독립적이므로 리포가 준비되면 한꺼번에 시작한다.
+                # (docker build 자체는 build_and_push_image 안에서 직렬화되고 push 만 겹친다)
+                _submit_image_builds(build_pool, builds, cfg, sections)
+        except Exception as e:  # noqa: BLE001
+            logger.exception("공통 선행 작업 실패: %s", prereq)
+            errors[prereq] = e
+    return errors
+
+
+def _apply_section(name: str, cfg: DeployConfig, builds: dict[str, Future]) -> None:
+    """
+    섹션 하나의 배포 로직. 공통 선행 작업(_SECTION_PREREQS)은 이미 끝난 상태에서 호출된다.
+    """
+    if name == "backend":
+        gcp_auth.ensure_deploy_service_account(cfg)
+        gcp_auth.ensure_iam_roles(cfg)
+        gcp_project.wait_for_pending_api_ops(cfg)
+        # 이미지 빌드/푸시 및 배포
+        if cfg.backend_image_name:
+            image_url = _image_url(
+                builds,
+                cfg,
+                "backend",
+                service="backend",
+                image_name=cfg.backend_image_name,
+                context_dir=cfg.backend_source_dir,
+            )
+            gcp_cloud_run.deploy_backend_service(cfg, image_url)
+    elif name == "etl":
+        gcp_project.wait_for_pending_api_ops(cfg)
+        if cfg.backend_image_name:
+            image_url = _image_url(
+                builds,
+                cfg,
+                "etl",
+                service="etl",
+                image_name=cfg.backend_image_name,
+                context_dir=cfg.backend_source_dir,
+            )
+            gcp_cloud_run.deploy_etl_job(cfg, image_url)
+    elif name == "bq":
+        gcp_project.wait_for_pending_api_ops(cfg, gcp_project.REQUIRED_APIS_BQ)
+        from . import gcp_bq
+
+        gcp_bq.ensure_bigquery_resources(cfg)
+    elif name == "sql":
+        gcp_project.wait_for_pending_api_ops(cfg, gcp_project.REQUIRED_APIS_SQL)
+        gcp_sql.ensure_cloud_sql(cfg)
+    elif name == "gcs":
+        # storage API 는 보통 기본으로 켜져 있으므로, 이번에 enable 을 요청한 경우에만 기다린다.
+        gcp_project.wait_for_pending_api_ops(cfg, gcp_project.REQUIRED_APIS_GCS)
+        from . import gcp_gcs
+
+        gcp_gcs.ensure_gcs_bucket(cfg)
+    elif name == "secrets":
+        gcp_project.wait_for_pending_api_ops(cfg, ("secretmanager.googleapis.com",))
+        from . import gcp_secrets
+
+        gcp_secrets.ensure_secrets(cfg)
+    elif name == "frontend":
+        # 실제 Firebase 배포는 firebase 섹션에서 처리,
+        # 여기서는 프론트엔드 빌드를 담당한다.
+        #
+        # - FRONTEND_SOURCE_DIR 이 설정되어 있다면 해당 디렉토리에서 빌드 스크립트를 실행
+        # - BACKEND_API_HOST 가 설정되어 있다면, 빌드 시 VITE_API_URL 환경변수로 주입
+        build_cmd = cfg.frontend_build_command
+        if not build_cmd:
+            logger.info(
+                "프론트엔드 빌드 명령(FRONTEND_BUILD_COMMAND)이 설정되지 않아 "
+                "frontend 섹션은 로그만 남기고 건너뜁니다."
+            )
+        else:
+            cwd = cfg.frontend_source_dir or "."
+            env = os.environ.copy()
+            if cfg.backend_api_host:
+                env["VITE_API_URL"] = cfg.backend_api_host
+                logger.info(
+                    "프론트엔드 빌드 시 VITE_API_URL 을 설정합니다: %s",
+                    cfg.backend_api_host,
+                )
+            logger.info(
+                "프론트엔드 빌드 실행: cwd=%s cmd=%s",
+                cwd,
+                build_cmd,
+            )
+            try:
+                run_command(
+                    shlex.split(build_cmd),
+                    cwd=cwd,
+                    env=env,
+                    timeout=cfg.backend_build_subprocess_timeout_seconds,
+                    stream_output=cfg.cli_stream_subprocess_output,
+                    spinner_message=None
+                    if cfg.cli_stream_subprocess_output
+                    else "프론트엔드 빌드 중",
+                )
+            except RuntimeError as e:
+                raise RuntimeError(
+                    f"프론트엔드 빌드가 실패했습니다. "
+                    "FRONTEND_BUILD_COMMAND 및 빌드 로그를 확인하세요."
+                ) from e
+    elif name == "frontend_cloud_run":
+        # 프론트엔드 Cloud Run 배포:
+        # - FRONTEND_SOURCE_DIR 의 Dockerfile 컨텍스트를 이미지로 빌드/푸시
+        # - Cloud Run 서비스로 배포
+        gcp_project.wait_for_pending_api_ops(cfg)
+
+        if not cfg.frontend_source_dir:
+            raise RuntimeError(
+                "FRONTEND_SOURCE_DIR 이 설정되지 않아 frontend_cloud_run 섹션을 실행할 수 없습니다."
+            )
+        if not cfg.frontend_image_name:
+            raise RuntimeError(
+                "FRONTEND_IMAGE_NAME 이 설정되지 않아 frontend_cloud_run 섹션을 실행할 수 없습니다."
+            )
+
+        image_url = _image_url(
+            builds,
+            cfg,
+            "frontend_cloud_run",
+            service="frontend",
+            image_name=cfg.frontend_image_name,
+            context_dir=cfg.frontend_source_dir,
+        )
+        gcp_cloud_run.deploy_frontend_service(cfg, image_url)
+    elif name == "firebase":
+        gcp_project.wait_for_pending_api_ops(cfg, _SECTION_APIS["firebase"])
+        firebase_hosting.deploy_frontend(cfg)
 
 
 def apply_all(cfg: DeployConfig, only_sections: Optional[Iterable[str]] = None) -> tuple[str, bool]:
     """
     섹션별로 실제 배포 로직을 호출한다.
 
+    공통 선행 작업(프로젝트/API, Artifact Registry 리포)을 먼저 한 번씩 실행한 뒤,
+    서로 독립적인 섹션들은 동시에 실행한다. (_SECTION_AFTER 의 순서 제약은 지킨다)
+
     Returns:
         summary: 사람이 읽기 좋은 텍스트 요약
         has_failures: 하나 이상의 섹션에서 예외가 발생했는지 여부
@@ -120,159 +434,228 @@ def apply_all(cfg: DeployConfig, only_sections: Optional[Iterable[str]] = None)
     failed: List[str] = []
 
     sections = _filter_sections(cfg, only_sections)
+    skipped.extend(name for name in ALL_SECTIONS if name not in sections)
 
     logger.info("적용 대상 섹션: %s", sections)
 
-    for name in ALL_SECTIONS:
-        if name not in sections:
-            skipped.append(name)
-            continue
+    def _finish(name: str, error: Optional[BaseException], *, prereq: Optional[str] = None) -> None:
+        if error is None:
+            executed.append(name)
+        elif prereq is not None:
+            # traceback 은 _run_prereqs 에서 이미 한 번 남겼다.
+            failed.append(name)
+            logger.error("섹션 실행 실패: %s (공통 선행 작업 %s 실패)", name, prereq)
+        else:
+            failed.append(name)
+            logger.error("섹션 실행 실패: %s", name, exc_info=error)
+        # 섹션이 리소스를 바꿨을 수 있으므로 (일부만 적용된 실패 포함) 관련 점검 결과를 버린다.
+        for check_name in _SECTION_CHECKS.get(name, ()):
+            check_cache.invalidate_prefix(("check", cfg.gcp_project_id, check_name))
+
+    builds: dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers=len(_IMAGE_SECTIONS), thread_name_prefix="deploy-build") as build_pool:
+        prereq_errors = _run_prereqs(cfg, sections, build_pool, builds)
+
+        pending = [name for name in ALL_SECTIONS if name in sections]
+        for name in list(pending):
+            failed_prereqs = [p for p in _SECTION_PREREQS.get(name, ()) if p in prereq_errors]
+            if failed_prereqs:
+                pending.remove(name)
+                _finish(name, prereq_errors[failed_prereqs[0]], prereq=failed_prereqs[0])
+
+        # 동시에 도는 섹션이 여럿이면 명령별 스피너 대신 하나의 진행표시만 보여준다.
+        scope = progress_scope("섹션 배포 중") if len(pending) > 1 else nullcontext()
+        with scope, ThreadPoolExecutor(max_workers=_APPLY_MAX_WORKERS, thread_name_prefix="deploy-section") as pool:
+            running: dict[Future, str] = {}
+            while pending or running:
+                for name in list(pending):
+                    blockers = _SECTION_AFTER.get(name, ())
+                    if any(dep in pending or dep in running.values() for dep in blockers):
+                        continue
+                    logger.info("섹션 실행: %s", name)
+                    pending.remove(name)
+                    running[pool.submit(_apply_section, name, cfg, builds)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _finish(running.pop(future), future.exception())
+
+    # 요약은 섹션 정의 순서로 보여준다.
+    executed.sort(key=_SECTION_ORDER.__getitem__)
+    failed.sort(key=_SECTION_ORDER.__getitem__)
+
+    summary = f"""# Deploy summary
+- project: {cfg.gcp_project_id}
+
+## Executed sections
+{_bullets(executed)}
+
+## Skipped sections
+{_bullets(skipped)}
+
+## Failed sections
+{_bullets(failed)}"""
+    return summary, bool(failed)
 
-        logger.info("섹션 실행: %s", name)
 
-        try:
-            if name == "backend":
-                # 공통 인프라 준비
-                gcp_auth.ensure_deploy_service_account(cfg)
-                gcp_auth.ensure_iam_roles(cfg)
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_artifact_registry.ensure_repository(cfg)
-                # 이미지 빌드/푸시 및 배포
-                if cfg.backend_image_name:
-                    image_url = gcp_artifact_registry.build_and_push_image(
-                        cfg,
-                        service="backend",
-                        image_name=cfg.backend_image_name,
-                        context_dir=cfg.backend_source_dir,
-                    )
-                    gcp_cloud_run.deploy_backend_service(cfg, image_url)
-            elif name == "etl":
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_artifact_registry.ensure_repository(cfg)
-                if cfg.backend_image_name:
-                    image_url = gcp_artifact_registry.build_and_push_image(
-                        cfg,
-                        service="etl",
-                        image_name=cfg.backend_image_name,
-                        context_dir=cfg.backend_source_dir,
-                    )
-                    gcp_cloud_run.deploy_etl_job(cfg, image_url)
-            elif name == "bq":
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_bq.ensure_bigquery_resources(cfg)
-            elif name == "sql":
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_sql.ensure_cloud_sql(cfg)
-            elif name == "gcs":
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_gcs.ensure_gcs_bucket(cfg)
-            elif name == "secrets":
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_secrets.ensure_secrets(cfg)
-            elif name == "frontend":
-                # 실제 Firebase 배포는 firebase 섹션에서 처리,
-                # 여기서는 프론트엔드 빌드를 담당한다.
-                #
-                # - FRONTEND_SOURCE_DIR 이 설정되어 있다면 해당 디렉토리에서 빌드 스크립트를 실행
-                # - BACKEND_API_HOST 가 설정되어 있다면, 빌드 시 VITE_API_URL 환경변수로 주입
-                build_cmd = cfg.frontend_build_command
-                if not build_cmd:
-                    logger.info(
-                        "프론트엔드 빌드 명령(FRONTEND_BUILD_COMMAND)이 설정되지 않아 "
-                        "frontend 섹션은 로그만 남기고 건너뜁니다."
-                    )
-                else:
-                    cwd = cfg.frontend_source_dir or "."
-                    env = os.environ.copy()
-                    if cfg.backend_api_host:
-                        env["VITE_API_URL"] = cfg.backend_api_host
-                        logger.info(
-                            "프론트엔드 빌드 시 VITE_API_URL 을 설정합니다: %s",
-                            cfg.backend_api_host,
-                        )
-                    logger.info(
-                        "프론트엔드 빌드 실행: cwd=%s cmd=%s",
-                        cwd,
-                        build_cmd,
-                    )
-                    try:
-                        run_command(
-                            shlex.split(build_cmd),
-                            cwd=cwd,
-                            env=env,
-                            timeout=cfg.backend_build_subprocess_timeout_seconds,
-                            stream_output=cfg.cli_stream_subprocess_output,
-                            spinner_message=None
-                            if cfg.cli_stream_subprocess_output
-                            else "프론트엔드 빌드 중",
-                        )
-                    except RuntimeError as e:
-                        raise RuntimeError(
-                            f"프론트엔드 빌드가 실패했습니다. "
-                            "FRONTEND_BUILD_COMMAND 및 빌드 로그를 확인하세요."
-                        ) from e
-            elif name == "frontend_cloud_run":
-                # 프론트엔드 Cloud Run 배포:
-                # - FRONTEND_SOURCE_DIR 의 Dockerfile 컨텍스트를 이미지로 빌드/푸시
-                # - Cloud Run 서비스로 배포
-                gcp_project.ensure_project_and_apis(cfg)
-                gcp_artifact_registry.ensure_repository(cfg)
+# apply_all 섹션 -> 실행 후 다시 점검해야 하는 check 항목 (_run_check_probes 의 이름)
+_SECTION_CHECKS: dict[str, tuple[str, ...]] = {
+    "backend": ("project", "artifact_registry"),
+    "etl": ("project", "artifact_registry"),
+    "frontend_cloud_run": ("project", "artifact_registry"),
+    "bq": ("project", "bq"),
+    "sql": ("project", "sql"),
+    "gcs": ("project", "gcs"),
+    "secrets": ("project", "secrets"),
+}
 
-                if not cfg.frontend_source_dir:
-                    raise RuntimeError(
-                        "FRONTEND_SOURCE_DIR 이 설정되지 않아 frontend_cloud_run 섹션을 실행할 수 없습니다."
-                    )
-                if not cfg.frontend_image_name:
-                    raise RuntimeError(
-                        "FRONTEND_IMAGE_NAME 이 설정되지 않아 frontend_cloud_run 섹션을 실행할 수 없습니다."
-                    )
-
-                image_url = gcp_artifact_registry.build_and_push_image(
-                    cfg,
-                    service="frontend",
-                    image_name=cfg.frontend_image_name,
-                    context_dir=cfg.frontend_source_dir,
-                )
-                gcp_cloud_run.deploy_frontend_service(cfg, image_url)
-            elif name == "firebase":
-                firebase_hosting.deploy_frontend(cfg)
-        except Exception:  # noqa: BLE001
-            failed.append(name)
-            logger.exception("섹션 실행 실패: %s", name)
-            continue
+# 일시적인 조회 실패로 보이는 점검 결과 (디스크 캐시에 남기지 않는다)
+_TRANSIENT_CHECK_MARKERS = ("확인 불가", "실패", "예외")
 
-        executed.append(name)
 
-    lines: List[str] = []
-    lines.append("# Deploy summary")
-    lines.append(f"- project: {cfg.gcp_project_id}")
-    lines.append("")
+def _is_definitive(result: Any) -> bool:
+    """점검 결과에 일시적 실패가 섞여 있지 않으면 True."""
+    items = [result] if isinstance(result, str) else result
+    return not any(marker in item for item in items for marker in _TRANSIENT_CHECK_MARKERS)
 
-    lines.append("## Executed sections")
-    if executed:
-        for s in executed:
-            lines.append(f"- {s}")
-    else:
-        lines.append("- (none)")
 
-    lines.append("")
-    lines.append("## Skipped sections")
-    if skipped:
-        for s in skipped:
-            lines.append(f"- {s}")
-    else:
-        lines.append("- (none)")
+def _check_fingerprint(cfg: DeployConfig, *extra: Any) -> str:
+    """점검 결과를 좌우하는 입력(설정 전체 + 로컬 파일 상태)의 짧은 해시."""
+    return hashlib.sha256(repr((cfg, extra)).encode("utf-8")).hexdigest()[:16]
 
-    lines.append("")
-    lines.append("## Failed sections")
-    if failed:
-        for s in failed:
-            lines.append(f"- {s}")
-    else:
-        lines.append("- (none)")
 
-    summary = "\n".join(lines)
-    return summary, bool(failed)
+def _cached_probe(cfg: DeployConfig, name: str, probe: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """check 항목 하나를 (project, 이름, 입력 해시) 키로 check_cache 에 맡겨 실행한다."""
+    extra: tuple[Any, ...] = ()
+    if name == "secrets":
+        # .env.secrets 내용이 바뀌면 다시 점검해야 한다.
+        path = os.path.join(kwargs.get("base_dir", "."), ".env.secrets")
+        try:
+            st = os.stat(path)
+            extra = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            extra = (path,)
+    key = ("check", cfg.gcp_project_id, name, _check_fingerprint(cfg, *extra))
+    return check_cache.cached_check(
+        key, lambda: probe(*args, **kwargs), should_cache=_is_definitive, persist=True
+    )
+
+
+def _run_check_probes(cfg: DeployConfig, base_dir: str) -> dict[str, Future]:
+    """
+    check_all 에서 사용하는 원격 점검(gcloud / google-cloud 클라이언트 호출)을 스레드 풀에서 동시에 실행한다.
+    최근(CHECK_CACHE_TTL_SECONDS 이내)에 같은 설정으로 점검한 결과는 재사용한다.
+    모든 probe 가 끝난 뒤 {이름: 완료된 Future} 를 반환한다.
+    """
+    from . import gcp_bq, gcp_gcs, gcp_secrets
+
+    checks: dict[str, tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = {
+        "project": (gcp_project.check_project_and_apis, (cfg,), {}),
+        "artifact_registry": (gcp_artifact_registry.check_repository, (cfg,), {}),
+        "gcs": (gcp_gcs.check_gcs_bucket, (cfg,), {}),
+        "bq": (gcp_bq.check_bigquery_resources, (cfg,), {}),
+        "sql": (gcp_sql.check_cloud_sql, (cfg,), {}),
+        "secrets": (gcp_secrets.check_secrets, (cfg,), {"base_dir": base_dir}),
+    }
+    with progress_scope("GCP 리소스 상태 점검 중"):
+        with ThreadPoolExecutor(max_workers=_CHECK_MAX_WORKERS, thread_name_prefix="deploy-check") as pool:
+            probes: dict[str, Future] = {
+                name: pool.submit(_cached_probe, cfg, name, fn, *args, **kwargs)
+                for name, (fn, args, kwargs) in checks.items()
+            }
+    return probes
+
+
+# check 항목 -> (제목, 예외 메시지 접두어, 분류 규칙)
+# 분류 규칙은 (분류, 키워드들) 의 순서 있는 목록이며, 결과 문자열에 키워드가 처음으로 들어 있는 규칙을 따른다.
+# - critical: 배포 전에 반드시 해결해야 하는 문제
+# - warning : 우리 패키지가 배포 중에 생성/활성화할 수 있는 리소스
+_CHECK_REPORT: dict[str, tuple[str, str, tuple[tuple[str, tuple[str, ...]], ...]]] = {
+    "project": (
+        "Project & APIs",
+        "Project/APIs",
+        (
+            ("critical", ("Project: 없음", "확인 불가", "조회 실패")),
+            ("warning", ("API: 비활성화",)),
+        ),
+    ),
+    "artifact_registry": (
+        "Artifact Registry",
+        "Artifact Registry",
+        (
+            ("warning", ("리포지토리 없음",)),
+            ("critical", ("확인 불가", "실패")),
+        ),
+    ),
+    "gcs": (
+        "GCS",
+        "GCS",
+        (
+            # ENABLE_GCS=false 인 경우는 정보성이라 별도 이슈로 보지 않는다.
+            ("critical", ("GCS_BUCKET_NAME 이 설정되지 않았습니다",)),
+            ("warning", ("버킷 없음",)),
+        ),
+    ),
+    "bq": (
+        "BigQuery",
+        "BigQuery",
+        (
+            ("critical", ("BIGQUERY_DATASET_ID 가 설정되지 않았습니다",)),
+            ("warning", ("데이터셋 없음",)),
+        ),
+    ),
+    "sql": (
+        "Cloud SQL",
+        "Cloud SQL",
+        (
+            # Cloud SQL 은 현재 우리 패키지가 리소스를 생성하지 않으므로,
+            # 인스턴스/DB 없음이나 설정 누락을 크리티컬로 본다.
+            ("critical", ("없음", "설정되지 않았습니다", "확인 불가")),
+        ),
+    ),
+    "secrets": (
+        "Secret Manager",
+        "Secrets",
+        (("warning", ("없음",)),),
+    ),
+}
+
+
+def _classify_check(name: str, result: str) -> Optional[str]:
+    """check 결과 한 줄을 "critical" / "warning" / None(정보성) 으로 분류한다."""
+    for bucket, keywords in _CHECK_REPORT[name][2]:
+        if any(k in result for k in keywords):
+            return bucket
+    return None
+
+
+def _report_probe(
+    name: str,
+    probe: Future,
+    lines: List[str],
+    critical: List[str],
+    warnings: List[str],
+    show_all: bool,
+) -> None:
+    """check 항목 하나의 결과를 check_all 리포트 섹션으로 옮기고 critical/warning 으로 분류한다."""
+    title, label, _ = _CHECK_REPORT[name]
+    lines.append(f"## {title}")
+    try:
+        result = probe.result()
+        for r in [result] if isinstance(result, str) else result:
+            if show_all:
+                lines.append(f"- {r}")
+            bucket = _classify_check(name, r)
+            if bucket == "critical":
+                critical.append(r)
+            elif bucket == "warning":
+                warnings.append(r)
+    except Exception as e:  # noqa: BLE001
+        msg = f"{label}: 체크 중 예외 발생: {e}"
+        if show_all:
+            lines.append(f"- {msg}")
+        critical.append(msg)
+
+    lines.append("")
 
 
 def check_all(cfg: DeployConfig, base_dir: str = ".", show_all: bool = False) -> tuple[str, bool]:
@@ -292,46 +675,13 @@ def check_all(cfg: DeployConfig, base_dir: str = ".", show_all: bool = False) ->
     lines.append(f"- region: {cfg.gcp_region}")
     lines.append("")
 
-    # 1) 프로젝트 및 API
-    lines.append("## Project & APIs")
-    try:
-        project_results = gcp_project.check_project_and_apis(cfg)
-        for r in project_results:
-            if show_all:
-                lines.append(f"- {r}")
-            # 프로젝트 없음/확인 불가/조회 실패는 크리티컬
-            if "Project: 없음" in r or "확인 불가" in r or "조회 실패" in r:
-                critical.append(r)
-            # API 비활성화는 우리 패키지가 enable 할 수 있으므로 워닝
-            elif "API: 비활성화" in r:
-                warnings.append(r)
-    except Exception as e:  # noqa: BLE001
-        msg = f"Project/APIs: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
+    # 원격 점검은 서로 독립적이므로 먼저 동시에 실행해 두고, 아래에서는 기존 순서대로 결과를 소비한다.
+    # (각 probe 의 예외는 future.result() 에서 다시 발생하므로 섹션별 예외 처리는 그대로 동작한다)
+    probes = _run_check_probes(cfg, base_dir)
 
-    lines.append("")
-
-    # 2) Artifact Registry
-    lines.append("## Artifact Registry")
-    try:
-        ar_status = gcp_artifact_registry.check_repository(cfg)
-        if show_all:
-            lines.append(f"- {ar_status}")
-        # 리포 없으면 우리 패키지가 생성 가능 → 경고
-        if "리포지토리 없음" in ar_status:
-            warnings.append(ar_status)
-        # 상태 확인 불가 등은 크리티컬
-        elif "확인 불가" in ar_status or "실패" in ar_status:
-            critical.append(ar_status)
-    except Exception as e:  # noqa: BLE001
-        msg = f"Artifact Registry: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
-
-    lines.append("")
+    # 1) 프로젝트 및 API, 2) Artifact Registry
+    for name in ("project", "artifact_registry"):
+        _report_probe(name, probes[name], lines, critical, warnings, show_all)
 
     # 2.5) Backend build context (Dockerfile 등)
     if cfg.deploy_backend or cfg.deploy_etl_job:
@@ -376,7 +726,7 @@ def check_all(cfg: DeployConfig, base_dir: str = ".", show_all: bool = False) ->
         lines.append("")
 
     # 2.6) Frontend (Cloud Run) build context (Dockerfile 등)
-    if getattr(cfg, "deploy_frontend_cloud_run", False):
+    if cfg.deploy_frontend_cloud_run:
         lines.append("## Frontend (Cloud Run) build context")
 
         if not cfg.frontend_source_dir:
@@ -424,81 +774,9 @@ def check_all(cfg: DeployConfig, base_dir: str = ".", show_all: bool = False) ->
 
         lines.append("")
 
-    # 3) GCS
-    lines.append("## GCS")
-    try:
-        gcs_status = gcp_gcs.check_gcs_bucket(cfg)
-        if show_all:
-            lines.append(f"- {gcs_status}")
-        # ENABLE_GCS=false 인 경우는 정보성이라 별도 이슈로 보지 않는다.
-        if "GCS_BUCKET_NAME 이 설정되지 않았습니다" in gcs_status:
-            critical.append(gcs_status)
-        elif "버킷 없음" in gcs_status:
-            # 우리 패키지가 생성할 수 있는 리소스 → 경고
-            warnings.append(gcs_status)
-    except Exception as e:  # noqa: BLE001
-        msg = f"GCS: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
-
-    lines.append("")
-
-    # 4) BigQuery
-    lines.append("## BigQuery")
-    try:
-        bq_status = gcp_bq.check_bigquery_resources(cfg)
-        if show_all:
-            lines.append(f"- {bq_status}")
-        if "BIGQUERY_DATASET_ID 가 설정되지 않았습니다" in bq_status:
-            critical.append(bq_status)
-        elif "데이터셋 없음" in bq_status:
-            # 우리 패키지가 생성할 수 있는 리소스 → 경고
-            warnings.append(bq_status)
-    except Exception as e:  # noqa: BLE001
-        msg = f"BigQuery: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
-
-    lines.append("")
-
-    # 5) Cloud SQL
-    lines.append("## Cloud SQL")
-    try:
-        sql_results = gcp_sql.check_cloud_sql(cfg)
-        for r in sql_results:
-            if show_all:
-                lines.append(f"- {r}")
-            # Cloud SQL 은 현재 우리 패키지가 리소스를 생성하지 않으므로,
-            # 인스턴스/DB 없음이나 설정 누락을 크리티컬로 본다.
-            if "없음" in r or "설정되지 않았습니다" in r or "확인 불가" in r:
-                critical.append(r)
-    except Exception as e:  # noqa: BLE001
-        msg = f"Cloud SQL: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
-
-    lines.append("")
-
-    # 6) Secrets
-    lines.append("## Secret Manager")
-    try:
-        secret_results = gcp_secrets.check_secrets(cfg, base_dir=base_dir)
-        for r in secret_results:
-            if show_all:
-                lines.append(f"- {r}")
-            # Secret 은 우리 패키지가 생성 가능한 리소스이므로, 존재하지 않으면 경고
-            if "없음" in r:
-                warnings.append(r)
-    except Exception as e:  # noqa: BLE001
-        msg = f"Secrets: 체크 중 예외 발생: {e}"
-        if show_all:
-            lines.append(f"- {msg}")
-        critical.append(msg)
-
-    lines.append("")
+    # 3) GCS, 4) BigQuery, 5) Cloud SQL, 6) Secrets
+    for name in ("gcs", "bq", "sql", "secrets"):
+        _report_probe(name, probes[name], lines, critical, warnings, show_all)
 
     # 7) 섹션 활성 상태 요약 (show_all 일 때만 자세히 출력)
     if show_all:
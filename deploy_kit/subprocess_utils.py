@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import codecs
+import functools
+import itertools
+import logging
 import os
-import queue
+import selectors
+import shutil
 import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from textwrap import shorten
-from typing import Mapping, Sequence
+from typing import Callable, Iterator, Mapping, Sequence
 
 from .logging_utils import get_logger
 
@@ -19,11 +26,17 @@ logger = get_logger(__name__)
 # -----------------------------
 # CLI progress indicator config
 # -----------------------------
+@dataclass(frozen=True)
+class _ProgressConfig:
+    show_progress: bool = True
+    idle_seconds: float = 2.0
+    style: str = "braille"  # braille | ascii
+    interval: float = 0.12
+
+
+# 읽기는 락 없이 이 참조를 그대로 읽고, 갱신은 새 객체를 만들어 한 번에 바꿔 끼운다.
+_progress_config = _ProgressConfig()
 _cli_progress_lock = threading.Lock()
-_cli_show_progress: bool = True
-_cli_progress_idle_seconds: float = 2.0
-_cli_progress_style: str = "braille"  # braille | ascii
-_cli_progress_interval: float = 0.12
 
 
 def configure_cli_progress(
@@ -38,16 +51,19 @@ def configure_cli_progress(
 
     주로 CLI 엔트리포인트에서 DeployConfig 값을 한 번 반영하기 위해 사용한다.
     """
-    global _cli_show_progress, _cli_progress_idle_seconds, _cli_progress_style, _cli_progress_interval
+    global _progress_config
+    changes: dict[str, object] = {}
+    if show_progress is not None:
+        changes["show_progress"] = bool(show_progress)
+    if idle_seconds is not None:
+        changes["idle_seconds"] = float(idle_seconds)
+    if style is not None:
+        changes["style"] = str(style)
+    if interval is not None:
+        changes["interval"] = float(interval)
+    # 동시에 설정하는 쪽끼리만 직렬화한다. (run_command 쪽 읽기는 락을 잡지 않는다)
     with _cli_progress_lock:
-        if show_progress is not None:
-            _cli_show_progress = bool(show_progress)
-        if idle_seconds is not None:
-            _cli_progress_idle_seconds = float(idle_seconds)
-        if style is not None:
-            _cli_progress_style = str(style)
-        if interval is not None:
-            _cli_progress_interval = float(interval)
+        _progress_config = replace(_progress_config, **changes)
 
 
 def _is_tty(stream) -> bool:  # noqa: ANN001
@@ -58,24 +74,21 @@ def _is_tty(stream) -> bool:  # noqa: ANN001
 
 
 def _get_progress_defaults() -> tuple[bool, float, str, float]:
-    with _cli_progress_lock:
-        return (
-            _cli_show_progress,
-            _cli_progress_idle_seconds,
-            _cli_progress_style,
-            _cli_progress_interval,
-        )
+    cfg = _progress_config
+    return cfg.show_progress, cfg.idle_seconds, cfg.style, cfg.interval
+
 
+# CLI_SHOW_PROGRESS 등에서 참으로 취급하는 문자열 (소문자 기준)
+_ENV_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "y", "on"})
 
-def _parse_env_bool(name: str) -> bool | None:
-    raw = os.getenv(name)
+
+def _parse_env_bool(raw: str | None) -> bool | None:
     if raw is None:
         return None
-    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return raw.strip().lower() in _ENV_TRUTHY
 
 
-def _parse_env_float(name: str) -> float | None:
-    raw = os.getenv(name)
+def _parse_env_float(raw: str | None) -> float | None:
     if raw is None or raw.strip() == "":
         return None
     try:
@@ -87,18 +100,27 @@ def _parse_env_float(name: str) -> float | None:
 def _progress_settings_from_env() -> tuple[bool | None, float | None, str | None, float | None]:
     # CLI 쪽에서 DeployConfig를 통해 configure_cli_progress를 호출하지 못하는 경우에도 동작하도록
     # env 기반 설정을 지원한다.
-    show = _parse_env_bool("CLI_SHOW_PROGRESS")
-    idle = _parse_env_float("CLI_PROGRESS_IDLE_SECONDS")
-    style = os.getenv("CLI_PROGRESS_STYLE")
-    interval = _parse_env_float("CLI_PROGRESS_INTERVAL_SECONDS")
-    return show, idle, style, interval
+    return _parse_progress_env(
+        os.getenv("CLI_SHOW_PROGRESS"),
+        os.getenv("CLI_PROGRESS_IDLE_SECONDS"),
+        os.getenv("CLI_PROGRESS_STYLE"),
+        os.getenv("CLI_PROGRESS_INTERVAL_SECONDS"),
+    )
 
 
-_BRAILLE_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-_ASCII_FRAMES = ["|", "/", "-", "\\"]
+@functools.lru_cache(maxsize=8)
+def _parse_progress_env(
+    show: str | None, idle: str | None, style: str | None, interval: str | None
+) -> tuple[bool | None, float | None, str | None, float | None]:
+    """env 원문 값 -> 파싱 결과. 값이 그대로면 매 명령마다 다시 파싱하지 않는다."""
+    return _parse_env_bool(show), _parse_env_float(idle), style, _parse_env_float(interval)
 
 
-def _select_frames(style: str) -> list[str]:
+_BRAILLE_FRAMES: tuple[str, ...] = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+_ASCII_FRAMES: tuple[str, ...] = ("|", "/", "-", "\\")
+
+
+def _select_frames(style: str) -> tuple[str, ...]:
     s = (style or "").strip().lower()
     if s == "ascii":
         return _ASCII_FRAMES
@@ -113,8 +135,31 @@ def _format_elapsed(seconds: float) -> str:
     return f"{minutes}m{sec:02d}s"
 
 
-def _default_progress_message(cmd: Sequence[str]) -> str:
-    return shorten(" ".join(cmd), width=72, placeholder="…")
+def _fast_truncate(text: str, width: int) -> str:
+    """text 를 앞에서부터 width 글자까지만 남긴다. (로그용, shorten 과 달리 단어 단위로 나누지 않는다)"""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+class _CommandText:
+    """
+    명령 문자열(" ".join(cmd))을 처음 필요할 때 한 번만 만든다.
+    logger 인자로 넘기면 로그가 실제로 출력될 때만 계산된다.
+    """
+
+    __slots__ = ("_cmd", "_text")
+
+    def __init__(self, cmd: Sequence[str]) -> None:
+        self._cmd = cmd
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = " ".join(self._cmd)
+        return self._text
+
+
+def _default_progress_message(cmd_text: _CommandText) -> str:
+    return shorten(str(cmd_text), width=72, placeholder="…")
 
 
 class _ProgressLine:
@@ -124,29 +169,75 @@ class _ProgressLine:
     """
 
     def __init__(self, message: str, *, stream=None, style: str = "braille") -> None:  # noqa: ANN001
-        self._message = message
         self._stream = stream if stream is not None else sys.stderr
-        self._frames = _select_frames(style)
+        # 프레임마다 바뀌지 않는 "\r{frame} {message}  " 부분은 프레임별로 미리 만들어 둔다.
+        self._prefixes = itertools.cycle([f"\r{frame} {message}  " for frame in _select_frames(style)])
         self._last_len = 0
-
-    def render(self, frame_idx: int, *, elapsed_seconds: float) -> None:
-        frame = self._frames[frame_idx % len(self._frames)]
-        elapsed = _format_elapsed(elapsed_seconds)
-        text = f"{frame} {self._message}  {elapsed}"
-        self._last_len = max(self._last_len, len(text))
-        self._stream.write("\r" + text)
+        self._blank = ""
+
+    def render(self, *, elapsed_seconds: float) -> None:
+        text = next(self._prefixes) + _format_elapsed(elapsed_seconds)
+        if len(text) - 1 > self._last_len:
+            self._last_len = len(text) - 1
+            self._blank = "\r" + (" " * self._last_len) + "\r"
+        self._stream.write(text)
         self._stream.flush()
 
     def clear(self) -> None:
         if self._last_len <= 0:
             return
-        self._stream.write("\r" + (" " * self._last_len) + "\r")
+        self._stream.write(self._blank)
         self._stream.flush()
 
 
+class _RenderLoop:
+    """
+    활성화된 진행표시들을 하나의 백그라운드 스레드에서 그린다.
+
+    스레드는 처음 사용할 때 한 번만 띄우고, 그릴 것이 없으면 Condition 에서 잠든다.
+    한 줄을 같이 쓰므로 여러 진행표시가 동시에 활성화되어 있으면 가장 최근 것만 그린다.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._active: list[_IdleProgressIndicator] = []
+        self._thread: threading.Thread | None = None
+
+    def acquire(self, indicator: "_IdleProgressIndicator") -> None:
+        with self._cond:
+            self._active.append(indicator)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="deploy-kit-progress", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def release(self, indicator: "_IdleProgressIndicator") -> None:
+        with self._cond:
+            if indicator in self._active:
+                self._active.remove(indicator)
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._active:
+                    self._cond.wait()
+                current = self._active[-1]
+                hidden = self._active[:-1]
+            for indicator in hidden:
+                indicator.clear()
+            delay = current._tick(current._clock())
+            with self._cond:
+                self._cond.wait(timeout=delay)
+
+
+_UI = _RenderLoop()
+
+
 class _IdleProgressIndicator:
     """
     '무출력(idle)' 구간에서만 진행표시를 렌더하는 스피너.
+    실제 렌더링은 공유 스레드(_UI)가 맡는다.
     """
 
     def __init__(
@@ -157,57 +248,69 @@ class _IdleProgressIndicator:
         style: str = "braille",
         interval: float = 0.12,
         idle_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._line = _ProgressLine(message, stream=stream, style=style)
+        # idle/경과 시간 계산에 쓰는 시계. (run_command 의 clock 과 같은 것을 써야 한다)
+        self._clock = clock
         self._interval = max(float(interval), 0.02)
         self._idle_seconds = max(float(idle_seconds), 0.0)
-        self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
+        # _tick(렌더 스레드)과 clear/stop(호출 스레드)이 같은 줄을 동시에 쓰지 않도록 한다.
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = False
         self._start_time = 0.0
         self._last_activity_getter = None  # type: ignore[assignment]
         self._shown = False
 
     def start(self, *, start_time: float, last_activity_getter) -> None:  # noqa: ANN001
-        if self._thread is not None:
+        if self._started:
             return
+        self._started = True
         self._start_time = start_time
         self._last_activity_getter = last_activity_getter
-
-        def _run() -> None:
-            idx = 0
-            while not self._stop.is_set():
-                now = time.monotonic()
-                last = float(self._last_activity_getter())
-                idle = now - last
-
-                if idle < self._idle_seconds:
-                    if self._shown:
-                        self._line.clear()
-                        self._shown = False
-                    sleep_for = min(self._interval, max(self._idle_seconds - idle, 0.02))
-                    time.sleep(sleep_for)
-                    continue
-
-                self._line.render(idx, elapsed_seconds=now - self._start_time)
-                self._shown = True
-                idx += 1
-                time.sleep(self._interval)
-
-        self._thread = threading.Thread(target=_run, daemon=True)
-        self._thread.start()
+        _UI.acquire(self)
+
+    def _tick(self, now: float) -> float:
+        """한 번 그리거나 지우고, 다음 tick 까지 기다릴 시간(초)을 돌려준다."""
+        with self._lock:
+            if self._stopped:
+                return 0.0
+            idle = now - float(self._last_activity_getter())
+            if idle < self._idle_seconds:
+                if self._shown:
+                    self._line.clear()
+                    self._shown = False
+                return min(self._interval, max(self._idle_seconds - idle, 0.02))
+            self._line.render(elapsed_seconds=now - self._start_time)
+            self._shown = True
+            return self._interval
 
     def clear(self) -> None:
-        if self._shown:
-            self._line.clear()
-            self._shown = False
+        with self._lock:
+            if self._shown:
+                self._line.clear()
+                self._shown = False
 
     def stop(self) -> None:
-        self._stop.set()
-        if self._thread is not None:
-            self._thread.join(timeout=1.0)
+        with self._lock:
+            self._stopped = True
+        _UI.release(self)
         self.clear()
 
 
+# stream_output=True 일 때 에러 메시지/RunResult 용으로 보관하는 최대 줄 수
+_STREAM_TAIL_LINES = 200
+# 실패 시 예외 메시지에 붙이는 출력의 최대 줄 수 (gcloud/docker 의 에러는 보통 마지막 줄에 있다)
+_ERROR_TAIL_LINES = 40
+
+
+def _tail(text: str, max_lines: int = _ERROR_TAIL_LINES) -> str:
+    """text 의 마지막 max_lines 줄만 돌려준다. (뒤에서부터 필요한 만큼만 자른다)"""
+    parts = text.rstrip().rsplit("\n", max_lines)
+    return "\n".join(parts[-max_lines:])
+
+
 @dataclass(frozen=True)
 class RunResult:
     returncode: int
@@ -228,20 +331,21 @@ class Spinner:
         self._interval = interval
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
-        self._frames = ["|", "/", "-", "\\"]
+        self._frames = _ASCII_FRAMES
 
     def start(self) -> None:
         if self._thread is not None:
             return
 
         def _run() -> None:
-            idx = 0
-            while not self._stop.is_set():
-                frame = self._frames[idx % len(self._frames)]
+            for frame in itertools.cycle(self._frames):
+                if self._stop.is_set():
+                    break
                 sys.stderr.write(f"\r{self._message} {frame}")
                 sys.stderr.flush()
-                idx += 1
-                time.sleep(self._interval)
+                # stop() 이 호출되면 interval 을 다 기다리지 않고 바로 깨어난다.
+                if self._stop.wait(self._interval):
+                    break
 
         self._thread = threading.Thread(target=_run, daemon=True)
         self._thread.start()
@@ -262,6 +366,128 @@ class Spinner:
         self.stop()
 
 
+def _effective_progress_settings(
+    show_progress: bool | None,
+    idle_seconds: float | None,
+    style: str | None,
+    interval: float | None,
+) -> tuple[bool, float, str, float]:
+    """progress 설정을 결정한다. (우선순위: 호출 인자 > env > 전역 기본값)"""
+    default_show, default_idle, default_style, default_interval = _get_progress_defaults()
+    env_show, env_idle, env_style, env_interval = _progress_settings_from_env()
+
+    effective_show = (
+        bool(show_progress)
+        if show_progress is not None
+        else (env_show if env_show is not None else default_show)
+    )
+    effective_idle = (
+        float(idle_seconds)
+        if idle_seconds is not None
+        else (env_idle if env_idle is not None else default_idle)
+    )
+    effective_style = (
+        str(style)
+        if style is not None
+        else (env_style if env_style is not None else default_style)
+    )
+    effective_interval = (
+        float(interval)
+        if interval is not None
+        else (env_interval if env_interval is not None else default_interval)
+    )
+    return effective_show, effective_idle, effective_style, effective_interval
+
+
+# progress_scope 중첩 깊이 (0 보다 크면 개별 run_command 는 진행표시를 그리지 않는다)
+_progress_scope_lock = threading.Lock()
+_progress_scope_depth = 0
+# 활성화된 progress_scope 진행표시와, 스코프 안의 명령이 마지막으로 출력한 시각
+# (스코프 진행표시는 이 시각을 idle 판정에 쓰므로 출력이 흐르는 동안에는 그리지 않는다)
+_scope_indicators: list[_IdleProgressIndicator] = []
+_scope_last_output = 0.0
+
+
+def _progress_scope_active() -> bool:
+    with _progress_scope_lock:
+        return _progress_scope_depth > 0
+
+
+def _note_scope_output() -> None:
+    """
+    터미널에 출력하기 직전에 호출한다.
+    스코프 진행표시의 idle 시각을 갱신하고, 그려져 있던 진행표시를 지운다.
+    """
+    global _scope_last_output
+    _scope_last_output = time.monotonic()
+    for indicator in tuple(_scope_indicators):
+        indicator.clear()
+
+
+@contextmanager
+def progress_scope(message: str) -> Iterator[None]:
+    """
+    여러 명령을 스레드로 동시에 실행하는 동안 진행표시를 하나만 렌더링한다.
+
+    스코프 안(다른 스레드 포함)에서 실행되는 run_command 는 각자의 진행표시를 끄므로,
+    여러 스피너가 같은 줄을 덮어쓰며 깨지는 것을 막는다.
+    스코프 안의 명령이 출력을 흘리는 동안에는 진행표시를 지우고, 출력이 멈춘 뒤에만 다시 그린다.
+    """
+    global _progress_scope_depth, _scope_last_output
+
+    show, idle, style, interval = _effective_progress_settings(None, None, None, None)
+    indicator: _IdleProgressIndicator | None = None
+    if show and _is_tty(sys.stderr):
+        started = time.monotonic()
+        _scope_last_output = started
+        indicator = _IdleProgressIndicator(
+            message=message,
+            stream=sys.stderr,
+            style=style,
+            interval=interval,
+            idle_seconds=idle,
+        )
+        indicator.start(start_time=started, last_activity_getter=lambda: _scope_last_output)
+
+    with _progress_scope_lock:
+        _progress_scope_depth += 1
+        if indicator is not None:
+            _scope_indicators.append(indicator)
+    try:
+        yield
+    finally:
+        with _progress_scope_lock:
+            _progress_scope_depth -= 1
+            if indicator is not None:
+                _scope_indicators.remove(indicator)
+        if indicator is not None:
+            indicator.stop()
+
+
+@functools.lru_cache(maxsize=32)
+def _which(name: str, path: str | None) -> str | None:
+    """(명령 이름, PATH) 별 shutil.which 결과. PATH 가 바뀌면 다시 탐색한다."""
+    return shutil.which(name, path=path)
+
+
+def _resolve_executable(cmd: Sequence[str], env: Mapping[str, str] | None) -> list[str]:
+    """
+    cmd[0] 을 PATH 에서 찾아 절대 경로로 바꾼 argv 를 반환한다.
+    찾을 수 없으면 프로세스를 띄우기 전에 RuntimeError 를 발생시킨다.
+    """
+    argv = list(cmd)
+    name = argv[0]
+    if os.sep in name or (os.altsep and os.altsep in name):
+        return argv
+    resolved = _which(name, (env if env is not None else os.environ).get("PATH"))
+    if resolved is None:
+        raise RuntimeError(
+            f"필요한 명령을 찾을 수 없습니다: {name} (gcloud/docker 가 설치되어 있는지 확인하세요)"
+        )
+    argv[0] = resolved
+    return argv
+
+
 def run_command(
     cmd: Sequence[str],
     *,
@@ -274,77 +500,60 @@ def run_command(
     progress_idle_seconds: float | None = None,
     progress_style: str | None = None,
     progress_interval: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
 ) -> RunResult:
     """
     subprocess 실행 공통 유틸.
 
     - stream_output=False: stdout/stderr 캡처(기존 동작과 유사), 실패 시 요약 포함
     - stream_output=True : stdout/stderr 를 실시간으로 터미널에 흘린다(진행 상황 확인 용이)
+      (메모리 사용을 제한하기 위해 RunResult.stdout 에는 마지막 _STREAM_TAIL_LINES 줄만 담긴다)
+    - clock: 진행표시의 idle 판정과 stream 모드의 timeout 계산에 쓰는 시계 (테스트에서 가상 시계 주입용)
     """
-    logger.info("명령 실행: %s", " ".join(cmd))
+    cmd_text = _CommandText(cmd)
+    logger.info("명령 실행: %s", cmd_text)
+    argv = _resolve_executable(cmd, env)
 
-    # progress 설정(우선순위: 호출 인자 > env > 전역 기본값)
-    default_show, default_idle, default_style, default_interval = _get_progress_defaults()
-    env_show, env_idle, env_style, env_interval = _progress_settings_from_env()
-
-    effective_show = (
-        bool(show_progress)
-        if show_progress is not None
-        else (env_show if env_show is not None else default_show)
-    )
-    effective_idle = (
-        float(progress_idle_seconds)
-        if progress_idle_seconds is not None
-        else (env_idle if env_idle is not None else default_idle)
-    )
-    effective_style = (
-        str(progress_style)
-        if progress_style is not None
-        else (env_style if env_style is not None else default_style)
-    )
-    effective_interval = (
-        float(progress_interval)
-        if progress_interval is not None
-        else (env_interval if env_interval is not None else default_interval)
+    effective_show, effective_idle, effective_style, effective_interval = _effective_progress_settings(
+        show_progress, progress_idle_seconds, progress_style, progress_interval
     )
 
+    # progress_scope 안에서는 스코프가 진행표시를 하나만 그리므로 개별 명령은 그리지 않는다.
+    can_render_progress = (
+        bool(effective_show) and not _progress_scope_active() and _is_tty(sys.stderr)
+    )
     # 메시지가 없으면 커맨드 기반 기본 메시지 생성 (\"모든 단계\" 공통 적용)
-    progress_message = spinner_message or _default_progress_message(cmd)
-    can_render_progress = bool(effective_show) and _is_tty(sys.stderr)
+    progress_message = ""
+    if can_render_progress:
+        progress_message = spinner_message or _default_progress_message(cmd_text)
 
     if stream_output:
         # gcloud/docker는 stderr로도 진행 로그를 자주 내보내므로 STDOUT으로 합친다.
         try:
             proc = subprocess.Popen(  # noqa: S603
-                list(cmd),
+                argv,
                 cwd=cwd,
-                env=dict(env) if env is not None else None,
+                env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
             )
         except FileNotFoundError as e:
             raise RuntimeError(
                 f"필요한 명령을 찾을 수 없습니다: {cmd[0]} (gcloud/docker 가 설치되어 있는지 확인하세요)"
             ) from e
 
-        out_lines: list[str] = []
-        started = time.monotonic()
+        # 출력은 이미 터미널로 흘려보내므로, 에러 메시지/결과용으로는 마지막 일부만 보관한다.
+        # (디코딩은 끝난 뒤 남은 줄에 대해서만 한 번 한다)
+        out_lines: deque[bytes] = deque(maxlen=_STREAM_TAIL_LINES)
+        started = clock()
         deadline = None if timeout is None else started + float(timeout)
 
-        # last activity timestamp shared across threads
-        last_activity_lock = threading.Lock()
+        # 진행표시 스레드가 읽는 마지막 출력 시각 (float 대입은 원자적이라 락 없이 공유한다)
         last_activity = started
 
         def _get_last_activity() -> float:
-            with last_activity_lock:
-                return last_activity
-
-        def _touch_activity() -> None:
-            nonlocal last_activity
-            with last_activity_lock:
-                last_activity = time.monotonic()
+            return last_activity
 
         indicator: _IdleProgressIndicator | None = None
         if can_render_progress:
@@ -354,88 +563,106 @@ def run_command(
                 style=effective_style,
                 interval=effective_interval,
                 idle_seconds=effective_idle,
+                clock=clock,
             )
             indicator.start(start_time=started, last_activity_getter=_get_last_activity)
 
-        q: queue.Queue[str | None] = queue.Queue()
-
-        def _reader() -> None:
-            try:
-                assert proc.stdout is not None
-                for line in proc.stdout:
-                    q.put(line)
-            finally:
-                q.put(None)
-
-        reader_thread = threading.Thread(target=_reader, daemon=True)
-        reader_thread.start()
+        # 별도 reader 스레드/큐 없이 이 스레드에서 파이프를 select 로 기다렸다가 읽은 만큼 바로 흘려보낸다.
+        # 터미널로는 받은 바이트를 그대로 쓰고, 보관용으로는 바이트 그대로 줄 단위로 나눠 둔다.
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+        # select 가 읽을 수 있다고 알려 준 뒤에도 read 가 절대 멈추지 않도록 파이프를 non-blocking 으로 둔다.
+        os.set_blocking(fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        out_buffer = getattr(sys.stdout, "buffer", None)
+        # 바이트 버퍼가 없는 stdout(테스트의 StringIO 등)에만 쓴다. 청크 경계에서 잘린 멀티바이트 문자를 이어 붙인다.
+        text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        partial = b""
+
+        def _emit(chunk: bytes) -> None:
+            nonlocal partial, last_activity
+            if indicator is not None:
+                indicator.clear()
+            _note_scope_output()
+            if out_buffer is not None:
+                sys.stdout.flush()
+                out_buffer.write(chunk)
+                out_buffer.flush()
+            else:
+                sys.stdout.write(text_decoder.decode(chunk))
+                sys.stdout.flush()
+            *lines, partial = (partial + chunk).split(b"\n")
+            out_lines.extend(line + b"\n" for line in lines)
+            last_activity = clock()
 
         try:
             while True:
-                now = time.monotonic()
+                now = clock()
                 if deadline is not None and now >= deadline:
                     proc.kill()
                     raise RuntimeError(
-                        f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {' '.join(cmd)}"
+                        f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {cmd_text}"
                     )
 
                 remaining = None if deadline is None else max(deadline - now, 0.0)
-                get_timeout = 0.1 if remaining is None else min(0.1, remaining)
+                select_timeout = 0.1 if remaining is None else min(0.1, remaining)
+
+                if not selector.select(timeout=select_timeout):
+                    if proc.poll() is None:
+                        continue
+                    # 프로세스는 끝났는데 (자식 프로세스가 파이프를 쥐고 있는 등) EOF 가 오지 않으면
+                    # 잠깐만 더 기다렸다가 그만 읽는다.
+                    if not selector.select(timeout=0.2):
+                        break
 
                 try:
-                    item = q.get(timeout=get_timeout)
-                except queue.Empty:
-                    if proc.poll() is not None:
-                        # reader 종료까지 잠깐 더 기다림
-                        try:
-                            item = q.get(timeout=0.2)
-                        except queue.Empty:
-                            break
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    # 읽을 것이 없는데 깨어난 경우 (spurious wakeup)
                     continue
-
-                if item is None:
+                if not chunk:
                     break
+                _emit(chunk)
 
-                if indicator is not None:
-                    indicator.clear()
-
-                out_lines.append(item)
-                sys.stdout.write(item)
-                sys.stdout.flush()
-                _touch_activity()
-
-            reader_thread.join(timeout=1.0)
+            if partial:
+                out_lines.append(partial)
 
             wait_timeout = None
             if deadline is not None:
-                wait_timeout = max(deadline - time.monotonic(), 0.0)
+                wait_timeout = max(deadline - clock(), 0.0)
             returncode = proc.wait(timeout=wait_timeout)
         except subprocess.TimeoutExpired as e:
             proc.kill()
             raise RuntimeError(
-                f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {' '.join(cmd)}"
+                f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {cmd_text}"
             ) from e
         finally:
+            selector.close()
             try:
-                if proc.stdout is not None:
-                    proc.stdout.close()
+                proc.stdout.close()
             except Exception:  # noqa: BLE001
                 pass
             if indicator is not None:
                 indicator.stop()
 
         if returncode != 0:
-            combined = "".join(out_lines).strip()
-            detail = "\nstdout/stderr:\n" + shorten(combined, width=2000) if combined else ""
+            # out_lines 는 이미 _STREAM_TAIL_LINES 줄로 제한되어 있다.
+            combined = _tail(b"".join(out_lines).decode("utf-8", errors="replace").strip())
+            detail = "\nstdout/stderr:\n" + combined if combined else ""
             raise RuntimeError(
-                f"명령 실행 실패: {' '.join(cmd)} (exit={returncode}){detail}"
+                f"명령 실행 실패: {cmd_text} (exit={returncode}){detail}"
             )
 
-        return RunResult(returncode=returncode, stdout="".join(out_lines), stderr="")
+        return RunResult(
+            returncode=returncode,
+            stdout=b"".join(out_lines).decode("utf-8", errors="replace"),
+            stderr="",
+        )
 
     # capture 모드 (조용히 돌리고 실패 시 요약)
     indicator2: _IdleProgressIndicator | None = None
-    started = time.monotonic()
+    started = clock()
     last_activity_capture = started
 
     def _get_last_activity_capture() -> float:
@@ -448,23 +675,25 @@ def run_command(
             style=effective_style,
             interval=effective_interval,
             idle_seconds=effective_idle,
+            clock=clock,
         )
         indicator2.start(start_time=started, last_activity_getter=_get_last_activity_capture)
 
     try:
         result = subprocess.run(
-            list(cmd),
+            argv,
             check=True,
             capture_output=True,
             text=True,
             timeout=timeout,
             cwd=cwd,
-            env=dict(env) if env is not None else None,
+            env=env,
         )
-        if result.stdout:
-            logger.debug("명령 stdout: %s", shorten(result.stdout.strip(), width=2000))
-        if result.stderr:
-            logger.debug("명령 stderr: %s", shorten(result.stderr.strip(), width=2000))
+        if logger.isEnabledFor(logging.DEBUG):
+            if result.stdout:
+                logger.debug("명령 stdout: %s", _fast_truncate(result.stdout.strip(), 2000))
+            if result.stderr:
+                logger.debug("명령 stderr: %s", _fast_truncate(result.stderr.strip(), 2000))
         return RunResult(returncode=result.returncode, stdout=result.stdout or "", stderr=result.stderr or "")
     except FileNotFoundError as e:
         raise RuntimeError(
@@ -472,18 +701,18 @@ def run_command(
         ) from e
     except subprocess.TimeoutExpired as e:
         raise RuntimeError(
-            f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {' '.join(cmd)}"
+            f"명령 실행이 {timeout}초 안에 끝나지 않았습니다: {cmd_text}"
         ) from e
     except subprocess.CalledProcessError as e:
         stdout = (e.stdout or "").strip()
         stderr = (e.stderr or "").strip()
         detail = ""
         if stderr:
-            detail = "\nstderr:\n" + shorten(stderr, width=2000)
+            detail = "\nstderr:\n" + _tail(stderr)
         elif stdout:
-            detail = "\nstdout:\n" + shorten(stdout, width=2000)
+            detail = "\nstdout:\n" + _tail(stdout)
         raise RuntimeError(
-            f"명령 실행 실패: {' '.join(cmd)} (exit={e.returncode}){detail}"
+            f"명령 실행 실패: {cmd_text} (exit={e.returncode}){detail}"
         ) from e
     finally:
         if indicator2 is not None:
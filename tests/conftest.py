@@ -11,10 +11,84 @@ from __future__ import annotations
 
 import os
 import sys
+from typing import Callable, Mapping
+
+import pytest
+
+
+# conftest 가 import 될 때 한 번만 계산한다.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def pytest_configure() -> None:
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    if repo_root not in sys.path:
-        sys.path.insert(0, repo_root)
+    if _REPO_ROOT not in sys.path:
+        sys.path.insert(0, _REPO_ROOT)
+
+
+@pytest.fixture(scope="session")
+def _env_snapshot() -> dict[str, str]:
+    """세션 시작 시점의 환경변수. 테스트가 os.environ 을 직접 바꿔도 여기로 되돌린다."""
+    return dict(os.environ)
+
+
+@pytest.fixture(autouse=True)
+def _restore_env(_env_snapshot: dict[str, str]):
+    """
+    테스트가 바꾼 os.environ 을 세션 스냅샷으로 되돌린다.
+
+    monkeypatch 보다 먼저 설정되므로 teardown 은 가장 나중에 실행된다.
+    키마다 undo 기록을 남기지 않고, 끝날 때 달라진 키만 한 번에 맞춘다.
+    """
+    yield
+    env = os.environ
+    if env == _env_snapshot:
+        return
+    for key in env.keys() - _env_snapshot.keys():
+        del env[key]
+    for key, value in _env_snapshot.items():
+        if env.get(key) != value:
+            env[key] = value
+
+
+@pytest.fixture(scope="session")
+def deploy_cfg():
+    """
+    테스트 공용 최소 DeployConfig. frozen 이므로 세션 동안 하나를 공유하고,
+    테스트별 차이는 dataclasses.replace 로 만든다.
+    """
+    from deploy_kit.config import DeployConfig
+
+    return DeployConfig(
+        gcp_project_id="test-project",
+        gcp_region="us-central1",
+        deploy_sa_email="sa@test-project.iam.gserviceaccount.com",
+        artifact_registry_repo="apps",
+        backend_service_name="backend",
+    )
+
+
+@pytest.fixture
+def set_env_bulk(monkeypatch: pytest.MonkeyPatch) -> Callable[[Mapping[str, str]], None]:
+    """
+    여러 환경변수를 한 번에 덮어쓴다.
+
+    키마다 setenv 하지 않고 os.environ 을 (현재 값 + overrides) 사본으로 한 번만 교체하므로,
+    teardown 도 원래 os.environ 객체를 되돌리는 한 번으로 끝난다.
+    이후의 monkeypatch.setenv/delenv 는 이 사본에 적용된다. (자식 프로세스 환경에는 반영되지 않음)
+    """
+
+    def apply(overrides: Mapping[str, str]) -> None:
+        monkeypatch.setattr(os, "environ", {**os.environ, **overrides})
+
+    return apply
+
+
+@pytest.fixture(autouse=True)
+def _isolated_check_cache(tmp_path, monkeypatch) -> None:
+    """점검 캐시가 사용자 홈의 ~/.cache 를 읽거나 쓰지 않도록 테스트마다 임시 파일을 쓴다."""
+    from deploy_kit import check_cache
 
+    monkeypatch.setattr(check_cache, "CACHE_FILE", str(tmp_path / "checks.json"))
+    monkeypatch.setattr(check_cache, "_cache", {})
+    monkeypatch.setattr(check_cache, "_loaded", False)
+    monkeypatch.setattr(check_cache, "_bypass", False)
@@ -1,8 +1,10 @@
+import dataclasses
 import os
 
 import pytest
+from dotenv import dotenv_values
 
-from deploy_kit.config import DeployConfig
+from deploy_kit.config import DeployConfig, Feature, load_env_files, read_env_file
 
 
 def _base_env() -> dict[str, str]:
@@ -15,97 +17,150 @@ def _base_env() -> dict[str, str]:
     }
 
 
-def test_missing_required_env_raises_value_error(
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.fixture
+def base_env(set_env_bulk) -> None:
+    """필수 환경변수를 모두 채워 둔다. 각 테스트는 바꿀 키만 setenv/delenv 한다."""
+    set_env_bulk(_base_env())
+
+
+_FRONTEND_CLOUD_RUN_ENV = {
+    "DEPLOY_FRONTEND_CLOUD_RUN": "true",
+    "FRONTEND_SOURCE_DIR": "frontend",
+    "FRONTEND_IMAGE_NAME": "frontend",
+}
+
+# (덮어쓸 값, 지울 키, 오류 메시지에 들어가야 할 키 후보)
+_VALIDATION_CASES = [
+    # 필수 값 중 하나만 비워둔다.
+    *(pytest.param({}, (key,), (key,), id=f"missing-{key}") for key in sorted(_base_env())),
+    pytest.param(
+        {"ENABLE_BIGQUERY": "true"},
+        ("BIGQUERY_DATASET_ID",),
+        ("BIGQUERY_DATASET_ID",),
+        id="bigquery-requires-dataset",
+    ),
+    pytest.param(
+        {"CLOUD_BUILD_TIMEOUT_SECONDS": "not-an-int"},
+        (),
+        ("CLOUD_BUILD_TIMEOUT_SECONDS",),
+        id="invalid-timeout",
+    ),
+    pytest.param(
+        _FRONTEND_CLOUD_RUN_ENV,
+        ("FRONTEND_SERVICE_NAME",),
+        ("FRONTEND_SERVICE_NAME",),
+        id="frontend-requires-service-name",
+    ),
+    pytest.param(
+        {**_FRONTEND_CLOUD_RUN_ENV, "FRONTEND_SERVICE_NAME": "frontend-svc", "FRONTEND_API_PREFIX": "/api"},
+        ("FRONTEND_API_TARGET", "BACKEND_API_HOST"),
+        ("FRONTEND_API_TARGET", "BACKEND_API_HOST"),
+        id="frontend-proxy-requires-target",
+    ),
+]
+
+
+@pytest.mark.parametrize("overrides,deletes,expected", _VALIDATION_CASES)
+@pytest.mark.usefixtures("base_env")
+def test_from_env_validation_raises_value_error(
+    set_env_bulk,
+    overrides: dict[str, str],
+    deletes: tuple[str, ...],
+    expected: tuple[str, ...],
 ) -> None:
-    env = _base_env()
-
-    # 필수 값 중 GCP_PROJECT_ID 만 비워둔다.
-    for key, value in env.items():
-        if key == "GCP_PROJECT_ID":
-            continue
-        monkeypatch.setenv(key, value)
-    monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+    set_env_bulk(overrides)
+    for key in deletes:
+        os.environ.pop(key, None)
 
     with pytest.raises(ValueError) as excinfo:
         DeployConfig.from_env()
 
-    assert "GCP_PROJECT_ID" in str(excinfo.value)
+    assert any(key in str(excinfo.value) for key in expected), excinfo.value
 
 
-def test_bigquery_toggle_requires_dataset_id(monkeypatch: pytest.MonkeyPatch) -> None:
-    env = _base_env()
-    env.update(
-        {
-            "ENABLE_BIGQUERY": "true",
-            # BIGQUERY_DATASET_ID intentionally omitted
-        }
-    )
+def test_load_env_files_without_override_keeps_existing_values(tmp_path) -> None:
+    (tmp_path / ".env.infra").write_text("GCP_REGION=from-file\nGCP_PROJECT_ID=file-project\n")
+    # 바꾼 환경변수는 conftest 의 _restore_env 가 되돌린다.
+    os.environ["GCP_REGION"] = "from-env"
+    os.environ.pop("GCP_PROJECT_ID", None)
 
-    for key, value in env.items():
-        monkeypatch.setenv(key, value)
+    load_env_files(str(tmp_path), override=False)
 
-    with pytest.raises(ValueError) as excinfo:
-        DeployConfig.from_env()
+    assert os.environ["GCP_REGION"] == "from-env"
+    assert os.environ["GCP_PROJECT_ID"] == "file-project"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # 빠른 경로로 처리되는 단순한 형태
+        "A=1\nB = two \n\n# comment\nC='quoted value'\nD=\"dq\"\nE=\n",
+        "\ufeffKEY=value\nKEY=override\n",
+        # dotenv 전체 파서로 폴백해야 하는 형태
+        "export A=1\nB\nC=x # inline comment\n",
+        "A=1\nB=${A}-suffix\nC=\"line\\nbreak\"\n",
+        "A=\"multi\nline\"\nB=2\r\n",
+    ],
+)
+def test_read_env_file_matches_python_dotenv(tmp_path, content: str) -> None:
+    path = tmp_path / ".env.infra"
+    path.write_text(content, encoding="utf-8")
 
-    assert "BIGQUERY_DATASET_ID" in str(excinfo.value)
+    assert read_env_file(str(path)) == dict(dotenv_values(str(path)))
 
 
-def test_invalid_timeout_env_raises_value_error(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_from_env_accepts_explicit_mapping() -> None:
+    # os.environ 에 값이 없어도, 넘겨준 매핑만으로 설정을 만들 수 있어야 한다.
+    os.environ.pop("GCP_PROJECT_ID", None)
     env = _base_env()
-    for key, value in env.items():
-        monkeypatch.setenv(key, value)
+    env["ENABLE_BIGQUERY"] = "true"
+    env["BIGQUERY_DATASET_ID"] = "analytics"
 
-    monkeypatch.setenv("CLOUD_BUILD_TIMEOUT_SECONDS", "not-an-int")
+    cfg = DeployConfig.from_env(env)
+
+    assert cfg.gcp_project_id == "test-project"
+    assert cfg.bigquery_project_id == "test-project"
 
-    with pytest.raises(ValueError) as excinfo:
-        DeployConfig.from_env()
 
-    assert "CLOUD_BUILD_TIMEOUT_SECONDS" in str(excinfo.value)
+def test_read_env_file_skips_non_regular_files(tmp_path) -> None:
+    (tmp_path / ".env.infra").mkdir()
 
+    assert read_env_file(str(tmp_path / ".env.infra")) == {}
 
-def test_frontend_cloud_run_requires_service_name(monkeypatch: pytest.MonkeyPatch) -> None:
+
+def test_features_bitmask_reflects_toggles() -> None:
     env = _base_env()
     env.update(
         {
-            "DEPLOY_FRONTEND_CLOUD_RUN": "true",
-            "FRONTEND_SOURCE_DIR": "frontend",
-            "FRONTEND_IMAGE_NAME": "frontend",
-            # FRONTEND_SERVICE_NAME intentionally omitted
+            "ENABLE_FIREBASE": "true",
+            "FIREBASE_PROJECT_ID": "fb",
+            "FIREBASE_HOSTING_SITE": "site",
+            "DEPLOY_BACKEND": "false",
         }
     )
 
-    for key, value in env.items():
-        monkeypatch.setenv(key, value)
+    cfg = DeployConfig.from_env(env)
 
-    with pytest.raises(ValueError) as excinfo:
-        DeployConfig.from_env()
+    assert (Feature.ENABLE_FIREBASE | Feature.DEPLOY_FRONTEND) in cfg.features
+    assert Feature.DEPLOY_BACKEND not in cfg.features
 
-    assert "FRONTEND_SERVICE_NAME" in str(excinfo.value)
 
+def test_deploy_config_is_slotted_and_frozen() -> None:
+    cfg = DeployConfig.from_env(_base_env())
 
-def test_frontend_cloud_run_proxy_requires_target_or_backend_host(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    env = _base_env()
-    env.update(
-        {
-            "DEPLOY_FRONTEND_CLOUD_RUN": "true",
-            "FRONTEND_SERVICE_NAME": "frontend-svc",
-            "FRONTEND_SOURCE_DIR": "frontend",
-            "FRONTEND_IMAGE_NAME": "frontend",
-            "FRONTEND_API_PREFIX": "/api",
-            # FRONTEND_API_TARGET intentionally omitted
-            # BACKEND_API_HOST intentionally omitted
-        }
-    )
+    # slots=True 이므로 인스턴스 __dict__ 가 없고, frozen 이므로 속성 변경이 막혀야 한다.
+    assert not hasattr(cfg, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.gcp_region = "asia-northeast3"  # type: ignore[misc]
 
-    for key, value in env.items():
-        monkeypatch.setenv(key, value)
 
-    with pytest.raises(ValueError) as excinfo:
-        DeployConfig.from_env()
+def test_from_env_reuses_result_for_same_values() -> None:
+    env = _base_env()
 
-    assert "FRONTEND_API_TARGET" in str(excinfo.value) or "BACKEND_API_HOST" in str(
-        excinfo.value
-    )
+    first = DeployConfig.from_env(env)
+    # 관련 없는 키는 key 에 들어가지 않는다.
+    assert DeployConfig.from_env({**env, "UNRELATED": "x"}) is first
+
+    changed = DeployConfig.from_env({**env, "GCP_REGION": "asia-northeast3"})
+    assert changed is not first
+    assert changed.gcp_region == "asia-northeast3"
@@ -0,0 +1,25 @@
+import json
+from dataclasses import replace
+
+from deploy_kit.config import DeployConfig
+from deploy_kit import firebase_hosting as fh
+
+
+def test_ensure_firebase_json_creates_default_config(monkeypatch, tmp_path, deploy_cfg: DeployConfig) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    fh._ensure_firebase_json(replace(deploy_cfg, firebase_api_prefix="api"), "dist")
+
+    config = json.loads((tmp_path / "firebase.json").read_text(encoding="utf-8"))
+    assert config["hosting"]["public"] == "dist"
+    assert config["hosting"]["rewrites"][0]["source"] == "/api/**"
+    assert config["hosting"]["rewrites"][-1] == {"source": "**", "destination": "/index.html"}
+
+
+def test_ensure_firebase_json_keeps_existing_file(monkeypatch, tmp_path, deploy_cfg: DeployConfig) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "firebase.json").write_text('{"hosting": {"public": "custom"}}', encoding="utf-8")
+
+    fh._ensure_firebase_json(replace(deploy_cfg, firebase_api_prefix="api"), "dist")
+
+    assert (tmp_path / "firebase.json").read_text(encoding="utf-8") == '{"hosting": {"public": "custom"}}'
@@ -1,72 +1,398 @@
+import ast
+import re
+from collections import deque
+from itertools import islice
+from dataclasses import replace
 from typing import List
 from pathlib import Path
 
+from deploy_kit import check_cache
 from deploy_kit.config import DeployConfig
 from deploy_kit import gcp_artifact_registry as ar
 from deploy_kit.subprocess_utils import RunResult
 
+import pytest
 
-def _cfg(build_mode: str = "local_docker") -> DeployConfig:
-    return DeployConfig(
-        gcp_project_id="test-project",
-        gcp_region="us-central1",
-        deploy_sa_email="sa@test-project.iam.gserviceaccount.com",
-        artifact_registry_repo="apps",
-        backend_service_name="backend",
-        backend_build_mode=build_mode,
+
+# docker build 다음에 docker push 가 오는 호출 순서 (한 줄에 명령 하나)
+_DOCKER_BUILD_PUSH_RE = re.compile(r"docker build [^\n]*\ndocker push [^\n]*")
+
+
+def _trace(calls) -> str:  # noqa: ANN001
+    """기록된 명령들을 줄 단위 문자열로 합친다."""
+    return "\n".join(" ".join(cmd) for cmd in calls)
+
+
+@pytest.fixture(autouse=True)
+def _no_adc(monkeypatch) -> None:
+    """테스트 환경에는 ADC 가 없으므로 Artifact Registry 클라이언트 생성을 즉시 실패시킨다."""
+    from google.auth.exceptions import DefaultCredentialsError
+
+    def _raise():
+        raise DefaultCredentialsError("no ADC in tests")
+
+    monkeypatch.setattr(ar, "_ar_client", _raise)
+
+
+@pytest.fixture(scope="session")
+def ar_source_names() -> frozenset[str]:
+    """gcp_artifact_registry.py 를 한 번만 파싱해 코드에 등장하는 이름/속성 식별자 집합을 만든다."""
+    tree = ast.parse(Path(ar.__file__).read_text(encoding="utf-8"))
+    return frozenset(
+        node.id if isinstance(node, ast.Name) else node.attr
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.Name, ast.Attribute))
     )
 
 
-def test_build_and_push_image_local_docker_calls_docker(monkeypatch) -> None:
-    calls: List[list[str]] = []
+def test_build_and_push_image_local_docker_calls_docker(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    calls: deque[tuple[str, ...]] = deque()
 
     def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
-        calls.append(list(cmd))
+        calls.append(tuple(cmd))
         return RunResult(returncode=0, stdout="", stderr="")
 
     monkeypatch.setattr(ar, "run_command", fake_run_command)
+    monkeypatch.setattr(ar, "_configured_registries", set())
 
-    cfg = _cfg("local_docker")
+    cfg = deploy_cfg
     image_url = ar.build_and_push_image(cfg, service="backend", image_name="backend")
 
     assert image_url.startswith("us-central1-docker.pkg.dev/test-project/apps/backend")
-    # docker build + docker push 두 번 호출되는지 확인
-    assert len(calls) == 2
-    assert calls[0][0] == "docker"
-    assert calls[1][0] == "docker"
+    # configure-docker + docker build + docker push 세 번 호출되는지 확인
+    assert len(calls) == 3
+    assert calls[0] == ("gcloud", "auth", "configure-docker", "us-central1-docker.pkg.dev", "--quiet")
+    assert _DOCKER_BUILD_PUSH_RE.fullmatch(_trace(islice(calls, 1, None)))
+    assert f"--cache-from={image_url}" in calls[1]
+
+    # 같은 레지스트리 호스트에 대해서는 configure-docker 를 다시 실행하지 않는다.
+    calls.clear()
+    ar.build_and_push_image(cfg, service="etl", image_name="backend")
+    assert _DOCKER_BUILD_PUSH_RE.fullmatch(_trace(calls))
 
 
-def test_build_and_push_image_cloud_build_adds_timeout_flag(monkeypatch) -> None:
-    calls: List[list[str]] = []
+def test_build_and_push_image_cloud_build_adds_timeout_flag(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    calls: deque[tuple[str, ...]] = deque()
 
     def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
-        calls.append(list(cmd))
+        calls.append(tuple(cmd))
         return RunResult(returncode=0, stdout="", stderr="")
 
     monkeypatch.setattr(ar, "run_command", fake_run_command)
 
-    cfg = _cfg("cloud_build")
-    cfg.cloud_build_timeout_seconds = 1234
-    cfg.backend_build_subprocess_timeout_seconds = 9999
-    cfg.cli_stream_subprocess_output = True
+    cfg = replace(
+        deploy_cfg,
+        backend_build_mode="cloud_build",
+        cloud_build_timeout_seconds=1234,
+        backend_build_subprocess_timeout_seconds=9999,
+        cli_stream_subprocess_output=True,
+    )
 
     _ = ar.build_and_push_image(cfg, service="backend", image_name="backend", context_dir=".")
 
     assert len(calls) == 1
-    assert calls[0][0:3] == ["gcloud", "builds", "submit"]
+    assert calls[0][0:3] == ("gcloud", "builds", "submit")
     assert any(a == "--timeout=1234s" for a in calls[0])
 
 
-def test_build_and_push_image_uses_service_packages_when_configured() -> None:
+def test_build_and_push_image_uses_service_packages_when_configured(ar_source_names: frozenset[str]) -> None:
     """
     서비스별 이미지 패키지 오버라이드가 build_and_push_image 구현에 반영되어 있는지 확인한다.
 
-    여기서는 로컬 소스 파일을 직접 읽어 backend_image_package / etl_image_package
-    참조가 존재하는지만 검증한다.
+    여기서는 소스를 AST 로 파싱해 backend_image_package / etl_image_package 가
+    (주석이나 문자열이 아닌) 코드 식별자로 참조되는지만 검증한다.
     """
-    src_path = Path(__file__).resolve().parents[1] / "deploy_kit" / "gcp_artifact_registry.py"
-    source = src_path.read_text(encoding="utf-8")
-    assert "backend_image_package" in source
-    assert "etl_image_package" in source
+    assert "backend_image_package" in ar_source_names
+    assert "etl_image_package" in ar_source_names
+
+
+def test_check_repository_reuses_result_until_ensure_invalidates(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    calls: deque[tuple[str, ...]] = deque()
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(tuple(cmd))
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(ar, "run_command", fake_run_command)
+    check_cache.clear()
+
+    cfg = replace(deploy_cfg, prefer_gcloud=True)
+    first = ar.check_repository(cfg)
+    assert ar.check_repository(cfg) == first
+    # 두 번째 점검은 캐시에서 반환되어 describe 가 한 번만 호출된다.
+    assert len(calls) == 1
+
+    check_cache.invalidate(("artifact_registry", cfg.gcp_project_id, cfg.gcp_region, cfg.artifact_registry_repo))
+    ar.check_repository(cfg)
+    assert len(calls) == 2
+    check_cache.clear()
+
+
+def test_ensure_repository_creates_without_describe_and_accepts_existing(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    from google.api_core.exceptions import AlreadyExists
+
+    created: List[dict] = []
+
+    class _Operation:
+        def result(self, timeout=None):  # noqa: ANN001, ARG002
+            return None
+
+    class _FakeClient:
+        def get_repository(self, name):  # noqa: ANN001
+            raise AssertionError("describe 는 호출되면 안 됩니다")
+
+        def create_repository(self, **kwargs):  # noqa: ANN003
+            created.append(kwargs)
+            if len(created) > 1:
+                raise AlreadyExists("exists")
+            return _Operation()
+
+    def fail_run_command(cmd, **kwargs):  # noqa: ANN001, ARG001
+        raise AssertionError("gcloud 가 호출되면 안 됩니다")
+
+    monkeypatch.setattr(ar, "_ar_client", lambda: _FakeClient())
+    monkeypatch.setattr(ar, "run_command", fail_run_command)
+    monkeypatch.setattr(ar, "_ensured_repositories", set())
+
+    ar.ensure_repository(deploy_cfg)
+    # 같은 리포는 다시 확인하지 않는다.
+    ar.ensure_repository(deploy_cfg)
+
+    assert len(created) == 1
+    assert created[0]["parent"] == "projects/test-project/locations/us-central1"
+    assert created[0]["repository_id"] == "apps"
+
+    # 다른 실행에서 이미 존재하는 리포는 AlreadyExists 를 정상으로 처리한다.
+    monkeypatch.setattr(ar, "_ensured_repositories", set())
+    ar.ensure_repository(deploy_cfg)
+    assert len(created) == 2
+
+
+def test_token_bucket_waits_once_burst_is_spent(monkeypatch) -> None:
+    now = [100.0]
+    slept: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(ar.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ar.time, "sleep", fake_sleep)
+
+    bucket = ar.TokenBucket(rate_per_sec=2.0)
+    bucket.acquire()
+    bucket.acquire()
+    assert slept == []
+
+    # burst(2개)를 다 쓰면 다음 토큰이 채워질 때까지(0.5초) 기다린다.
+    bucket.acquire()
+    assert slept == [0.5]
+
+
+def test_source_archive_hash_is_stable_and_honors_gcloudignore(tmp_path: Path) -> None:
+    import os
+    import tarfile
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "app.py").write_text("print('hi')\n", encoding="utf-8")
+    (src / "debug.log").write_text("noise\n", encoding="utf-8")
+    (src / ".gcloudignore").write_text("*.log\n", encoding="utf-8")
+
+    first = ar._write_source_archive(str(src), str(tmp_path / "a.tgz"))
+    # mtime 만 바뀐 경우 해시는 그대로여야 한다.
+    os.utime(src / "app.py", (0, 0))
+    second = ar._write_source_archive(str(src), str(tmp_path / "b.tgz"))
+    assert first == second
+
+    with tarfile.open(tmp_path / "a.tgz") as tar:
+        # gcloud 처럼 .gcloudignore 자신은 목록에 없으면 함께 업로드된다.
+        assert tar.getnames() == [".gcloudignore", "app.py"]
+
+    (src / "app.py").write_text("print('changed')\n", encoding="utf-8")
+    assert ar._write_source_archive(str(src), str(tmp_path / "c.tgz")) != first
+
+
+def test_source_archive_applies_gcloudignore_exceptions_and_includes(tmp_path: Path) -> None:
+    import tarfile
+
+    (tmp_path / "web").mkdir()
+    (tmp_path / "build").mkdir()
+    for rel in ("package.json", "tsconfig.json", "web/package.json", "build/out.js", "main.py"):
+        (tmp_path / rel).write_text("x\n", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text("build/\n", encoding="utf-8")
+    (tmp_path / ".gcloudignore").write_text(
+        ".gcloudignore\n*.json\n!package.json\n#!include:.gitignore\n", encoding="utf-8"
+    )
+
+    ar._write_source_archive(str(tmp_path), str(tmp_path.parent / "src.tgz"))
+
+    with tarfile.open(tmp_path.parent / "src.tgz") as tar:
+        assert tar.getnames() == [".gitignore", "main.py", "package.json", "web/package.json"]
+
+
+def test_source_archive_uses_gcloud_defaults_without_gcloudignore(tmp_path: Path) -> None:
+    import tarfile
+
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref\n", encoding="utf-8")
+    (tmp_path / ".gitignore").write_text("*.pyc\n", encoding="utf-8")
+    (tmp_path / "app.py").write_text("x\n", encoding="utf-8")
+    (tmp_path / "app.pyc").write_text("x\n", encoding="utf-8")
+
+    ar._write_source_archive(str(tmp_path), str(tmp_path.parent / "src.tgz"))
+
+    with tarfile.open(tmp_path.parent / "src.tgz") as tar:
+        assert tar.getnames() == ["app.py"]
+
+
+def test_stage_source_falls_back_to_context_dir_when_gcloudignore_is_unsupported(
+    monkeypatch, tmp_path: Path, deploy_cfg: DeployConfig
+) -> None:
+    from deploy_kit import gcp_gcs
+
+    (tmp_path / ".gcloudignore").write_text("#!include:missing-file\n", encoding="utf-8")
+
+    def fail_client(project_id):  # noqa: ANN001, ARG001
+        raise AssertionError("업로드하면 안 됩니다")
+
+    monkeypatch.setattr(gcp_gcs, "storage_client", fail_client)
+    cfg = replace(deploy_cfg, cloud_build_staging_bucket="staging")
+
+    assert ar._stage_source(cfg, str(tmp_path)) == str(tmp_path)
+
+
+def test_context_digest_follows_dockerignore_allowlist(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("v1\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("local\n", encoding="utf-8")
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    (tmp_path / ".dockerignore").write_text("*\n!src/\n!Dockerfile\n", encoding="utf-8")
+
+    names = [rel for rel, _ in ar._iter_docker_context_files(str(tmp_path))]
+    assert names == [".dockerignore", "Dockerfile", "src/main.py"]
+
+    first = ar._context_digest(str(tmp_path))
+    # 제외된 파일은 digest 에 영향을 주지 않고, 다시 포함된 파일은 영향을 준다.
+    (tmp_path / "notes.txt").write_text("changed\n", encoding="utf-8")
+    assert ar._context_digest(str(tmp_path)) == first
+    (tmp_path / "src" / "main.py").write_text("v2\n", encoding="utf-8")
+    assert ar._context_digest(str(tmp_path)) != first
+
+
+def test_context_digest_dockerignore_patterns_are_root_anchored(tmp_path: Path) -> None:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "config.py").write_text("root\n", encoding="utf-8")
+    (tmp_path / "app" / "config.py").write_text("nested\n", encoding="utf-8")
+    (tmp_path / "app" / "debug.log").write_text("x\n", encoding="utf-8")
+    (tmp_path / ".dockerignore").write_text("config.py\n**/*.log\n", encoding="utf-8")
+
+    names = [rel for rel, _ in ar._iter_docker_context_files(str(tmp_path))]
+    # Docker 처럼 config.py 는 루트의 것만 제외하고, app/config.py 는 컨텍스트(와 digest)에 남는다.
+    assert names == [".dockerignore", "app/config.py"]
+
+
+def test_build_and_push_image_builds_when_dockerignore_is_unparseable(monkeypatch, tmp_path: Path, deploy_cfg: DeployConfig) -> None:
+    (tmp_path / ".dockerignore").write_text("[\n", encoding="utf-8")
+    calls: deque[tuple[str, ...]] = deque()
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(tuple(cmd))
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    def fail_promote(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("digest 를 모르면 기존 이미지를 재사용하면 안 됩니다")
+
+    monkeypatch.setattr(ar, "run_command", fake_run_command)
+    monkeypatch.setattr(ar, "_configured_registries", {deploy_cfg.ar_hostname})
+    monkeypatch.setattr(ar, "_promote_digest_tag", fail_promote)
+
+    ar.build_and_push_image(deploy_cfg, service="backend", image_name="backend", context_dir=str(tmp_path))
+
+    assert _DOCKER_BUILD_PUSH_RE.fullmatch(_trace(calls))
+
+
+def test_build_and_push_image_skips_build_when_digest_tag_exists(monkeypatch, tmp_path: Path, deploy_cfg: DeployConfig) -> None:
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    updated: List[tuple[str, str]] = []
+
+    class _Tag:
+        version = "projects/p/locations/l/repositories/r/packages/backend/versions/sha256:abc"
+
+    class _FakeClient:
+        def get_tag(self, name):  # noqa: ANN001
+            assert "/packages/backend/tags/sha-" in name
+            return _Tag()
+
+        def update_tag(self, tag, update_mask):  # noqa: ANN001, ARG002
+            updated.append((tag.name.rsplit("/", 1)[-1], tag.version))
+
+    def fail_run_command(cmd, **kwargs):  # noqa: ANN001, ARG001
+        raise AssertionError("빌드/푸시가 실행되면 안 됩니다")
+
+    monkeypatch.setattr(ar, "_ar_client", lambda: _FakeClient())
+    monkeypatch.setattr(ar, "run_command", fail_run_command)
+
+    image_url = ar.build_and_push_image(deploy_cfg, service="backend", image_name="backend", context_dir=str(tmp_path))
+
+    assert image_url.endswith("/backend:latest")
+    assert updated == [("latest", _Tag.version)]
+
+
+def test_digest_tag_points_at_the_pushed_image_not_latest(monkeypatch, tmp_path: Path, deploy_cfg: DeployConfig) -> None:
+    from google.api_core.exceptions import NotFound
+
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    pushed = "sha256:" + "ab" * 32
+    tagged: List[tuple[str, str]] = []
+
+    class _FakeClient:
+        def get_tag(self, name):  # noqa: ANN001
+            # 같은 소스의 이미지는 아직 없고, :latest 는 다시 조회하면 안 된다.
+            assert "/tags/sha-" in name, name
+            raise NotFound("no digest tag")
+
+        def update_tag(self, tag, update_mask):  # noqa: ANN001, ARG002
+            tagged.append((tag.name.rsplit("/", 1)[-1], tag.version))
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        stdout = f"latest: digest: {pushed} size: 528\n" if cmd[:2] == ["docker", "push"] else ""
+        return RunResult(returncode=0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(ar, "_ar_client", lambda: _FakeClient())
+    monkeypatch.setattr(ar, "run_command", fake_run_command)
+    monkeypatch.setattr(ar, "_configured_registries", {deploy_cfg.ar_hostname})
+
+    ar.build_and_push_image(deploy_cfg, service="backend", image_name="backend", context_dir=str(tmp_path))
+
+    assert len(tagged) == 1
+    tag_id, version = tagged[0]
+    assert tag_id.startswith("sha-")
+    assert version.endswith(f"/packages/backend/versions/{pushed}")
+
+
+@pytest.mark.parametrize(
+    "create_error,expected_verbs",
+    [
+        ("ERROR: (gcloud.artifacts.repositories.create) ALREADY_EXISTS: the repository already exists", ["create"]),
+        ("ERROR: (gcloud.artifacts.repositories.create) PERMISSION_DENIED: Permission denied", ["create", "describe"]),
+    ],
+)
+def test_ensure_repository_gcloud_accepts_existing_or_read_only_repo(
+    monkeypatch, deploy_cfg: DeployConfig, create_error: str, expected_verbs: list[str]
+) -> None:
+    calls: deque[tuple[tuple[str, ...], bool]] = deque()
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001
+        calls.append((tuple(cmd), kwargs["stream_output"]))
+        if cmd[3] == "create":
+            raise RuntimeError(f"명령 실행 실패: {' '.join(cmd)} (exit=1)\nstderr:\n{create_error}")
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(ar, "run_command", fake_run_command)
 
+    ar._ensure_repository_gcloud(replace(deploy_cfg, cli_stream_subprocess_output=True))
 
+    assert [cmd[3] for cmd, _ in calls] == expected_verbs
+    # 예상된 실패(ALREADY_EXISTS 등)가 터미널에 ERROR 로 보이지 않도록 출력을 캡처한다.
+    assert not any(stream for _, stream in calls)
@@ -0,0 +1,34 @@
+import json
+import os
+from dataclasses import replace
+
+from deploy_kit import gcp_cloud_run
+from deploy_kit.config import DeployConfig
+from deploy_kit.subprocess_utils import RunResult
+
+
+def test_deploy_backend_service_passes_env_via_file(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    seen: dict = {}
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        flag = next(a for a in cmd if a.startswith("--env-vars-file="))
+        path = flag.split("=", 1)[1]
+        with open(path, encoding="utf-8") as f:
+            seen["env"] = json.load(f)
+        seen["path"] = path
+        seen["cmd"] = list(cmd)
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(gcp_cloud_run, "run_command", fake_run_command)
+
+    cfg = replace(
+        deploy_cfg,
+        backend_service_env={"GCP_PROJECT_ID": "test-project", "ALLOWED": "a,b=c"},
+    )
+    gcp_cloud_run.deploy_backend_service(cfg, "registry/backend:latest")
+
+    # 인프라 키는 제외되고, 쉼표/등호가 있는 값도 그대로 전달된다.
+    assert seen["env"] == {"ALLOWED": "a,b=c"}
+    assert not any(a.startswith("--set-env-vars") for a in seen["cmd"])
+    # 실행이 끝나면 임시 파일은 삭제된다.
+    assert not os.path.exists(seen["path"])
@@ -0,0 +1,36 @@
+from dataclasses import replace
+
+from deploy_kit import check_cache
+from deploy_kit import gcp_gcs
+from deploy_kit.config import DeployConfig
+
+
+class _Response:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.urls: list[str] = []
+
+    def request(self, method, url, **kwargs):  # noqa: ANN001, ANN003, ARG002
+        self.urls.append(url)
+        return _Response(self.status_code)
+
+
+def test_check_gcs_bucket_uses_shared_session(monkeypatch, deploy_cfg: DeployConfig) -> None:
+    session = _FakeSession(404)
+    monkeypatch.setattr(gcp_gcs, "_session", session)
+    check_cache.clear()
+
+    result = gcp_gcs.check_gcs_bucket(replace(deploy_cfg, enable_gcs=True, gcs_bucket_name="my-bucket"))
+
+    assert result == "GCS: 버킷 없음 (생성이 필요함) (my-bucket)"
+    assert session.urls == ["https://storage.googleapis.com/storage/v1/b/my-bucket"]
+    check_cache.clear()
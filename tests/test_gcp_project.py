@@ -0,0 +1,285 @@
+from dataclasses import replace
+from typing import List
+
+import pytest
+
+from deploy_kit.config import DeployConfig
+from deploy_kit import gcp_project, gcp_sql
+from deploy_kit.subprocess_utils import RunResult
+
+
+@pytest.fixture(autouse=True)
+def _no_adc(monkeypatch) -> None:
+    """테스트 환경에는 ADC 가 없다고 보고 gcloud 경로를 사용한다. (SDK 테스트는 클라이언트를 직접 넣는다)"""
+    monkeypatch.setattr(gcp_project, "_api_clients", {})
+    monkeypatch.setattr(gcp_project, "_api_client", lambda cfg, api, version: None)
+    monkeypatch.setattr(gcp_sql, "_api_client", lambda cfg, api, version: None)
+
+
+class _Request:
+    def __init__(self, log: list, name: str, result) -> None:  # noqa: ANN001
+        self.log = log
+        self.name = name
+        self.result = result
+
+    def execute(self):  # noqa: ANN201
+        self.log.append(self.name)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class _Collection:
+    """discovery 리소스 컬렉션 흉내: 메서드 이름 -> 결과."""
+
+    def __init__(self, log: list, results: dict) -> None:  # noqa: ANN001
+        self.log = log
+        self.results = results
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        if name == "list_next":
+            return lambda request, response: None
+        return lambda **kwargs: _Request(self.log, name, self.results[name])
+
+
+class _FakeDiscoveryClient:
+    def __init__(self, **collections: dict) -> None:
+        self.log: list[str] = []
+        self.collections = collections
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        results = self.collections[name]
+        return lambda: _Collection(self.log, results)
+
+
+def _http_error(status: int):  # noqa: ANN202
+    from googleapiclient.errors import HttpError
+
+    class _Resp(dict):
+        reason = "error"
+
+    resp = _Resp()
+    resp.status = status
+    return HttpError(resp, b"{}")
+
+
+@pytest.fixture
+def project_cfg(deploy_cfg: DeployConfig) -> DeployConfig:
+    """BigQuery API 까지 필요한 설정. (공용 deploy_cfg 기반)"""
+    return replace(deploy_cfg, enable_bigquery=True)
+
+
+def test_check_project_and_apis_lists_enabled_apis_once(monkeypatch, project_cfg: DeployConfig) -> None:
+    calls: List[list[str]] = []
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(list(cmd))
+        if cmd[1] == "services":
+            return RunResult(
+                returncode=0,
+                stdout="run.googleapis.com\nbigquery.googleapis.com\nsecretmanager.googleapis.com\n",
+                stderr="",
+            )
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(gcp_project, "run_command", fake_run_command)
+
+    results = gcp_project.check_project_and_apis(project_cfg)
+
+    # projects describe 1회 + services list 1회
+    assert len(calls) == 2
+    assert not any(a.startswith("--filter=") for a in calls[1])
+    assert "API: 활성화됨 (bigquery.googleapis.com)" in results
+    assert "API: 비활성화 (enable 필요) (artifactregistry.googleapis.com)" in results
+
+
+def test_ensure_project_and_apis_enables_only_missing_apis_once(monkeypatch, project_cfg: DeployConfig) -> None:
+    calls: List[list[str]] = []
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(list(cmd))
+        if cmd[2] == "list":
+            return RunResult(returncode=0, stdout="run.googleapis.com\nbigquery.googleapis.com\n", stderr="")
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(gcp_project, "run_command", fake_run_command)
+    monkeypatch.setattr(gcp_project, "_ensured_apis", {})
+
+    cfg = project_cfg
+    gcp_project.ensure_project_and_apis(cfg)
+    gcp_project.ensure_project_and_apis(cfg)
+
+    # services list 1회 + 빠진 API 만 enable 1회, 두 번째 호출은 건너뛴다.
+    assert [c[2] for c in calls] == ["list", "enable"]
+    enabled = [a for a in calls[1][3:] if not a.startswith("--")]
+    assert enabled == ["artifactregistry.googleapis.com", "secretmanager.googleapis.com"]
+
+    # 필요한 API 구성이 달라지면 다시 확인한다.
+    gcp_project.ensure_project_and_apis(replace(cfg, enable_gcs=True))
+    assert [c[2] for c in calls] == ["list", "enable", "list", "enable"]
+
+    # 이미 확인한 API 의 부분집합만 요청하면 조회 없이 건너뛴다.
+    gcp_project.ensure_project_and_apis(cfg, apis=["run.googleapis.com", "storage.googleapis.com"])
+    assert len(calls) == 4
+
+
+def test_ensure_project_and_apis_skips_enable_when_all_enabled(monkeypatch, project_cfg: DeployConfig) -> None:
+    calls: List[list[str]] = []
+    all_apis = "\n".join(
+        gcp_project.REQUIRED_APIS_BASE | gcp_project.REQUIRED_APIS_BQ
+    )
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(list(cmd))
+        return RunResult(returncode=0, stdout=all_apis, stderr="")
+
+    monkeypatch.setattr(gcp_project, "run_command", fake_run_command)
+    monkeypatch.setattr(gcp_project, "_ensured_apis", {})
+
+    gcp_project.ensure_project_and_apis(project_cfg)
+
+    assert [c[2] for c in calls] == ["list"]
+
+
+def test_enable_is_async_and_wait_only_matching_ops(monkeypatch, project_cfg: DeployConfig) -> None:
+    calls: List[list[str]] = []
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(list(cmd))
+        if cmd[2] == "list":
+            return RunResult(returncode=0, stdout="run.googleapis.com\n", stderr="")
+        if cmd[2] == "enable":
+            return RunResult(
+                returncode=0,
+                stdout="",
+                stderr=(
+                    "Asynchronous operation is in progress... Use the following command to wait for its completion:\n"
+                    " gcloud beta services operations wait operations/acat.p2-123-abc\n"
+                ),
+            )
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(gcp_project, "run_command", fake_run_command)
+    monkeypatch.setattr(gcp_project, "_ensured_apis", {})
+    monkeypatch.setattr(gcp_project, "_pending_api_ops", {})
+
+    cfg = project_cfg
+    gcp_project.ensure_project_and_apis(cfg)
+    assert "--async" in calls[1]
+
+    # 이번 enable 에 포함되지 않은 API 만 필요하면 기다리지 않는다.
+    gcp_project.wait_for_pending_api_ops(cfg, gcp_project.REQUIRED_APIS_GCS)
+    assert len(calls) == 2
+
+    gcp_project.wait_for_pending_api_ops(cfg, gcp_project.REQUIRED_APIS_BQ)
+    assert calls[2][:5] == ["gcloud", "services", "operations", "wait", "operations/acat.p2-123-abc"]
+
+    # 한 번 기다린 작업은 다시 기다리지 않는다.
+    gcp_project.wait_for_pending_api_ops(cfg)
+    assert len(calls) == 3
+
+
+def test_ensure_project_and_apis_uses_service_usage_client(monkeypatch, project_cfg: DeployConfig) -> None:
+    client = _FakeDiscoveryClient(
+        services={
+            "list": {"services": [{"config": {"name": "run.googleapis.com"}}]},
+            "batchEnable": {"name": "operations/acat.p2-1", "done": False},
+        },
+        operations={"get": {"name": "operations/acat.p2-1", "done": True}},
+    )
+
+    def fake_run_command(cmd, **kwargs):  # noqa: ANN001, ANN202, ARG001
+        raise AssertionError("SDK 경로에서는 gcloud 를 호출하지 않아야 합니다")
+
+    monkeypatch.setattr(gcp_project, "run_command", fake_run_command)
+    monkeypatch.setattr(gcp_project, "_api_client", lambda cfg, api, version: client)
+    monkeypatch.setattr(gcp_project, "_ensured_apis", {})
+    monkeypatch.setattr(gcp_project, "_pending_api_ops", {})
+
+    cfg = project_cfg
+    gcp_project.ensure_project_and_apis(cfg)
+    assert client.log == ["list", "batchEnable"]
+    assert list(gcp_project._pending_api_ops) == ["operations/acat.p2-1"]
+
+    gcp_project.wait_for_pending_api_ops(cfg)
+    assert client.log == ["list", "batchEnable", "get"]
+    assert gcp_project._pending_api_ops == {}
+
+
+def test_check_project_reports_missing_project_via_client(monkeypatch, project_cfg: DeployConfig) -> None:
+    client = _FakeDiscoveryClient(projects={"get": _http_error(404)})
+    monkeypatch.setattr(gcp_project, "_api_client", lambda cfg, api, version: client)
+
+    results = gcp_project.check_project_and_apis(project_cfg)
+
+    assert results == ["Project: 없음 (생성이 필요함) (test-project)"]
+
+
+def test_check_cloud_sql_uses_sqladmin_client(monkeypatch, project_cfg: DeployConfig) -> None:
+    client = _FakeDiscoveryClient(
+        instances={"get": {"name": "main"}},
+        databases={"get": _http_error(404)},
+    )
+    monkeypatch.setattr(gcp_sql, "_api_client", lambda cfg, api, version: client)
+    cfg = replace(project_cfg, enable_cloud_sql=True, cloud_sql_instance_name="main", cloud_sql_db_name="app")
+
+    results = gcp_sql.check_cloud_sql(cfg)
+
+    assert results == [
+        "Cloud SQL: 인스턴스 존재함 (main)",
+        "Cloud SQL: 데이터베이스 없음 (생성이 필요함) (app)",
+    ]
+
+
+def test_check_cloud_sql_gcloud_fallback_uses_run_command(monkeypatch, project_cfg: DeployConfig) -> None:
+    calls: List[list[str]] = []
+
+    def fake_run_command(cmd, **kwargs) -> RunResult:  # noqa: ANN001, ARG001
+        calls.append(list(cmd))
+        if cmd[2] == "databases":
+            raise RuntimeError("명령 실행 실패: gcloud sql databases describe (exit=1)")
+        return RunResult(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(gcp_sql, "run_command", fake_run_command)
+    cfg = replace(project_cfg, enable_cloud_sql=True, cloud_sql_instance_name="main", cloud_sql_db_name="app")
+
+    assert gcp_sql.check_cloud_sql(cfg) == [
+        "Cloud SQL: 인스턴스 존재함 (main)",
+        "Cloud SQL: 데이터베이스 없음 (생성이 필요함) (app)",
+    ]
+    assert [c[2] for c in calls] == ["instances", "databases"]
+
+    monkeypatch.setattr(
+        gcp_sql,
+        "run_command",
+        lambda cmd, **kwargs: (_ for _ in ()).throw(RuntimeError("필요한 명령을 찾을 수 없습니다: gcloud")),
+    )
+    assert gcp_sql.check_cloud_sql(cfg) == ["Cloud SQL: gcloud 명령을 찾을 수 없어 상태 확인 불가"]
+
+
+def test_describe_project_gcloud_matches_only_error_line(monkeypatch, project_cfg: DeployConfig) -> None:
+    def failing(message: str):  # noqa: ANN202
+        def _run(cmd, **kwargs):  # noqa: ANN001, ANN202, ARG001
+            raise RuntimeError(message)
+
+        return _run
+
+    monkeypatch.setattr(
+        gcp_project,
+        "run_command",
+        failing(
+            "명령 실행 실패: gcloud projects describe test-project (exit=1)\nstderr:\n"
+            "ERROR: (gcloud.projects.describe) NOT_FOUND: Project test-project not found"
+        ),
+    )
+    assert gcp_project._describe_project_gcloud(project_cfg) == "Project: 없음 (생성이 필요함) (test-project)"
+
+    monkeypatch.setattr(
+        gcp_project,
+        "run_command",
+        failing(
+            "명령 실행 실패 (exit=1)\nstderr:\nWARNING: credentials file not found, using metadata\n"
+            "ERROR: (gcloud.projects.describe) PERMISSION_DENIED: caller does not have permission"
+        ),
+    )
+    assert gcp_project._describe_project_gcloud(project_cfg) == "Project: 조회 실패 (gcloud projects describe)"
@@ -0,0 +1,91 @@
+import os
+from dataclasses import replace
+
+from deploy_kit import gcp_secrets
+from deploy_kit.config import DeployConfig
+
+
+def test_load_local_secrets_file_reuses_parse_until_file_changes(tmp_path) -> None:
+    path = tmp_path / ".env.secrets"
+    path.write_text("# comment\nDB_PASSWORD=one\n", encoding="utf-8")
+    gcp_secrets._parse_secrets_file.cache_clear()
+
+    first = gcp_secrets.load_local_secrets_file(str(tmp_path))
+    first["INJECTED"] = "x"
+    second = gcp_secrets.load_local_secrets_file(str(tmp_path))
+
+    assert second == {"DB_PASSWORD": "one"}
+    assert gcp_secrets._parse_secrets_file.cache_info().hits == 1
+
+    path.write_text("DB_PASSWORD=two\nAPI_KEY=k\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert gcp_secrets.load_local_secrets_file(str(tmp_path)) == {"DB_PASSWORD": "two", "API_KEY": "k"}
+
+
+def test_load_local_secrets_file_missing_returns_empty(tmp_path) -> None:
+    assert gcp_secrets.load_local_secrets_file(str(tmp_path)) == {}
+
+
+def test_load_local_secrets_file_parsing_rules(tmp_path) -> None:
+    (tmp_path / ".env.secrets").write_bytes(
+        b"# comment\r\n\r\n  SPACED_KEY  =  spaced value  \r\nTOKEN=a=b=c\r\nNO_EQUALS_LINE\r\n"
+        b"  # indented comment=1\r\nEMPTY=\r\nTOKEN_2=x\nTOKEN=last\n"
+    )
+    gcp_secrets._parse_secrets_file.cache_clear()
+
+    assert gcp_secrets.load_local_secrets_file(str(tmp_path)) == {
+        "SPACED_KEY": "spaced value",
+        "TOKEN": "last",
+        "EMPTY": "",
+        "TOKEN_2": "x",
+    }
+
+
+class _FakeSecretClient:
+    def __init__(self, existing: set) -> None:
+        self.existing = existing
+        self.created: list[str] = []
+        self.versions: list[str] = []
+        self.gets: list[str] = []
+
+    def get_secret(self, name: str) -> None:
+        from google.api_core.exceptions import NotFound
+
+        self.gets.append(name)
+        if name not in self.existing:
+            raise NotFound(name)
+
+    def create_secret(self, parent: str, secret_id: str, secret: dict) -> None:  # noqa: ARG002
+        self.created.append(f"{parent}/secrets/{secret_id}")
+
+    def add_secret_version(self, parent: str, payload: dict) -> None:  # noqa: ARG002
+        from google.api_core.exceptions import NotFound
+
+        if parent not in self.existing and parent not in self.created:
+            raise NotFound(parent)
+        self.versions.append(parent)
+
+
+def test_ensure_and_check_secrets_keep_order_with_shared_client(tmp_path, monkeypatch, deploy_cfg: DeployConfig) -> None:
+    (tmp_path / ".env.secrets").write_text("B_KEY=2\nA_KEY=1\nC_KEY=3\n", encoding="utf-8")
+    gcp_secrets._parse_secrets_file.cache_clear()
+    client = _FakeSecretClient(existing={"projects/p/secrets/A_KEY"})
+    monkeypatch.setattr(gcp_secrets.secretmanager, "SecretManagerServiceClient", lambda: client)
+    cfg = replace(deploy_cfg, gcp_project_id="p")
+
+    assert gcp_secrets.check_secrets(cfg, str(tmp_path)) == [
+        "Secrets: 존재함 (projects/p/secrets/A_KEY)",
+        "Secrets: 없음 (생성이 필요함) (projects/p/secrets/B_KEY)",
+        "Secrets: 없음 (생성이 필요함) (projects/p/secrets/C_KEY)",
+    ]
+
+    client.gets.clear()
+    updated = gcp_secrets.ensure_secrets(cfg, str(tmp_path))
+
+    assert updated == ["projects/p/secrets/B_KEY", "projects/p/secrets/A_KEY", "projects/p/secrets/C_KEY"]
+    assert sorted(client.created) == ["projects/p/secrets/B_KEY", "projects/p/secrets/C_KEY"]
+    assert sorted(client.versions) == sorted(updated)
+    # 업로드 경로에서는 get_secret 으로 미리 조회하지 않는다.
+    assert client.gets == []
@@ -6,27 +6,27 @@ from deploy_kit.config import DeployConfig
 from deploy_kit import orchestrator
 
 
-def _minimal_cfg() -> DeployConfig:
-    return DeployConfig(
-        gcp_project_id="test-project",
-        gcp_region="us-central1",
-        deploy_sa_email="sa@test-project.iam.gserviceaccount.com",
-        artifact_registry_repo="apps",
-        backend_service_name="backend",
-    )
+# apply_all 이 호출하는 외부 변경 함수들. 테스트는 필요한 것만 다시 덮어쓴다.
+_NOOP_DEPS = {
+    "gcp_auth": ("ensure_deploy_service_account", "ensure_iam_roles"),
+    "gcp_project": ("ensure_project_and_apis",),
+    "gcp_artifact_registry": ("ensure_repository",),
+    "gcp_cloud_run": ("deploy_backend_service",),
+}
 
 
-def test_apply_all_success_backend_only(monkeypatch: pytest.MonkeyPatch) -> None:
-    cfg = _minimal_cfg()
+@pytest.fixture(autouse=True)
+def stub_orchestrator_deps(monkeypatch: pytest.MonkeyPatch) -> None:
+    """gcloud / API 를 호출하지 않도록 orchestrator 의존 함수를 no-op 으로 바꿔 둔다."""
+    for module_name, func_names in _NOOP_DEPS.items():
+        module = getattr(orchestrator, module_name)
+        for func_name in func_names:
+            monkeypatch.setattr(module, func_name, lambda *args, **kwargs: None)
 
-    # backend_image_name 가 없으면 build/push 를 건너뛰게 된다.
-    cfg = replace(cfg, backend_image_name=None)
 
-    monkeypatch.setattr(orchestrator.gcp_auth, "ensure_deploy_service_account", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_auth, "ensure_iam_roles", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_project, "ensure_project_and_apis", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "ensure_repository", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_cloud_run, "deploy_backend_service", lambda cfg, image: None)  # type: ignore[arg-type]
+def test_apply_all_success_backend_only(deploy_cfg: DeployConfig) -> None:
+    # backend_image_name 가 없으면 build/push 를 건너뛰게 된다.
+    cfg = replace(deploy_cfg, backend_image_name=None)
 
     summary, has_failures = orchestrator.apply_all(cfg)
 
@@ -35,10 +35,10 @@ def test_apply_all_success_backend_only(monkeypatch: pytest.MonkeyPatch) -> None
     assert "- backend" in summary
 
 
-def test_apply_all_marks_failed_section(monkeypatch: pytest.MonkeyPatch) -> None:
-    cfg = _minimal_cfg()
+def test_apply_all_marks_failed_section(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    cfg = deploy_cfg
 
-    def failing_ensure_project(_cfg: DeployConfig) -> None:  # noqa: ARG001
+    def failing_ensure_project(_cfg: DeployConfig, **_kwargs: object) -> None:  # noqa: ARG001
         raise RuntimeError("boom")
 
     monkeypatch.setattr(
@@ -46,10 +46,6 @@ def test_apply_all_marks_failed_section(monkeypatch: pytest.MonkeyPatch) -> None
         "ensure_project_and_apis",
         failing_ensure_project,
     )
-    monkeypatch.setattr(orchestrator.gcp_auth, "ensure_deploy_service_account", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_auth, "ensure_iam_roles", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "ensure_repository", lambda cfg: None)  # type: ignore[arg-type]
-    monkeypatch.setattr(orchestrator.gcp_cloud_run, "deploy_backend_service", lambda cfg, image: None)  # type: ignore[arg-type]
 
     summary, has_failures = orchestrator.apply_all(cfg)
 
@@ -58,3 +54,208 @@ def test_apply_all_marks_failed_section(monkeypatch: pytest.MonkeyPatch) -> None
     assert "- backend" in summary
 
 
+def test_apply_all_builds_images_for_backend_and_etl(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    cfg = replace(
+        deploy_cfg,
+        backend_image_name="backend",
+        deploy_etl_job=True,
+        deploy_frontend=False,
+    )
+
+    built: list[str] = []
+    deployed: dict[str, str] = {}
+
+    def fake_build(cfg, service, image_name, context_dir="."):  # noqa: ANN001, ARG001
+        built.append(service)
+        return f"registry/{service}:latest"
+
+    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "build_and_push_image", fake_build)
+    monkeypatch.setattr(
+        orchestrator.gcp_cloud_run,
+        "deploy_backend_service",
+        lambda cfg, image: deployed.__setitem__("backend", image),  # type: ignore[arg-type]
+    )
+    monkeypatch.setattr(
+        orchestrator.gcp_cloud_run,
+        "deploy_etl_job",
+        lambda cfg, image: deployed.__setitem__("etl", image),  # type: ignore[arg-type]
+    )
+
+    _, has_failures = orchestrator.apply_all(cfg, only_sections=["backend", "etl"])
+
+    assert not has_failures
+    # 각 이미지는 한 번씩만 빌드되고, 섹션은 자기 이미지 URL 로 배포된다.
+    assert sorted(built) == ["backend", "etl"]
+    assert deployed == {"backend": "registry/backend:latest", "etl": "registry/etl:latest"}
+
+
+def test_check_probes_reuse_persisted_results_until_section_applied(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    from deploy_kit import check_cache
+
+    calls: list[str] = []
+
+    def probe(name: str, result):  # noqa: ANN001, ANN202
+        def _fn(*args, **kwargs):  # noqa: ANN002, ANN003, ARG001
+            calls.append(name)
+            return result
+
+        return _fn
+
+    monkeypatch.setattr(orchestrator.gcp_project, "check_project_and_apis", probe("project", ["Project: 존재함 (p)"]))
+    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "check_repository", probe("ar", "Artifact Registry: 리포지토리 존재함"))
+    monkeypatch.setattr(orchestrator.gcp_gcs, "check_gcs_bucket", probe("gcs", "GCS: 상태 확인 불가"))
+    monkeypatch.setattr(orchestrator.gcp_bq, "check_bigquery_resources", probe("bq", "BigQuery: 비활성화"))
+    monkeypatch.setattr(orchestrator.gcp_sql, "check_cloud_sql", probe("sql", ["Cloud SQL: 비활성화"]))
+    monkeypatch.setattr(orchestrator.gcp_secrets, "check_secrets", probe("secrets", ["Secrets: 비활성화"]))
+    cfg = replace(deploy_cfg, enable_bigquery=True)
+
+    orchestrator._run_check_probes(cfg, ".")
+    assert sorted(calls) == ["ar", "bq", "gcs", "project", "secrets", "sql"]
+
+    # 다른 프로세스에서 다시 실행한 것처럼 메모리 캐시를 비우고 디스크에서 읽게 한다.
+    monkeypatch.setattr(check_cache, "_cache", {})
+    monkeypatch.setattr(check_cache, "_loaded", False)
+    calls.clear()
+    probes = orchestrator._run_check_probes(cfg, ".")
+    # 일시적 실패(확인 불가)는 저장하지 않으므로 gcs 만 다시 점검한다.
+    assert calls == ["gcs"]
+    assert probes["project"].result() == ["Project: 존재함 (p)"]
+
+    monkeypatch.setattr(orchestrator.gcp_bq, "ensure_bigquery_resources", lambda cfg: None)
+    monkeypatch.setattr(orchestrator.gcp_project, "ensure_project_and_apis", lambda cfg, **kwargs: None)
+    orchestrator.apply_all(cfg, only_sections=["bq"])
+    calls.clear()
+    orchestrator._run_check_probes(cfg, ".")
+    assert sorted(calls) == ["bq", "gcs", "project"]
+
+
+def test_apply_all_runs_independent_sections_concurrently(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    import threading
+
+    cfg = replace(deploy_cfg, enable_bigquery=True, enable_gcs=True, gcs_bucket_name="b")
+    prereq_calls: list[set[str]] = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    monkeypatch.setattr(orchestrator.gcp_project, "ensure_project_and_apis", lambda cfg, apis: prereq_calls.append(apis))  # type: ignore[arg-type]
+    # bq 와 gcs 가 동시에 돌지 않으면 barrier 가 timeout 으로 깨진다.
+    monkeypatch.setattr(orchestrator.gcp_bq, "ensure_bigquery_resources", lambda cfg: barrier.wait())  # type: ignore[arg-type]
+    monkeypatch.setattr(orchestrator.gcp_gcs, "ensure_gcs_bucket", lambda cfg: barrier.wait())  # type: ignore[arg-type]
+
+    summary, has_failures = orchestrator.apply_all(cfg, only_sections=["bq", "gcs"])
+
+    assert not has_failures
+    # 선행 작업은 한 번, 실행할 섹션이 쓰는 API 만 모아서 요청한다.
+    assert prereq_calls == [{"bigquery.googleapis.com", "storage.googleapis.com"}]
+    assert "- bq\n- gcs" in summary
+
+
+def test_frontend_image_is_built_after_frontend_build_command(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    cfg = replace(
+        deploy_cfg,
+        deploy_backend=False,
+        deploy_frontend=True,
+        deploy_frontend_cloud_run=True,
+        frontend_source_dir="frontend",
+        frontend_image_name="frontend",
+        frontend_build_command="npm run build",
+    )
+    order: list[str] = []
+
+    def fake_build(cfg, **kwargs):  # noqa: ANN001, ANN003, ANN202, ARG001
+        order.append("image")
+        return "registry/frontend:latest"
+
+    monkeypatch.setattr(orchestrator, "run_command", lambda cmd, **kwargs: order.append("npm"))  # type: ignore[arg-type]
+    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "build_and_push_image", fake_build)
+    monkeypatch.setattr(orchestrator.gcp_cloud_run, "deploy_frontend_service", lambda cfg, image: order.append("deploy"))  # type: ignore[arg-type]
+
+    _, has_failures = orchestrator.apply_all(cfg, only_sections=["frontend", "frontend_cloud_run"])
+
+    assert not has_failures
+    # 이미지는 FRONTEND_BUILD_COMMAND 가 빌드 디렉터리를 다 쓴 뒤에 빌드한다.
+    assert order == ["npm", "image", "deploy"]
+
+
+def test_apply_all_prereq_failure_fails_dependent_sections_only(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    cfg = replace(deploy_cfg, enable_bigquery=True, enable_firebase=True, backend_image_name=None)
+    order: list[str] = []
+
+    def boom(cfg, **kwargs):  # noqa: ANN001, ANN003, ANN202, ARG001
+        raise RuntimeError("api enable failed")
+
+    monkeypatch.setattr(orchestrator.gcp_project, "ensure_project_and_apis", boom)
+    monkeypatch.setattr(orchestrator.gcp_artifact_registry, "ensure_repository", lambda cfg: order.append("ar"))  # type: ignore[arg-type]
+    monkeypatch.setattr(orchestrator.gcp_bq, "ensure_bigquery_resources", lambda cfg: order.append("bq"))  # type: ignore[arg-type]
+    monkeypatch.setattr(orchestrator.firebase_hosting, "deploy_frontend", lambda cfg: order.append("firebase"))  # type: ignore[arg-type]
+
+    summary, has_failures = orchestrator.apply_all(cfg, only_sections=["backend", "bq", "frontend", "firebase"])
+
+    assert has_failures
+    # project 가 실패하면 ar 도, 그에 의존하는 섹션(firebase 포함)도 실행하지 않는다.
+    assert order == []
+    failed_part = summary.split("## Failed sections")[1]
+    assert "- backend" in failed_part and "- bq" in failed_part and "- firebase" in failed_part
+    # 선행 작업이 없는 frontend 는 그대로 실행된다.
+    assert "- frontend" not in failed_part.splitlines()
+
+
+def test_apply_all_firebase_only_enables_firebase_apis(monkeypatch: pytest.MonkeyPatch, deploy_cfg: DeployConfig) -> None:
+    cfg = replace(deploy_cfg, enable_firebase=True, deploy_frontend=True)
+    prereq_calls: list[set[str]] = []
+    deployed: list[str] = []
+
+    monkeypatch.setattr(orchestrator.gcp_project, "ensure_project_and_apis", lambda cfg, apis: prereq_calls.append(apis))  # type: ignore[arg-type]
+    monkeypatch.setattr(orchestrator.firebase_hosting, "deploy_frontend", lambda cfg: deployed.append("firebase"))  # type: ignore[arg-type]
+
+    _, has_failures = orchestrator.apply_all(cfg, only_sections=["firebase"])
+
+    assert not has_failures
+    assert deployed == ["firebase"]
+    assert prereq_calls == [
+        {"firebase.googleapis.com", "firebaserules.googleapis.com", "firebasehosting.googleapis.com"}
+    ]
+
+
+def test_classify_check_keeps_per_section_rules() -> None:
+    classify = orchestrator._classify_check
+    # 같은 "없음" 이라도 Cloud SQL 은 크리티컬, Secret 은 경고
+    assert classify("sql", "Cloud SQL: 인스턴스 없음 (생성이 필요함) (main)") == "critical"
+    assert classify("secrets", "Secrets: 없음 (생성이 필요함) (projects/p/secrets/A)") == "warning"
+    assert classify("project", "API: 비활성화 (enable 필요) (run.googleapis.com)") == "warning"
+    assert classify("project", "Project: 조회 실패 (projects.get)") == "critical"
+    assert classify("artifact_registry", "Artifact Registry: 리포지토리 없음 (생성 예정) (apps)") == "warning"
+    assert classify("gcs", "GCS: 버킷 존재함 (b)") is None
+
+
+def test_plan_json_matches_text_plan(deploy_cfg: DeployConfig) -> None:
+    import json
+
+    cfg = replace(deploy_cfg, enable_bigquery=True)
+
+    data = json.loads(orchestrator.plan_json(cfg))
+    text = orchestrator.plan_all(cfg)
+
+    assert data["project"] == "test-project"
+    assert {"name": "bq", "enabled": True} in data["sections"]
+    assert data["config"]["enable_bigquery"] is True
+    # 텍스트 plan 은 같은 데이터를 렌더링한 것이다.
+    for section in data["sections"]:
+        assert f"- {section['name']}: {'ENABLED' if section['enabled'] else 'SKIPPED'}" in text
+    assert "- frontend_source_dir: (not set)" in text
+
+
+def test_plan_does_not_import_google_cloud_clients() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from deploy_kit import orchestrator\n"
+        "from deploy_kit.config import DeployConfig\n"
+        "orchestrator.plan_all(DeployConfig(gcp_project_id='p', gcp_region='r', deploy_sa_email='s',"
+        " artifact_registry_repo='a', backend_service_name='b'))\n"
+        "print(sorted(m for m in sys.modules if m.startswith('google.cloud')))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.strip() == "[]"
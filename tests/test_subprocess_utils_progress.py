@@ -1,28 +1,119 @@
 from __future__ import annotations
 
 import io
+import itertools
+import os
+import re
 import sys
+import threading
 import time
+from collections import deque
 
 import pytest
 
+from deploy_kit import subprocess_utils
 from deploy_kit.subprocess_utils import run_command
 
 
-class _FakeTty(io.StringIO):
+class _FakeTty:
+    """쓰기를 조각 단위로 모아 두는 TTY 흉내. 전체 문자열은 getvalue() 때만 만든다."""
+
     def __init__(self) -> None:
-        super().__init__()
-        self._lock = None
+        self._chunks: deque[str] = deque()
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        return len(text)
 
-    def isatty(self) -> bool:  # type: ignore[override]
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
         return True
 
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
 
-_BRAILLE_FRAMES = {"⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"}
+_BRAILLE_RE = re.compile("[" + "".join(subprocess_utils._BRAILLE_FRAMES) + "]")
 
 
 def _contains_braille_spinner(text: str) -> bool:
-    return any(ch in text for ch in _BRAILLE_FRAMES)
+    return _BRAILLE_RE.search(text) is not None
+
+
+class _FakePopen:
+    """
+    실제 프로세스 대신 쓰는 Popen. stdout 은 진짜 파이프라서 run_command 의 select 루프가 그대로 돈다.
+    finish() 가 호출되면 출력을 쓰고 파이프를 닫은 뒤 종료 코드 0 으로 끝난다.
+    """
+
+    last: _FakePopen | None = None
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003, ARG002
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "rb", buffering=0)
+        self._done = threading.Event()
+        _FakePopen.last = self
+
+    def finish(self, output: bytes = b"") -> None:
+        os.write(self._write_fd, output)
+        os.close(self._write_fd)
+        self._done.set()
+
+    def poll(self) -> int | None:
+        return 0 if self._done.is_set() else None
+
+    def wait(self, timeout: float | None = None) -> int:
+        self._done.wait(timeout)
+        return 0
+
+    def kill(self) -> None:
+        self.finish()
+
+
+def _wait_for_spinner(stream: _FakeTty, timeout: float = 5.0) -> None:
+    """stream 에 스피너 프레임이 그려질 때까지 기다린다. (고정 sleep 대신 쓰는 동기화)"""
+    deadline = time.monotonic() + timeout
+    while not _contains_braille_spinner(stream.getvalue()) and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class _VirtualClock:
+    """호출될 때마다 step 초씩 앞으로 가는 가상 시계. (렌더 스레드와 같이 불려도 안전하다)"""
+
+    def __init__(self, start: float = 1000.0, step: float = 1.0) -> None:
+        self._ticks = itertools.count()
+        self._start = start
+        self._step = step
+
+    def __call__(self) -> float:
+        return self._start + next(self._ticks) * self._step
+
+
+def test_idle_indicator_renders_only_after_idle_threshold() -> None:
+    """
+    진행표시의 idle 판정은 _tick 에 넘기는 시각으로만 결정된다. (가상 시계로 실제 대기 없이 확인)
+    """
+    stream = _FakeTty()
+    clock = {"last": 100.0}
+    indicator = subprocess_utils._IdleProgressIndicator(
+        message="virtual", stream=stream, interval=0.1, idle_seconds=2.0
+    )
+    indicator._start_time = 100.0
+    indicator._last_activity_getter = lambda: clock["last"]
+
+    # idle 기준(2초) 전에는 그리지 않고, 남은 시간만큼만 쉬라고 알려 준다.
+    assert indicator._tick(101.5) == pytest.approx(0.1)
+    assert stream.getvalue() == ""
+
+    assert indicator._tick(102.0) == pytest.approx(0.1)
+    assert "virtual  2.0s" in stream.getvalue()
+
+    # 출력이 다시 생기면 진행표시를 지운다.
+    clock["last"] = 102.05
+    indicator._tick(102.1)
+    assert stream.getvalue().endswith("\r")
 
 
 def test_stream_output_shows_progress_when_idle(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -33,15 +124,17 @@ def test_stream_output_shows_progress_when_idle(monkeypatch: pytest.MonkeyPatch)
     fake_out = io.StringIO()
     monkeypatch.setattr(sys, "stderr", fake_err)
     monkeypatch.setattr(sys, "stdout", fake_out)
+    monkeypatch.setattr(subprocess_utils.subprocess, "Popen", _FakePopen)
 
-    cmd = [
-        sys.executable,
-        "-c",
-        "import time; time.sleep(0.2); print('done')",
-    ]
+    # 진행표시가 그려질 때까지 조용히 있다가 끝난다.
+    def _finish_after_spinner() -> None:
+        _wait_for_spinner(fake_err)
+        _FakePopen.last.finish(b"done\n")
 
+    finisher = threading.Thread(target=_finish_after_spinner, daemon=True)
+    finisher.start()
     result = run_command(
-        cmd,
+        [sys.executable, "fake"],
         stream_output=True,
         timeout=5,
         spinner_message="Test stream progress",
@@ -50,8 +143,10 @@ def test_stream_output_shows_progress_when_idle(monkeypatch: pytest.MonkeyPatch)
         progress_idle_seconds=0.05,
         progress_interval=0.02,
     )
+    finisher.join(timeout=5)
 
     assert result.returncode == 0
+    assert result.stdout == "done\n"
     stderr_text = fake_err.getvalue()
     assert _contains_braille_spinner(stderr_text), stderr_text
 
@@ -63,14 +158,14 @@ def test_capture_mode_shows_progress_when_idle(monkeypatch: pytest.MonkeyPatch)
     fake_err = _FakeTty()
     monkeypatch.setattr(sys, "stderr", fake_err)
 
-    cmd = [
-        sys.executable,
-        "-c",
-        "import time; time.sleep(0.2)",
-    ]
+    def fake_run(argv, **kwargs):  # noqa: ANN001, ANN003, ANN202
+        _wait_for_spinner(fake_err)
+        return subprocess_utils.subprocess.CompletedProcess(argv, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(subprocess_utils.subprocess, "run", fake_run)
 
     result = run_command(
-        cmd,
+        [sys.executable, "fake"],
         stream_output=False,
         timeout=5,
         spinner_message="Test capture progress",
@@ -84,3 +179,179 @@ def test_capture_mode_shows_progress_when_idle(monkeypatch: pytest.MonkeyPatch)
     stderr_text = fake_err.getvalue()
     assert _contains_braille_spinner(stderr_text), stderr_text
 
+
+def test_stream_output_progress_uses_injected_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    idle 판정은 run_command 에 넘긴 clock 을 따른다.
+    실제로는 기다리지 않아도 가상 시계로 idle 기준(1000초)을 넘기면 진행표시가 그려진다.
+    """
+    fake_err = _FakeTty()
+    monkeypatch.setattr(sys, "stderr", fake_err)
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    monkeypatch.setattr(subprocess_utils.subprocess, "Popen", _FakePopen)
+
+    def _finish_after_spinner() -> None:
+        _wait_for_spinner(fake_err)
+        _FakePopen.last.finish()
+
+    finisher = threading.Thread(target=_finish_after_spinner, daemon=True)
+    finisher.start()
+    run_command(
+        [sys.executable, "fake"],
+        stream_output=True,
+        timeout=None,
+        spinner_message="virtual clock",
+        show_progress=True,
+        progress_style="braille",
+        progress_idle_seconds=1000.0,
+        progress_interval=0.02,
+        clock=_VirtualClock(step=500.0),
+    )
+    finisher.join(timeout=5)
+
+    assert _contains_braille_spinner(fake_err.getvalue()), fake_err.getvalue()
+
+
+def test_stream_output_timeout_uses_injected_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 끝나지 않는 프로세스라도 가상 시계가 timeout 을 넘기면 바로 kill 하고 실패한다.
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    monkeypatch.setattr(subprocess_utils.subprocess, "Popen", _FakePopen)
+
+    with pytest.raises(RuntimeError, match="60초 안에 끝나지 않았습니다"):
+        run_command(
+            [sys.executable, "fake"],
+            stream_output=True,
+            timeout=60,
+            show_progress=False,
+            clock=_VirtualClock(step=60.0),
+        )
+    assert _FakePopen.last.poll() == 0
+
+
+def test_progress_scope_hides_while_streamed_output_flows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    progress_scope 의 진행표시는 스코프 안 명령의 스트리밍 출력 사이에 끼어들지 않고,
+    출력이 멈춘 뒤에만 그려져야 한다.
+    """
+    terminal = _FakeTty()
+    monkeypatch.setattr(sys, "stderr", terminal)
+    monkeypatch.setattr(sys, "stdout", terminal)
+    monkeypatch.setattr(subprocess_utils.subprocess, "Popen", _FakePopen)
+    monkeypatch.setattr(
+        subprocess_utils, "_progress_config", subprocess_utils._ProgressConfig(idle_seconds=0.2, interval=0.01)
+    )
+
+    def _stream_then_go_quiet() -> None:
+        while _FakePopen.last is None:
+            time.sleep(0.001)
+        proc = _FakePopen.last
+        # idle 기준(0.2초)보다 오래 출력을 흘린다.
+        for i in range(40):
+            os.write(proc._write_fd, f"push layer {i}\n".encode())
+            time.sleep(0.01)
+        _wait_for_spinner(terminal)
+        proc.finish()
+
+    _FakePopen.last = None
+    writer = threading.Thread(target=_stream_then_go_quiet, daemon=True)
+    writer.start()
+    with subprocess_utils.progress_scope("섹션 배포 중"):
+        run_command([sys.executable, "fake"], stream_output=True, timeout=5)
+    writer.join(timeout=5)
+
+    text = terminal.getvalue()
+    last_line = text.index("push layer 39\n")
+    assert not _contains_braille_spinner(text[:last_line]), text
+    assert _contains_braille_spinner(text[last_line:]), text
+
+
+def test_progress_indicators_share_one_render_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    진행표시는 명령마다 스레드를 띄우지 않고 하나의 렌더 스레드를 재사용한다.
+    """
+    import threading
+
+    from deploy_kit import subprocess_utils
+
+    monkeypatch.setattr(sys, "stderr", _FakeTty())
+    cmd = [sys.executable, "-c", "import time; time.sleep(0.1)"]
+    kwargs = dict(timeout=5, show_progress=True, progress_idle_seconds=0.02, progress_interval=0.02)
+
+    run_command(cmd, **kwargs)
+    first = subprocess_utils._UI._thread
+    run_command(cmd, stream_output=True, **kwargs)
+
+    assert first is not None and subprocess_utils._UI._thread is first
+    assert sum(t.name == "deploy-kit-progress" for t in threading.enumerate()) == 1
+    assert _contains_braille_spinner(sys.stderr.getvalue())
+
+
+def test_stream_output_keeps_only_bounded_tail(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    stream_output=True 에서는 출력 전체를 메모리에 쌓지 않고 마지막 일부만 결과로 보관한다.
+    """
+    fake_out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", fake_out)
+
+    cmd = [sys.executable, "-c", "for i in range(500): print(i)"]
+
+    result = run_command(cmd, stream_output=True, timeout=5, show_progress=False)
+
+    lines = result.stdout.splitlines()
+    assert len(lines) == 200
+    assert lines[-1] == "499"
+    # 터미널(stdout)로는 전체 출력이 그대로 흘러가야 한다.
+    assert len(fake_out.getvalue().splitlines()) == 500
+
+
+def test_stream_output_writes_raw_bytes_and_keeps_partial_last_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    stdout 에 바이트 버퍼가 있으면 받은 바이트를 그대로 쓰고, 개행 없이 끝난 마지막 줄도 결과에 남긴다.
+    """
+    raw = io.BytesIO()
+    fake_out = io.TextIOWrapper(raw, encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", fake_out)
+
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys, time\nsys.stdout.buffer.write('배포\\n진행'.encode()); sys.stdout.flush()\n"
+        "time.sleep(0.1); sys.stdout.buffer.write(b' 50%')",
+    ]
+
+    result = run_command(cmd, stream_output=True, timeout=5, show_progress=False)
+
+    assert result.stdout == "배포\n진행 50%"
+    assert raw.getvalue() == "배포\n진행 50%".encode()
+
+
+def test_missing_command_fails_before_spawning(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    PATH 에 없는 명령은 프로세스를 띄우지 않고 바로 RuntimeError 로 실패해야 한다.
+    """
+    import subprocess
+
+    def fail_run(*args, **kwargs):  # noqa: ANN002, ANN003, ARG001
+        raise AssertionError("subprocess.run 이 호출되면 안 됩니다")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    with pytest.raises(RuntimeError, match="찾을 수 없습니다"):
+        run_command(["deploy-kit-no-such-command"], show_progress=False)
+
+
+def test_failure_message_keeps_only_last_stderr_lines() -> None:
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys\nfor i in range(500): print(f'line {i}', file=sys.stderr)\nsys.exit(3)",
+    ]
+
+    with pytest.raises(RuntimeError) as excinfo:
+        run_command(cmd, stream_output=False, show_progress=False)
+
+    message = str(excinfo.value)
+    assert "(exit=3)" in message
+    assert "line 499" in message
+    assert "line 459\n" not in message
+    assert message.count("\nline ") == 40